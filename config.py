@@ -37,7 +37,9 @@ class PricingConfig:
                 "num_simulations": 10000,  # Nombre de simulations
                 "num_steps": 252,          # Nombre de pas de temps
                 "seed": None,              # Graine aléatoire (None = pas de seed fixe)
-                "antithetic": False        # Utiliser les variates antithétiques
+                "antithetic": False,       # Utiliser les variates antithétiques
+                "sampler": "pseudo",       # "pseudo" ou "sobol" (quasi-Monte Carlo)
+                "path_store": None         # Répertoire de trajectoires stockées (None = pas de stockage)
             },
             "barrier_params": {
                 "barrier": 120.0,          # Niveau de barrière
@@ -203,6 +205,14 @@ class PricingConfig:
             # Validation des paramètres de simulation
             assert simulation["num_simulations"] > 0, "Nombre de simulations doit être positif"
             assert simulation["num_steps"] > 0, "Nombre de pas doit être positif"
+            if simulation.get("antithetic", False):
+                assert simulation["num_simulations"] % 2 == 0, \
+                    "Nombre de simulations doit être pair avec les variates antithétiques"
+            assert simulation.get("sampler", "pseudo") in ["pseudo", "sobol"], \
+                "L'échantillonneur doit être 'pseudo' ou 'sobol'"
+            if simulation.get("path_store"):
+                assert simulation.get("seed") is not None, \
+                    "Une graine est nécessaire pour réutiliser des trajectoires stockées"
             
             return True
             
@@ -14,7 +14,8 @@ from pricing.payoffs import (
     asian_payoff, asian_geometric_payoff, asian_strike_payoff,
     barrier_knock_out, barrier_knock_in, double_barrier_knock_out
 )
-from pricing.black_scholes import black_scholes_price
+from pricing.black_scholes import black_scholes_price, black_scholes_greeks
+from pricing.greeks import pathwise_greeks, likelihood_ratio_greeks
 from config import PricingConfig
 
 
@@ -130,7 +131,7 @@ def example_3_barrier_options():
 
 
 def example_4_sensitivity_analysis():
-    """Exemple 4: Analyse de sensibilité (Greeks approximatifs)."""
+    """Exemple 4: Analyse de sensibilité (Greeks Monte Carlo en une simulation)."""
     print("\n" + "=" * 60)
     print("EXEMPLE 4: Analyse de Sensibilité")
     print("=" * 60)
@@ -140,37 +141,31 @@ def example_4_sensitivity_analysis():
     num_sims = 100000
     num_steps = 252
     
-    # Calculs des Greeks approximatifs
-    h = 0.01  # Petite variation
+    # Prix et Greeks par dérivées trajectorielles, sur les mêmes trajectoires
+    greeks_mc = pathwise_greeks(S, K, T, r, sigma, "vanilla", "call", num_sims, num_steps)
+    price_base = greeks_mc["price"].price
+    delta_mc = greeks_mc["delta"].price
+    vega_mc = greeks_mc["vega"].price
+    rho_mc = greeks_mc["rho"].price
     
-    # Delta (sensibilité au prix du sous-jacent)
-    price_up = simple_monte_carlo_pricing(S + h, K, T, r, sigma, vanilla_call, num_sims, num_steps)
-    price_down = simple_monte_carlo_pricing(S - h, K, T, r, sigma, vanilla_call, num_sims, num_steps)
-    delta_mc = (price_up - price_down) / (2 * h)
-    
-    # Gamma (convexité)
-    price_base = simple_monte_carlo_pricing(S, K, T, r, sigma, vanilla_call, num_sims, num_steps)
-    gamma_mc = (price_up - 2 * price_base + price_down) / (h ** 2)
-    
-    # Vega (sensibilité à la volatilité)
-    price_vol_up = simple_monte_carlo_pricing(S, K, T, r, sigma + h, vanilla_call, num_sims, num_steps)
-    price_vol_down = simple_monte_carlo_pricing(S, K, T, r, sigma - h, vanilla_call, num_sims, num_steps)
-    vega_mc = (price_vol_up - price_vol_down) / (2 * h)
-    
-    # Comparaison avec Black-Scholes
-    from scipy.stats import norm
-    d1 = (np.log(S/K) + (r + sigma**2/2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    
-    delta_bs = norm.cdf(d1)
-    gamma_bs = norm.pdf(d1) / (S * sigma * np.sqrt(T))
-    vega_bs = S * norm.pdf(d1) * np.sqrt(T)
+    # Comparaison avec les Greeks Black-Scholes analytiques
+    greeks_bs = black_scholes_greeks(S, K, T, r, sigma, "call")
+    delta_bs = float(greeks_bs["delta"])
+    vega_bs = float(greeks_bs["vega"])
+    rho_bs = float(greeks_bs["rho"])
     
     print(f"Prix de base: {price_base:.4f}")
     print("\nGreeks (Monte Carlo vs Black-Scholes):")
     print(f"Delta: {delta_mc:.4f} vs {delta_bs:.4f} (erreur: {abs(delta_mc-delta_bs)/delta_bs*100:.1f}%)")
-    print(f"Gamma: {gamma_mc:.4f} vs {gamma_bs:.4f} (erreur: {abs(gamma_mc-gamma_bs)/gamma_bs*100:.1f}%)")
     print(f"Vega:  {vega_mc:.4f} vs {vega_bs:.4f} (erreur: {abs(vega_mc-vega_bs)/vega_bs*100:.1f}%)")
+    print(f"Rho:   {rho_mc:.4f} vs {rho_bs:.4f} (erreur: {abs(rho_mc-rho_bs)/rho_bs*100:.1f}%)")
+    
+    # Barrière (payoff discontinu) : Greeks par rapport de vraisemblance
+    greeks_ko = likelihood_ratio_greeks(S, K, T, r, sigma, barrier_knock_out, vanilla_call, 120,
+                                        num_sims, 50)
+    print("\nGreeks Up-and-Out Call (barrière 120, rapport de vraisemblance):")
+    for name in ["price", "delta", "vega", "rho"]:
+        print(f"{name.capitalize():<6} {greeks_ko[name].price:>8.4f} ± {greeks_ko[name].std_error:.4f}")
 
 
 def example_5_configuration_management():
@@ -204,7 +199,10 @@ def example_5_configuration_management():
         market_params['sigma'],
         vanilla_call,
         sim_params['num_simulations'],
-        sim_params['num_steps']
+        sim_params['num_steps'],
+        seed=sim_params['seed'],
+        antithetic=sim_params['antithetic'],
+        sampler=sim_params['sampler']
     )
     
     print(f"\nPrix calculé avec la configuration: {price:.4f}")
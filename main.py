@@ -1,8 +1,7 @@
 import numpy as np
-from pricing import monte_carlo_simulation, monte_carlo_pricing
-from pricing.payoffs import vanilla_call, vanilla_put, barrier_knock_out, barrier_knock_in, asian_payoff
+from pricing import monte_carlo_simulation, price_portfolio, PathStore
 import matplotlib.pyplot as plt
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 def get_default_config() -> Dict[str, Any]:
@@ -18,7 +17,10 @@ def get_default_config() -> Dict[str, Any]:
         "simulation_params": {
             "num_simulations": 10000,
             "num_steps": 252,
-            "seed": 42  # Pour la reproductibilité
+            "seed": 42,  # Pour la reproductibilité
+            "antithetic": False,  # Variates antithétiques
+            "sampler": "pseudo",  # "pseudo" ou "sobol" (quasi-Monte Carlo)
+            "path_store": None  # Répertoire de trajectoires réutilisées entre exécutions (optionnel)
         },
         "barrier_params": {
             "barrier": 120,
@@ -63,6 +65,31 @@ def plot_trajectories(ST: np.ndarray, barrier: float, num_paths_to_plot: int = 1
     plt.show()
 
 
+def build_book(market: Dict[str, Any], barrier_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Portefeuille des produits évalués par `run_pricing`.
+
+    Args:
+        market: Paramètres de marché (K et T des trades)
+        barrier_config: Niveau et type de barrière
+
+    Returns:
+        Liste de spécifications de trades (voir `pricing.portfolio.trades_array`)
+    """
+    common = {"underlying": "sous-jacent", "K": market['K'], "T": market['T']}
+    barrier = {"payoff_type": "barrier", "barrier": barrier_config['barrier'],
+               "barrier_type": barrier_config['barrier_type']}
+    return [
+        {**common, "trade_id": "CALL européen", "payoff_type": "vanilla", "option_type": "call"},
+        {**common, "trade_id": "PUT européen", "payoff_type": "vanilla", "option_type": "put"},
+        {**common, **barrier, "trade_id": "CALL Knock-Out", "option_type": "call", "knock": "out"},
+        {**common, **barrier, "trade_id": "CALL Knock-In", "option_type": "call", "knock": "in"},
+        {**common, **barrier, "trade_id": "PUT Knock-Out", "option_type": "put", "knock": "out"},
+        {**common, **barrier, "trade_id": "PUT Knock-In", "option_type": "put", "knock": "in"},
+        {**common, "trade_id": "Option asiatique", "payoff_type": "asian", "option_type": "call"},
+    ]
+
+
 def run_pricing(config: Dict[str, Any] = None) -> Dict[str, float]:
     """
     Exécution des différents scénarios de pricing.
@@ -89,68 +116,35 @@ def run_pricing(config: Dict[str, Any] = None) -> Dict[str, float]:
     print("=" * 40)
 
     try:
-        # 🎲 Génération des trajectoires
+        # 📊 Visualisation d'un échantillon de trajectoires (mêmes flux que le pricing)
         ST = monte_carlo_simulation(
             S=market['S'], 
             T=market['T'], 
             r=market['r'], 
             sigma=market['sigma'],
-            num_simulations=simulation['num_simulations'], 
+            num_simulations=min(100, simulation['num_simulations']), 
             num_steps=simulation['num_steps'],
-            seed=simulation['seed']
+            seed=simulation['seed'],
+            antithetic=simulation.get('antithetic', False),
+            sampler=simulation.get('sampler', 'pseudo')
         )
-
-        # 📊 Visualisation des trajectoires
         plot_trajectories(ST, barrier_config['barrier'])
 
-        # 💰 Pricing des différentes options
-        results = {}
-        
-        # Options vanilles
-        results["CALL européen"] = monte_carlo_pricing(
-            ST, market['K'], market['r'], market['T'], 
-            payoff_sousjacent=vanilla_call
-        )
-        
-        results["PUT européen"] = monte_carlo_pricing(
-            ST, market['K'], market['r'], market['T'], 
-            payoff_sousjacent=vanilla_put
-        )
-        
-        # Options à barrière
-        results["CALL Knock-Out"] = monte_carlo_pricing(
-            ST, market['K'], market['r'], market['T'], 
-            payoff_function=barrier_knock_out,
-            payoff_sousjacent=vanilla_call,
-            barrier=barrier_config['barrier']
-        )
-        
-        results["CALL Knock-In"] = monte_carlo_pricing(
-            ST, market['K'], market['r'], market['T'], 
-            payoff_function=barrier_knock_in,
-            payoff_sousjacent=vanilla_call,
-            barrier=barrier_config['barrier']
-        )
-        
-        results["PUT Knock-Out"] = monte_carlo_pricing(
-            ST, market['K'], market['r'], market['T'], 
-            payoff_function=barrier_knock_out,
-            payoff_sousjacent=vanilla_put,
-            barrier=barrier_config['barrier']
-        )
-        
-        results["PUT Knock-In"] = monte_carlo_pricing(
-            ST, market['K'], market['r'], market['T'], 
-            payoff_function=barrier_knock_in,
-            payoff_sousjacent=vanilla_put,
-            barrier=barrier_config['barrier']
-        )
-        
-        # Option asiatique
-        results["Option asiatique"] = monte_carlo_pricing(
-            ST, market['K'], market['r'], market['T'], 
-            payoff_sousjacent=asian_payoff
+        # 💰 Pricing du portefeuille : les trades de même sous-jacent et de même
+        # maturité partagent une seule simulation (trajectoires relues sur
+        # disque si un répertoire de stockage est configuré)
+        path_store = simulation.get('path_store')
+        book = price_portfolio(
+            build_book(market, barrier_config),
+            {"sous-jacent": {"S": market['S'], "r": market['r'], "sigma": market['sigma']}},
+            num_simulations=simulation['num_simulations'],
+            num_steps=simulation['num_steps'],
+            seed=simulation['seed'],
+            antithetic=simulation.get('antithetic', False),
+            sampler=simulation.get('sampler', 'pseudo'),
+            path_store=PathStore(path_store) if path_store else None
         )
+        results = {str(trade_id): float(price) for trade_id, price in zip(book["trade_id"], book["price"])}
 
         # 📊 Affichage des résultats
         print("\n=== Résultats du Pricing Monte Carlo ===")
@@ -1,12 +1,72 @@
 # pricing/__init__.py
-from .monte_carlo import monte_carlo_simulation, monte_carlo_pricing, simple_monte_carlo_pricing
-from .black_scholes import black_scholes_price
+from .monte_carlo import (
+    monte_carlo_simulation,
+    monte_carlo_pricing,
+    simple_monte_carlo_pricing,
+    monte_carlo_path_blocks,
+    chunked_monte_carlo_pricing,
+    monte_carlo_running_statistics,
+    monte_carlo_path_range,
+    qmc_monte_carlo_pricing,
+    adaptive_monte_carlo_pricing,
+)
+from .black_scholes import black_scholes_price, black_scholes_price_vectorized, black_scholes_greeks, implied_volatility
+from .statistics import RunningStats, MonteCarloResult, AdaptiveMonteCarloResult
+from .paths import PathSet
+from .parallel import parallel_monte_carlo_pricing
+from .control_variates import (
+    geometric_asian_price,
+    control_variate_estimate,
+    asian_control_variate_pricing,
+    barrier_control_variate_pricing,
+)
+from .greeks import pathwise_greeks, likelihood_ratio_greeks
+from .schedule import ObservationSchedule, with_schedule
+from .workspace import SimulationWorkspace
+from .fused import fused_monte_carlo_pricing
+from .store import PathStore
+from .cache import PathCache
+from .fft import carr_madan_call_grid, fft_option_prices
+from .multi_asset import correlation_factor, multi_asset_path_blocks, multi_asset_monte_carlo_pricing
+from .portfolio import price_portfolio
 
 __all__ = [
     "monte_carlo_simulation",
     "monte_carlo_pricing", 
     "simple_monte_carlo_pricing",
-    "black_scholes_price"
+    "monte_carlo_path_blocks",
+    "chunked_monte_carlo_pricing",
+    "monte_carlo_running_statistics",
+    "monte_carlo_path_range",
+    "qmc_monte_carlo_pricing",
+    "adaptive_monte_carlo_pricing",
+    "black_scholes_price",
+    "black_scholes_price_vectorized",
+    "black_scholes_greeks",
+    "implied_volatility",
+    "RunningStats",
+    "MonteCarloResult",
+    "AdaptiveMonteCarloResult",
+    "PathSet",
+    "parallel_monte_carlo_pricing",
+    "geometric_asian_price",
+    "control_variate_estimate",
+    "asian_control_variate_pricing",
+    "barrier_control_variate_pricing",
+    "pathwise_greeks",
+    "likelihood_ratio_greeks",
+    "ObservationSchedule",
+    "with_schedule",
+    "SimulationWorkspace",
+    "fused_monte_carlo_pricing",
+    "PathStore",
+    "PathCache",
+    "carr_madan_call_grid",
+    "fft_option_prices",
+    "correlation_factor",
+    "multi_asset_path_blocks",
+    "multi_asset_monte_carlo_pricing",
+    "price_portfolio"
 ]
 
 
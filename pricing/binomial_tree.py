@@ -1,9 +1,105 @@
 import math
 
-def binomial_tree_price(S: float, K: float, T: float, r: float, sigma: float, N: int, option_type: str = "call") -> float:
+import numpy as np
+
+from .black_scholes import black_scholes_price_vectorized
+
+
+# Les valeurs d'option sous ce seuil sont mises à zéro périodiquement pendant la
+# remontée : elles n'ont aucun effet sur le prix mais finiraient en nombres
+# dénormalisés, dont l'arithmétique est des dizaines de fois plus lente.
+_FLUSH_THRESHOLD = 1e-250
+_FLUSH_INTERVAL = 32
+
+
+def _tree_rollback(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    N: int,
+    option_type: str,
+    american: bool,
+    smoothing: bool
+) -> float:
+    """
+    Remontée vectorisée de l'arbre (mémoire en O(N)).
+
+    Si `smoothing` est vrai, la dernière étape est remplacée par le prix
+    Black-Scholes sur une période (méthode BBS de Broadie-Detemple).
+    """
+    dt = T / N  # Durée d'une étape
+    u = math.exp(sigma * math.sqrt(dt))  # Facteur de hausse
+    d = 1 / u  # Facteur de baisse
+    p = (math.exp(r * dt) - d) / (u - d)  # Probabilité de hausse
+    discount = math.exp(-r * dt)
+    sign = 1.0 if option_type == "call" else -1.0
+
+    # Couche terminale en forme fermée : S * u^j * d^(N - j)
+    j = np.arange(N + 1)
+    stock_prices = S * u ** j * d ** (N - j)
+    buffer = np.empty(N + 1)
+
+    def exercise(values: np.ndarray, prices: np.ndarray) -> None:
+        """Applique le maximum avec la valeur d'exercice immédiat."""
+        out = buffer[:values.size]
+        np.subtract(prices, K, out=out)
+        out *= sign
+        np.maximum(values, out, out=values)
+
+    if smoothing:
+        # Couche N-1 évaluée en Black-Scholes sur une période
+        top = N - 1
+        stock_prices[:top + 1] *= u
+        option_values = black_scholes_price_vectorized(stock_prices[:top + 1], K, dt, r, sigma, option_type)
+        option_values = np.concatenate([option_values, [0.0]])
+        if american:
+            exercise(option_values[:top + 1], stock_prices[:top + 1])
+    else:
+        # Calcul des valeurs finales des options
+        top = N
+        option_values = np.maximum(sign * (stock_prices - K), 0.0)
+
+    # Remontée dans l'arbre : une tranche vectorisée par étape, sans allocation
+    up_values = np.empty(N)
+    for i in range(top - 1, -1, -1):
+        np.multiply(option_values[1:i + 2], discount * p, out=up_values[:i + 1])
+        option_values[:i + 1] *= discount * (1 - p)
+        option_values[:i + 1] += up_values[:i + 1]
+        if american:
+            # Prix des noeuds de l'étape i : S * u^(2j - i)
+            stock_prices[:i + 1] *= u
+            exercise(option_values[:i + 1], stock_prices[:i + 1])
+        if i % _FLUSH_INTERVAL == 0:
+            option_values[:i + 1][option_values[:i + 1] < _FLUSH_THRESHOLD] = 0.0
+
+    return float(option_values[0])
+
+
+def binomial_tree_price(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    N: int,
+    option_type: str = "call",
+    exercise: str = "european",
+    accelerate: bool = False
+) -> float:
     """
     Calcule le prix d'une option avec le modèle binomial.
 
+    La couche terminale est construite en forme fermée et la remontée dans
+    l'arbre se fait par tranches vectorisées : la mémoire est en O(N).
+
+    Avec `accelerate=True`, la dernière étape est lissée par Black-Scholes (BBS)
+    et une extrapolation de Richardson d'ordre 1/N est faite entre N et
+    M ~ N/2 de même parité que N (BBSR) : (N * P(N) - M * P(M)) / (N - M),
+    soit 2 * P(N) - P(N/2) quand N/2 a la parité de N. L'oscillation pair/impair disparaît et la précision
+    d'un arbre standard est atteinte avec beaucoup moins d'étapes.
+
     Paramètres :
     - S : Prix du sous-jacent
     - K : Prix d'exercice
@@ -12,29 +108,41 @@ def binomial_tree_price(S: float, K: float, T: float, r: float, sigma: float, N:
     - sigma : Volatilité du sous-jacent
     - N : Nombre d'étapes de l'arbre binomial
     - option_type : "call" pour option d'achat, "put" pour option de vente
+    - exercise : "european" ou "american" (exercice anticipé à chaque noeud)
+    - accelerate : Lissage Black-Scholes et extrapolation de Richardson (N >= 2)
 
     Retourne :
     - Prix de l'option (float)
-    """
-    dt = T / N  # Durée d'une étape
-    u = math.exp(sigma * math.sqrt(dt))  # Facteur de hausse
-    d = 1 / u  # Facteur de baisse
-    p = (math.exp(r * dt) - d) / (u - d)  # Probabilité de hausse
 
-    # Construction de l'arbre des prix
-    stock_prices = [[0] * (i + 1) for i in range(N + 1)]
-    stock_prices[0][0] = S
-
-    for i in range(1, N + 1):
-        for j in range(i + 1):
-            stock_prices[i][j] = S * (u ** j) * (d ** (i - j))
-
-    # Calcul des valeurs finales des options
-    option_values = [max(0, (stock_prices[N][j] - K) if option_type == "call" else (K - stock_prices[N][j])) for j in range(N + 1)]
+    Lève :
+    - ValueError : Si les paramètres sont invalides
+    """
+    if S <= 0:
+        raise ValueError("Le prix du sous-jacent S doit être positif")
+    if K <= 0:
+        raise ValueError("Le prix d'exercice K doit être positif")
+    if T <= 0:
+        raise ValueError("La durée T doit être positive")
+    if sigma <= 0:
+        raise ValueError("La volatilité sigma doit être positive")
+    if N <= 0:
+        raise ValueError("Le nombre d'étapes N doit être positif")
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    if exercise not in ["european", "american"]:
+        raise ValueError("exercise doit être 'european' ou 'american'")
 
-    # Remontée dans l'arbre pour obtenir le prix initial
-    for i in range(N - 1, -1, -1):
-        for j in range(i + 1):
-            option_values[j] = math.exp(-r * dt) * (p * option_values[j + 1] + (1 - p) * option_values[j])
+    american = exercise == "american"
+    if not accelerate:
+        return _tree_rollback(S, K, T, r, sigma, N, option_type, american, smoothing=False)
 
-    return option_values[0]
+    if N < 2:
+        raise ValueError("L'extrapolation de Richardson nécessite N >= 2")
+    price_N = _tree_rollback(S, K, T, r, sigma, N, option_type, american, smoothing=True)
+    # Erreur BBS en c / N, où c dépend de la parité de N (position du strike
+    # par rapport aux noeuds) : M a la parité de N pour que c s'élimine
+    M = N // 2
+    if (N - M) % 2 == 1 and M + 1 < N:
+        M += 1
+    price_M = _tree_rollback(S, K, T, r, sigma, M, option_type, american, smoothing=True)
+    return (N * price_N - M * price_M) / (N - M)
@@ -1,7 +1,12 @@
 # black_scholes.py - Implémentation du modèle Black-Scholes pour le pricing des options
 
 import math
+from typing import Dict, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
 import scipy.stats as si
+from scipy.special import ndtr
 
 
 def black_scholes_price(
@@ -50,3 +55,291 @@ def black_scholes_price(
         price = K * math.exp(-r * T) * si.norm.cdf(-d2) - S * si.norm.cdf(-d1)
 
     return price
+
+
+def _validate_arrays(S, K, T, sigma) -> None:
+    """Validation vectorisée des paramètres Black-Scholes."""
+    if np.any(S <= 0):
+        raise ValueError("Le prix du sous-jacent S doit être positif")
+    if np.any(K <= 0):
+        raise ValueError("Le prix d'exercice K doit être positif")
+    if np.any(T <= 0):
+        raise ValueError("La durée T doit être positive")
+    if np.any(sigma <= 0):
+        raise ValueError("La volatilité sigma doit être positive")
+
+
+def _option_sign(option_type: Union[str, npt.ArrayLike]) -> Union[float, npt.NDArray[np.float64]]:
+    """
+    Convertit le type d'option en signe : +1 pour un call, -1 pour un put.
+
+    Accepte "call"/"put", un array de ces chaînes ou un array booléen (True = call).
+    """
+    if isinstance(option_type, str):
+        if option_type not in ["call", "put"]:
+            raise ValueError("option_type doit être 'call' ou 'put'")
+        return 1.0 if option_type == "call" else -1.0
+
+    flags = np.asarray(option_type)
+    if flags.dtype == bool:
+        return np.where(flags, 1.0, -1.0)
+    if not np.all(np.isin(flags, ["call", "put"])):
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    return np.where(flags == "call", 1.0, -1.0)
+
+
+def _d1_d2(S, K, T, r, sigma, *extra_shapes):
+    """
+    Calcule d1, d2 et sigma * sqrt(T) sur des arrays.
+
+    d1 et d2 sont toujours des arrays de la forme diffusée des entrées (et des
+    formes supplémentaires fournies), ce qui permet de les réutiliser comme
+    buffers pour des calculs en place.
+    """
+    shape = np.broadcast_shapes(S.shape, K.shape, T.shape, r.shape, sigma.shape, *extra_shapes)
+    vol_sqrt_T = sigma * np.sqrt(T)
+    d1 = np.divide(S, K, out=np.empty(shape))
+    np.log(d1, out=d1)
+    d1 += (r + 0.5 * sigma ** 2) * T
+    d1 /= vol_sqrt_T
+    d2 = np.subtract(d1, vol_sqrt_T, out=np.empty(shape))
+    return d1, d2, vol_sqrt_T
+
+
+def black_scholes_price_vectorized(
+    S: npt.ArrayLike,
+    K: npt.ArrayLike,
+    T: npt.ArrayLike,
+    r: npt.ArrayLike,
+    sigma: npt.ArrayLike,
+    option_type: Union[str, npt.ArrayLike] = "call",
+    out: Optional[npt.NDArray[np.float64]] = None
+) -> npt.NDArray[np.float64]:
+    """
+    Calcule les prix Black-Scholes sur des arrays (broadcasting NumPy).
+
+    Args:
+        S: Prix du sous-jacent (doivent être > 0)
+        K: Prix d'exercice (doivent être > 0)
+        T: Durées jusqu'à l'échéance en années (doivent être > 0)
+        r: Taux sans risque
+        sigma: Volatilités (doivent être > 0)
+        option_type: "call", "put", array de ces chaînes ou array booléen (True = call)
+        out: Buffer de sortie optionnel, de la forme diffusée des entrées
+
+    Returns:
+        Array des prix d'options
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    S = np.asarray(S, dtype=np.float64)
+    K = np.asarray(K, dtype=np.float64)
+    T = np.asarray(T, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+    sigma = np.asarray(sigma, dtype=np.float64)
+    _validate_arrays(S, K, T, sigma)
+    sign = _option_sign(option_type)
+
+    d1, d2, _ = _d1_d2(S, K, T, r, sigma, np.shape(sign))
+
+    # prix = signe * (S N(signe d1) - K e^{-rT} N(signe d2)), calculé en place
+    is_call = np.isscalar(sign) and sign > 0
+    if not is_call:
+        d1 *= sign
+        d2 *= sign
+    ndtr(d1, out=d1)
+    ndtr(d2, out=d2)
+    d1 *= S
+    d2 *= K * np.exp(-r * T)
+    price = np.subtract(d1, d2, out=out)
+    if not is_call:
+        price *= sign
+    return price
+
+
+def black_scholes_greeks(
+    S: npt.ArrayLike,
+    K: npt.ArrayLike,
+    T: npt.ArrayLike,
+    r: npt.ArrayLike,
+    sigma: npt.ArrayLike,
+    option_type: Union[str, npt.ArrayLike] = "call"
+) -> Dict[str, npt.NDArray[np.float64]]:
+    """
+    Calcule le prix et les Greeks Black-Scholes en une seule passe vectorisée.
+
+    d1, d2, la densité et les fonctions de répartition normales sont calculées
+    une seule fois et partagées entre toutes les sensibilités.
+
+    Args:
+        S: Prix du sous-jacent (doivent être > 0)
+        K: Prix d'exercice (doivent être > 0)
+        T: Durées jusqu'à l'échéance en années (doivent être > 0)
+        r: Taux sans risque
+        sigma: Volatilités (doivent être > 0)
+        option_type: "call", "put", array de ces chaînes ou array booléen (True = call)
+
+    Returns:
+        Dictionnaire d'arrays :
+        - price : prix de l'option
+        - delta, gamma : sensibilités au sous-jacent (ordres 1 et 2)
+        - vega : sensibilité à la volatilité (pour une variation de 1.0, pas de 1%)
+        - theta : dérivée par rapport au temps calendaire (par an)
+        - rho : sensibilité au taux (pour une variation de 1.0)
+        - vanna : d(delta)/d(sigma)
+        - volga : d(vega)/d(sigma)
+        - charm : d(delta)/dt (par an)
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    S = np.asarray(S, dtype=np.float64)
+    K = np.asarray(K, dtype=np.float64)
+    T = np.asarray(T, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+    sigma = np.asarray(sigma, dtype=np.float64)
+    _validate_arrays(S, K, T, sigma)
+    sign = _option_sign(option_type)
+
+    d1, d2, vol_sqrt_T = _d1_d2(S, K, T, r, sigma, np.shape(sign))
+
+    # Quantités partagées
+    pdf_d1 = np.exp(-0.5 * d1 ** 2) / math.sqrt(2 * math.pi)
+    cdf_d1 = ndtr(sign * d1)
+    cdf_d2 = ndtr(sign * d2)
+    discounted_K = K * np.exp(-r * T)
+    sqrt_T = np.sqrt(T)
+
+    vega = S * pdf_d1 * sqrt_T
+    return {
+        "price": sign * (S * cdf_d1 - discounted_K * cdf_d2),
+        "delta": sign * cdf_d1,
+        "gamma": pdf_d1 / (S * vol_sqrt_T),
+        "vega": vega,
+        "theta": -S * pdf_d1 * sigma / (2 * sqrt_T) - sign * r * discounted_K * cdf_d2,
+        "rho": sign * T * discounted_K * cdf_d2,
+        "vanna": -pdf_d1 * d2 / sigma,
+        "volga": vega * d1 * d2 / sigma,
+        "charm": -pdf_d1 * (2 * r * T - d2 * vol_sqrt_T) / (2 * T * vol_sqrt_T),
+    }
+
+
+# Bornes de la volatilité totale sigma * sqrt(T) recherchée par `implied_volatility`
+_MIN_TOTAL_VOL = 1e-8
+_MAX_TOTAL_VOL = 20.0
+
+
+def _otm_price_and_vega(S, X, w, sign):
+    """
+    Prix et dérivées (par rapport à w = sigma * sqrt(T)) de l'option hors de la monnaie.
+
+    X est le strike actualisé ; retourne (prix, vega, d1 * d2 / w).
+    """
+    d1 = np.log(S / X) / w + 0.5 * w
+    d2 = d1 - w
+    price = sign * (S * ndtr(sign * d1) - X * ndtr(sign * d2))
+    vega = S * np.exp(-0.5 * d1 ** 2) / math.sqrt(2 * math.pi)
+    return price, vega, d1 * d2 / w
+
+
+def implied_volatility(
+    price: npt.ArrayLike,
+    S: npt.ArrayLike,
+    K: npt.ArrayLike,
+    T: npt.ArrayLike,
+    r: npt.ArrayLike,
+    option_type: Union[str, npt.ArrayLike] = "call",
+    tol: float = 1e-10,
+    max_iterations: int = 50
+) -> npt.NDArray[np.float64]:
+    """
+    Volatilités implicites Black-Scholes d'une chaîne d'options (array en entrée et en sortie).
+
+    Chaque cotation est ramenée par parité call-put à l'option hors de la
+    monnaie, dont la valeur temps se lit sans perte de précision. Le point
+    de départ est l'approximation rationnelle de Corrado-Miller ; les
+    itérations de Halley (Newton avec correction de courbure) portent sur la
+    volatilité totale sigma * sqrt(T). Chaque élément garde un intervalle
+    d'encadrement : un pas qui en sort, ou une vega trop faible, est remplacé
+    par une bissection. Les éléments convergés sortent du calcul ; les autres
+    continuent seuls.
+
+    Les cotations hors des bornes d'arbitrage (prix inférieur ou égal à la
+    valeur intrinsèque, supérieur au sous-jacent ou au strike actualisé) et
+    celles qui n'ont pas convergé valent NaN : aucune exception n'est levée
+    pour une cotation isolée.
+
+    Args:
+        price: Prix de marché des options
+        S: Prix du sous-jacent (doivent être > 0)
+        K: Prix d'exercice (doivent être > 0)
+        T: Durées jusqu'à l'échéance en années (doivent être > 0)
+        r: Taux sans risque
+        option_type: "call", "put", array de ces chaînes ou array booléen (True = call)
+        tol: Tolérance relative sur la volatilité
+        max_iterations: Nombre maximal d'itérations
+
+    Returns:
+        Array des volatilités implicites (NaN si non convergée)
+
+    Raises:
+        ValueError: Si S, K, T ou option_type sont invalides
+    """
+    price = np.asarray(price, dtype=np.float64)
+    S = np.asarray(S, dtype=np.float64)
+    K = np.asarray(K, dtype=np.float64)
+    T = np.asarray(T, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+    _validate_arrays(S, K, T, 1.0)
+    sign_in = _option_sign(option_type)
+
+    shape = np.broadcast_shapes(price.shape, S.shape, K.shape, T.shape, r.shape, np.shape(sign_in))
+    price, S, K, T, r, sign_in = (np.broadcast_to(a, shape).ravel() for a in (price, S, K, T, r, sign_in))
+    X = K * np.exp(-r * T)
+
+    # Option hors de la monnaie : call si S <= K e^{-rT}, put sinon (parité C - P = S - X)
+    sign = np.where(S <= X, 1.0, -1.0)
+    otm = np.where(sign == sign_in, price, price - sign_in * (S - X))
+    upper = np.where(sign > 0, S, X)
+    valid = (otm > 0) & (otm < upper)
+
+    # Point de départ de Corrado-Miller, calculé sur le prix du call
+    call = otm + (sign < 0) * (S - X)
+    half_moneyness = 0.5 * (S - X)
+    discriminant = np.maximum((call - half_moneyness) ** 2 - (S - X) ** 2 / math.pi, 0.0)
+    w = math.sqrt(2 * math.pi) / (S + X) * (call - half_moneyness + np.sqrt(discriminant))
+    w = np.clip(np.nan_to_num(w, nan=1.0), 0.01, _MAX_TOTAL_VOL)
+
+    total_vol = np.full(price.size, np.nan)
+    active = np.flatnonzero(valid)
+    lower = np.full(active.size, _MIN_TOTAL_VOL)
+    higher = np.full(active.size, _MAX_TOTAL_VOL)
+    w = w[active]
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        model, vega, curvature = _otm_price_and_vega(S[active], X[active], w, sign[active])
+        error = model - otm[active]
+
+        # Le prix croît avec la volatilité : l'erreur resserre l'encadrement
+        np.copyto(higher, w, where=error > 0)
+        np.copyto(lower, w, where=error <= 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = error / vega
+            halley_denominator = 1.0 - 0.5 * newton * curvature
+            step = np.where(halley_denominator > 0.5, newton / halley_denominator, newton)
+            candidate = w - step
+        converged = (np.abs(step) <= tol * w) | (error == 0)
+        bisect = ~converged & (~np.isfinite(candidate) | (candidate <= lower) | (candidate >= higher))
+        candidate[bisect] = 0.5 * (lower[bisect] + higher[bisect])
+        total_vol[active[converged]] = candidate[converged]
+
+        keep = ~converged
+        active, w, lower, higher = active[keep], candidate[keep], lower[keep], higher[keep]
+
+    # Volatilité totale à la borne de recherche : pas de solution dans l'intervalle
+    total_vol[(total_vol <= _MIN_TOTAL_VOL * (1 + tol)) | (total_vol >= _MAX_TOTAL_VOL * (1 - tol))] = np.nan
+    return (total_vol / np.sqrt(T)).reshape(shape)
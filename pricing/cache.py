@@ -0,0 +1,163 @@
+"""
+Cache en mémoire des trajectoires à spot unitaire, partagé entre niveaux de spot.
+
+Sous GBM, S_t = S * exp(log-trajectoire) : la log-trajectoire ne dépend que
+de (T, r, sigma, grille, graine). Le cache conserve la trajectoire à spot
+unitaire exp(log-trajectoire) ; une échelle de spots coûte alors une
+simulation puis une multiplication par spot. Les entrées sont évincées
+dans l'ordre LRU dès que leur taille totale dépasse le budget.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .monte_carlo import _validate_dates, _validate_dtype, monte_carlo_simulation
+
+
+class PathCache:
+    """
+    Cache LRU des trajectoires à spot unitaire, borné en octets.
+
+    Attributes:
+        max_bytes: Budget mémoire total des entrées
+        hits: Nombre de requêtes servies par le cache
+        misses: Nombre de requêtes ayant nécessité une simulation
+        evictions: Nombre d'entrées évincées pour respecter le budget
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 ** 2):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_bytes: Budget mémoire total (octets)
+
+        Raises:
+            ValueError: Si le budget n'est pas positif
+        """
+        if max_bytes <= 0:
+            raise ValueError("Le budget mémoire doit être positif")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, npt.NDArray]" = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les entrées (octets)."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(
+        T: float,
+        r: float,
+        sigma: float,
+        num_simulations: int,
+        num_steps: int,
+        seed: int,
+        antithetic: bool,
+        sampler: str,
+        dates: Optional[npt.NDArray[np.float64]],
+        dtype: np.dtype
+    ) -> Tuple:
+        """Clé des paramètres dont dépend la trajectoire à spot unitaire."""
+        return (
+            float(T), float(r), float(sigma), int(num_simulations), int(num_steps), int(seed), bool(antithetic),
+            sampler, None if dates is None else tuple(dates.tolist()), dtype.str
+        )
+
+    def unit_paths(
+        self,
+        T: float,
+        r: float,
+        sigma: float,
+        num_simulations: int,
+        num_steps: int,
+        seed: int,
+        antithetic: bool = False,
+        sampler: str = "pseudo",
+        dates: Optional[npt.ArrayLike] = None,
+        dtype: npt.DTypeLike = np.float64
+    ) -> npt.NDArray[np.float64]:
+        """
+        Trajectoires à spot unitaire, simulées au premier appel puis servies par le cache.
+
+        Args:
+            Mêmes arguments que `monte_carlo_simulation`, sans le spot
+
+        Returns:
+            Trajectoires (num_simulations, num_steps ou len(dates)) en lecture seule
+
+        Raises:
+            ValueError: Si la graine est absente ou si les paramètres sont invalides
+        """
+        if seed is None:
+            raise ValueError("Une graine est nécessaire pour réutiliser des trajectoires")
+        dates = _validate_dates(dates, T)
+        dtype = _validate_dtype(dtype)
+        key = self._key(T, r, sigma, num_simulations, num_steps, seed, antithetic, sampler, dates, dtype)
+
+        unit = self._entries.get(key)
+        if unit is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return unit
+
+        self.misses += 1
+        unit = monte_carlo_simulation(1.0, T, r, sigma, num_simulations, num_steps, seed, antithetic=antithetic,
+                                      sampler=sampler, dates=dates, dtype=dtype)
+        unit.setflags(write=False)
+        if unit.nbytes <= self.max_bytes:
+            self._entries[key] = unit
+            self._nbytes += unit.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self.evictions += 1
+        return unit
+
+    def simulate(
+        self,
+        S: float,
+        T: float,
+        r: float,
+        sigma: float,
+        num_simulations: int,
+        num_steps: int,
+        seed: int,
+        antithetic: bool = False,
+        sampler: str = "pseudo",
+        dates: Optional[npt.ArrayLike] = None,
+        dtype: npt.DTypeLike = np.float64
+    ) -> npt.NDArray[np.float64]:
+        """
+        Trajectoires de spot S : une multiplication des trajectoires à spot unitaire.
+
+        Le résultat est identique à `monte_carlo_simulation` avec les mêmes arguments.
+
+        Args:
+            Mêmes arguments que `monte_carlo_simulation` (graine obligatoire)
+
+        Returns:
+            Matrice des trajectoires (nouveau tableau, modifiable)
+
+        Raises:
+            ValueError: Si les paramètres sont invalides
+        """
+        if S <= 0:
+            raise ValueError("Le prix initial doit être positif")
+        unit = self.unit_paths(T, r, sigma, num_simulations, num_steps, seed, antithetic, sampler, dates, dtype)
+        return unit * unit.dtype.type(S)
+
+    def clear(self) -> None:
+        """Vide le cache (les compteurs sont conservés)."""
+        self._entries.clear()
+        self._nbytes = 0
@@ -0,0 +1,221 @@
+"""
+Variables de contrôle à prix exact pour les payoffs asiatiques et barrières.
+
+L'estimateur contrôlé est Y - beta * (X - E[X]), où X est un payoff dont le
+prix est connu en forme fermée et beta = Cov(Y, X) / Var(X) est estimé sur
+les mêmes trajectoires. La variance est divisée par 1 / (1 - rho^2), rho
+étant la corrélation entre Y et X.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+from scipy.special import ndtr
+
+from .black_scholes import black_scholes_price
+from .monte_carlo import _estimator_samples, monte_carlo_running_statistics
+from .payoffs.asian import asian_geometric_payoff, asian_payoff
+from .payoffs.barrier import barrier_knock_in, barrier_knock_out
+from .payoffs.vanilla import vanilla_call, vanilla_put
+from .statistics import MonteCarloResult
+
+
+def geometric_asian_price(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_steps: int,
+    option_type: str = "call"
+) -> float:
+    """
+    Prix exact (Kemna-Vorst) d'une option asiatique géométrique discrète.
+
+    La moyenne porte sur les `num_steps` dates t_i = i * T / num_steps, comme
+    les colonnes des trajectoires simulées : log(G) est gaussien de moyenne
+    log(S) + (r - sigma^2 / 2) * T * (n + 1) / (2n) et de variance
+    sigma^2 * T * (n + 1) * (2n + 1) / (6n^2).
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        num_steps: Nombre de dates de moyenne
+        option_type: "call" ou "put"
+
+    Returns:
+        Prix de l'option
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    if S <= 0 or K <= 0 or T <= 0 or sigma <= 0:
+        raise ValueError("S, K, T et sigma doivent être positifs")
+    if num_steps <= 0:
+        raise ValueError("Le nombre de pas doit être positif")
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+
+    n = num_steps
+    mean_log = math.log(S) + (r - 0.5 * sigma ** 2) * T * (n + 1) / (2 * n)
+    std_log = sigma * math.sqrt(T * (n + 1) * (2 * n + 1) / (6 * n ** 2))
+    forward = math.exp(mean_log + 0.5 * std_log ** 2)  # E[G]
+
+    d1 = (mean_log - math.log(K) + std_log ** 2) / std_log
+    d2 = d1 - std_log
+    discount = math.exp(-r * T)
+    if option_type == "call":
+        return discount * (forward * ndtr(d1) - K * ndtr(d2))
+    return discount * (K * ndtr(-d2) - forward * ndtr(-d1))
+
+
+def control_variate_estimate(
+    payoffs: npt.NDArray[np.float64],
+    control_payoffs: npt.NDArray[np.float64],
+    control_price: float,
+    r: float,
+    T: float,
+    antithetic: bool = False
+) -> MonteCarloResult:
+    """
+    Estimateur par variable de contrôle avec beta optimal estimé sur les trajectoires.
+
+    Args:
+        payoffs: Payoffs non actualisés de l'option à évaluer
+        control_payoffs: Payoffs non actualisés du contrôle, sur les mêmes trajectoires
+        control_price: Prix exact (actualisé) du contrôle
+        r: Taux sans risque
+        T: Durée jusqu'à échéance
+        antithetic: Trajectoires en paires antithétiques (régression sur les moyennes de paires)
+
+    Returns:
+        Résultat avec prix ajusté et erreur standard réduite
+
+    Raises:
+        ValueError: Si les tableaux n'ont pas la même taille ou moins de deux échantillons
+    """
+    payoffs = np.asarray(payoffs, dtype=np.float64)
+    control_payoffs = np.asarray(control_payoffs, dtype=np.float64)
+    if payoffs.shape != control_payoffs.shape:
+        raise ValueError("Les payoffs et le contrôle doivent avoir la même taille")
+
+    discount = math.exp(-r * T)
+    y = discount * _estimator_samples(payoffs, antithetic)
+    x = discount * _estimator_samples(control_payoffs, antithetic)
+    if y.size < 2:
+        raise ValueError("Au moins deux échantillons sont nécessaires")
+
+    x_centered = x - x.mean()
+    variance = np.dot(x_centered, x_centered)
+    beta = np.dot(y - y.mean(), x_centered) / variance if variance > 0 else 0.0
+
+    adjusted = y - beta * (x - control_price)
+    return MonteCarloResult(
+        price=float(adjusted.mean()),
+        std_error=float(adjusted.std(ddof=1) / math.sqrt(adjusted.size)),
+        num_paths=payoffs.size
+    )
+
+
+def asian_control_variate_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    option_type: str = "call",
+    seed: Optional[int] = None,
+    antithetic: bool = False
+) -> MonteCarloResult:
+    """
+    Asiatique arithmétique avec l'asiatique géométrique comme variable de contrôle.
+
+    Les deux moyennes sont accumulées pas à pas (voir
+    `monte_carlo_running_statistics`) : la matrice des trajectoires n'est pas stockée.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de temps (dates de moyenne)
+        option_type: "call" ou "put"
+        seed: Graine aléatoire (optionnel)
+        antithetic: Variates antithétiques (num_simulations doit être pair)
+
+    Returns:
+        Résultat avec prix ajusté et erreur standard
+    """
+    control_price = geometric_asian_price(S, K, T, r, sigma, num_steps, option_type)
+    paths = monte_carlo_running_statistics(
+        S, T, r, sigma, num_simulations, num_steps, seed, antithetic=antithetic
+    )
+    return control_variate_estimate(
+        asian_payoff(paths, K, option_type),
+        asian_geometric_payoff(paths, K, option_type),
+        control_price, r, T, antithetic
+    )
+
+
+def barrier_control_variate_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    barrier: float,
+    barrier_type: str = "up",
+    knock: str = "out",
+    option_type: str = "call",
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    antithetic: bool = False
+) -> MonteCarloResult:
+    """
+    Option barrière avec la vanille Black-Scholes de même strike comme variable de contrôle.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        barrier: Niveau de barrière
+        barrier_type: "up" ou "down"
+        knock: "out" (knock-out) ou "in" (knock-in)
+        option_type: "call" ou "put"
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de temps (dates d'observation de la barrière)
+        seed: Graine aléatoire (optionnel)
+        antithetic: Variates antithétiques (num_simulations doit être pair)
+
+    Returns:
+        Résultat avec prix ajusté et erreur standard
+
+    Raises:
+        ValueError: Si knock n'est pas "in" ou "out"
+    """
+    if knock not in ["in", "out"]:
+        raise ValueError("knock doit être 'in' ou 'out'")
+    control_price = black_scholes_price(S, K, T, r, sigma, option_type)
+    payoff_sousjacent = vanilla_call if option_type == "call" else vanilla_put
+
+    paths = monte_carlo_running_statistics(
+        S, T, r, sigma, num_simulations, num_steps, seed, antithetic=antithetic
+    )
+    barrier_payoff = barrier_knock_out if knock == "out" else barrier_knock_in
+    return control_variate_estimate(
+        barrier_payoff(paths, K, barrier, payoff_sousjacent, barrier_type),
+        payoff_sousjacent(paths, K),
+        control_price, r, T, antithetic
+    )
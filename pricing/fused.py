@@ -0,0 +1,233 @@
+"""
+Backend Numba optionnel : simulation et payoff fusionnés dans une boucle par trajectoire.
+
+Le moteur NumPy écrit la matrice des trajectoires en mémoire puis la relit
+pour chaque réduction du payoff. Le noyau compilé avance chaque trajectoire
+pas à pas en ne gardant que quelques scalaires (log du prix, somme,
+franchissement de la barrière) : aucune trajectoire n'est matérialisée et
+les sous-flux sont répartis entre les cœurs par `prange`.
+
+Chaque sous-flux de PATHS_PER_STREAM trajectoires réinitialise le
+générateur Numba du thread qui l'exécute avec sa propre graine : le
+résultat ne dépend ni du nombre de threads ni de l'ordonnancement. Les
+normales diffèrent de celles des flux Philox de `pricing.rng` ; les deux
+backends donnent des prix égaux aux erreurs standard près.
+
+Sans Numba, les mêmes prix sont calculés par le moteur NumPy
+(`monte_carlo_running_statistics` pour les payoffs dépendant du chemin,
+également sans matrice de trajectoires).
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .monte_carlo import (
+    _validate_simulation_params, chunked_monte_carlo_pricing, monte_carlo_running_statistics
+)
+from .payoffs.asian import asian_payoff
+from .payoffs.barrier import barrier_knock_in, barrier_knock_out
+from .payoffs.vanilla import vanilla_call, vanilla_put
+from .rng import PATHS_PER_STREAM
+from .statistics import MonteCarloResult, RunningStats
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+# Backends disponibles ("auto" : Numba s'il est installé, sinon NumPy)
+FUSED_BACKENDS = ("auto", "numba", "numpy")
+
+# Payoffs fusionnés dans le noyau
+FUSED_PAYOFFS = ("vanilla", "asian", "barrier")
+
+# Nombre de trajectoires par appel du noyau (multiple de PATHS_PER_STREAM) :
+# seuls les payoffs d'un bloc sont stockés
+_FUSED_BLOCK_SIZE = 256 * PATHS_PER_STREAM
+
+_VANILLA, _ASIAN, _BARRIER = range(3)
+
+prange = numba.prange if NUMBA_AVAILABLE else range
+
+
+def _fused_payoff_kernel(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_steps: int,
+    payoff_code: int,
+    sign: float,
+    barrier: float,
+    barrier_sign: float,
+    knock_out: bool,
+    stream_seeds: npt.NDArray[np.uint32],
+    out: npt.NDArray[np.float64]
+) -> None:
+    """
+    Payoffs non actualisés de out.size trajectoires, sous-flux par sous-flux.
+
+    Le sous-flux i couvre les trajectoires [i * PATHS_PER_STREAM, (i + 1) * PATHS_PER_STREAM)
+    de `out` et tire ses normales d'un générateur réinitialisé avec stream_seeds[i].
+    """
+    dt = T / num_steps
+    drift = (r - 0.5 * sigma * sigma) * dt
+    vol = sigma * math.sqrt(dt)
+    log_spot = math.log(S)
+    log_barrier = math.log(barrier) if barrier > 0 else 0.0
+    num_paths = out.shape[0]
+
+    for stream in prange(stream_seeds.shape[0]):
+        np.random.seed(stream_seeds[stream])
+        first = stream * PATHS_PER_STREAM
+        last = min(first + PATHS_PER_STREAM, num_paths)
+        for path in range(first, last):
+            log_price = log_spot
+            total = 0.0
+            hit = False
+            for _ in range(num_steps):
+                log_price += drift + vol * np.random.standard_normal()
+                if payoff_code == _ASIAN:
+                    total += math.exp(log_price)
+                elif payoff_code == _BARRIER and barrier_sign * (log_price - log_barrier) >= 0.0:
+                    hit = True
+
+            underlying = total / num_steps if payoff_code == _ASIAN else math.exp(log_price)
+            payoff = max(sign * (underlying - K), 0.0)
+            if payoff_code == _BARRIER and hit == knock_out:
+                payoff = 0.0
+            out[path] = payoff
+
+
+if NUMBA_AVAILABLE:
+    _compiled_payoff_kernel = numba.njit(parallel=True, cache=True)(_fused_payoff_kernel)
+
+
+def _stream_seeds(seed: Optional[int], num_simulations: int) -> npt.NDArray[np.uint32]:
+    """Graine 32 bits de chaque sous-flux, dérivée de la graine principale."""
+    num_streams = -(-num_simulations // PATHS_PER_STREAM)
+    return np.random.SeedSequence(seed).generate_state(num_streams, dtype=np.uint32)
+
+
+def _numpy_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_type: str,
+    option_type: str,
+    barrier: Optional[float],
+    barrier_type: str,
+    knock: str,
+    num_simulations: int,
+    num_steps: int,
+    seed: Optional[int]
+) -> MonteCarloResult:
+    """Même prix par le moteur NumPy, sans matrice de trajectoires."""
+    payoff_sousjacent = vanilla_call if option_type == "call" else vanilla_put
+    if payoff_type == "vanilla":
+        return chunked_monte_carlo_pricing(S, K, T, r, sigma, payoff_sousjacent, num_simulations, num_steps, seed)
+
+    paths = monte_carlo_running_statistics(S, T, r, sigma, num_simulations, num_steps, seed)
+    if payoff_type == "asian":
+        payoffs = asian_payoff(paths, K, option_type)
+    else:
+        barrier_payoff = barrier_knock_out if knock == "out" else barrier_knock_in
+        payoffs = barrier_payoff(paths, K, barrier, payoff_sousjacent, barrier_type)
+    stats = RunningStats().update(np.exp(-r * T) * payoffs)
+    return MonteCarloResult(price=stats.mean, std_error=stats.std_error, num_paths=num_simulations)
+
+
+def fused_monte_carlo_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_type: str = "vanilla",
+    option_type: str = "call",
+    barrier: Optional[float] = None,
+    barrier_type: str = "up",
+    knock: str = "out",
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    backend: str = "auto"
+) -> MonteCarloResult:
+    """
+    Pricing Monte Carlo par noyau fusionné (simulation et payoff dans la même boucle).
+
+    Une vanille est simulée en un seul saut exact jusqu'à maturité ; les
+    asiatiques (moyenne arithmétique) et les barrières (observées à chaque pas)
+    parcourent les num_steps pas.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        payoff_type: "vanilla", "asian" ou "barrier"
+        option_type: "call" ou "put"
+        barrier: Niveau de barrière (requis pour "barrier")
+        barrier_type: "up" ou "down"
+        knock: "out" (knock-out) ou "in" (knock-in)
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de temps
+        seed: Graine aléatoire (optionnel)
+        backend: "auto", "numba" ou "numpy"
+
+    Returns:
+        Résultat avec prix actualisé et erreur standard
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+        ImportError: Si backend="numba" et que Numba n'est pas installé
+    """
+    if payoff_type not in FUSED_PAYOFFS:
+        raise ValueError("payoff_type doit être 'vanilla', 'asian' ou 'barrier'")
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    if backend not in FUSED_BACKENDS:
+        raise ValueError("backend doit être 'auto', 'numba' ou 'numpy'")
+    if payoff_type == "barrier":
+        if barrier is None or barrier <= 0:
+            raise ValueError("Une barrière positive est requise")
+        if barrier_type not in ["up", "down"]:
+            raise ValueError("barrier_type doit être 'up' ou 'down'")
+        if knock not in ["in", "out"]:
+            raise ValueError("knock doit être 'in' ou 'out'")
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        raise ImportError("Le backend 'numba' nécessite le paquet numba")
+
+    if backend == "numpy" or not NUMBA_AVAILABLE:
+        return _numpy_pricing(S, K, T, r, sigma, payoff_type, option_type, barrier, barrier_type, knock,
+                              num_simulations, num_steps, seed)
+
+    payoff_code = FUSED_PAYOFFS.index(payoff_type)
+    kernel_steps = 1 if payoff_type == "vanilla" else num_steps
+    sign = 1.0 if option_type == "call" else -1.0
+    barrier_sign = 1.0 if barrier_type == "up" else -1.0
+    seeds = _stream_seeds(seed, num_simulations)
+    discount = np.exp(-r * T)
+
+    stats = RunningStats()
+    payoffs = np.empty(min(_FUSED_BLOCK_SIZE, num_simulations))
+    for start in range(0, num_simulations, _FUSED_BLOCK_SIZE):
+        stop = min(start + _FUSED_BLOCK_SIZE, num_simulations)
+        block = payoffs[:stop - start]
+        _compiled_payoff_kernel(
+            S, K, T, r, sigma, kernel_steps, payoff_code, sign, barrier or 0.0, barrier_sign, knock == "out",
+            seeds[start // PATHS_PER_STREAM:-(-stop // PATHS_PER_STREAM)], block
+        )
+        stats.update(discount * block)
+    return MonteCarloResult(price=stats.mean, std_error=stats.std_error, num_paths=num_simulations)
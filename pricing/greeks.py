@@ -0,0 +1,217 @@
+"""
+Greeks Monte Carlo calculés sur les mêmes trajectoires que le prix.
+
+- Dérivées trajectorielles (pathwise) pour les payoffs lipschitziens
+  (vanilles, asiatiques) : la dérivée du payoff est propagée le long de la
+  trajectoire GBM, S_t = S * exp((r - sigma^2 / 2) t + sigma W_t).
+- Rapport de vraisemblance (likelihood ratio) pour les payoffs discontinus
+  (barrières) : le payoff est pondéré par la dérivée du log de la densité
+  des incréments gaussiens ; aucune dérivée du payoff n'est nécessaire.
+
+Chaque Greek est une moyenne d'échantillons par trajectoire : il est
+retourné avec son erreur standard, comme le prix.
+"""
+
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from .monte_carlo import (
+    _estimator_samples, _gbm_paths_inplace, _path_payoff, _resolve_block_size,
+    _validate_antithetic, _validate_simulation_params
+)
+from .paths import PathSet
+from .rng import standard_normals, stream_key
+from .statistics import MonteCarloResult, RunningStats
+
+
+# Greeks retournés, avec le prix
+GREEKS = ("price", "delta", "vega", "rho")
+
+# Vecteurs par trajectoire vivants en même temps dans la boucle d'un bloc
+# (sensibilités de X, payoff, pente ou poids, échantillons des quatre Greeks
+# et leurs temporaires) : ils sont comptés comme des colonnes supplémentaires
+# dans le dimensionnement des blocs par le budget mémoire
+_PER_PATH_TEMPORARIES = 16
+
+
+def _results(stats: Dict[str, RunningStats], num_simulations: int) -> Dict[str, MonteCarloResult]:
+    """Convertit les accumulateurs en résultats Monte Carlo."""
+    return {
+        name: MonteCarloResult(price=stats[name].mean, std_error=stats[name].std_error, num_paths=num_simulations)
+        for name in GREEKS
+    }
+
+
+def pathwise_greeks(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_type: str = "vanilla",
+    option_type: str = "call",
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    antithetic: bool = False
+) -> Dict[str, MonteCarloResult]:
+    """
+    Prix, delta, vega et rho par dérivées trajectorielles, en une simulation.
+
+    Pour un payoff f(X), X étant la valeur finale ou la moyenne arithmétique :
+    delta = e^(-rT) E[f'(X) dX/dS], vega = e^(-rT) E[f'(X) dX/dsigma],
+    rho = e^(-rT) E[f'(X) dX/dr] - T * prix, avec
+    dS_t/dS = S_t / S, dS_t/dsigma = S_t (W_t - sigma t), dS_t/dr = t S_t.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        payoff_type: "vanilla" (valeur finale) ou "asian" (moyenne arithmétique)
+        option_type: "call" ou "put"
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de temps
+        seed: Graine aléatoire (optionnel)
+        max_memory_bytes: Budget mémoire d'un bloc de trajectoires (optionnel)
+        antithetic: Variates antithétiques (num_simulations doit être pair)
+
+    Returns:
+        Dictionnaire {"price", "delta", "vega", "rho"} de résultats avec erreur standard
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    if payoff_type not in ["vanilla", "asian"]:
+        raise ValueError("payoff_type doit être 'vanilla' ou 'asian'")
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    _validate_antithetic(num_simulations, antithetic)
+    # Une vanille n'observe que la date finale : un seul saut exact suffit
+    num_columns = 1 if payoff_type == "vanilla" else num_steps
+    # Asiatique : trajectoires et log-moneyness pondérée, deux matrices vivantes
+    live_columns = (num_columns if payoff_type == "vanilla" else 2 * num_columns) + _PER_PATH_TEMPORARIES
+    block_size = _resolve_block_size(live_columns, max_memory_bytes, None, antithetic)
+
+    sign = 1.0 if option_type == "call" else -1.0
+    discount = np.exp(-r * T)
+    times = np.arange(1, num_steps + 1) * (T / num_steps)
+    drift = r + 0.5 * sigma ** 2
+    key = stream_key(seed)
+    stats = {name: RunningStats() for name in GREEKS}
+
+    for start in range(0, num_simulations, block_size):
+        stop = min(start + block_size, num_simulations)
+        Z = standard_normals(key, start, stop, num_columns, antithetic=antithetic)
+        ST = _gbm_paths_inplace(Z, S, T, r, sigma)
+
+        if payoff_type == "vanilla":
+            X = ST[:, -1]
+            # sigma * W_T - sigma^2 T = log(S_T / S) - (r + sigma^2 / 2) T
+            dX_dsigma = X * (np.log(X / S) - drift * T) / sigma
+            dX_dr = T * X
+        else:
+            X = ST.mean(axis=1)
+            log_moneyness = np.log(ST / S)
+            log_moneyness -= drift * times
+            log_moneyness *= ST
+            dX_dsigma = log_moneyness.mean(axis=1) / sigma
+            dX_dr = ST @ times / num_steps
+
+        payoff = np.maximum(sign * (X - K), 0.0)
+        slope = discount * sign * (sign * (X - K) > 0)  # e^(-rT) f'(X)
+        samples = {
+            "price": discount * payoff,
+            "delta": slope * X / S,
+            "vega": slope * dX_dsigma,
+            "rho": slope * dX_dr - T * discount * payoff,
+        }
+        for name in GREEKS:
+            stats[name].update(_estimator_samples(samples[name], antithetic))
+
+    return _results(stats, num_simulations)
+
+
+def likelihood_ratio_greeks(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_function: Optional[Callable] = None,
+    payoff_sousjacent: Optional[Callable] = None,
+    barrier: Optional[float] = None,
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    antithetic: bool = False
+) -> Dict[str, MonteCarloResult]:
+    """
+    Prix, delta, vega et rho par rapport de vraisemblance, en une simulation.
+
+    Les incréments log(S_i / S_{i-1}) sont gaussiens de moyenne
+    (r - sigma^2 / 2) dt et d'écart-type sigma sqrt(dt). Avec Z_i les normales
+    de la trajectoire, les poids sont :
+    delta : Z_1 / (S sigma sqrt(dt)) ;
+    vega : somme((Z_i^2 - 1) / sigma - Z_i sqrt(dt)) ;
+    rho : somme(Z_i) sqrt(dt) / sigma (plus -T * prix pour l'actualisation).
+
+    Le payoff est spécifié comme pour `monte_carlo_pricing` (par exemple
+    `barrier_knock_out` avec `payoff_sousjacent` et `barrier`). Le poids de
+    delta ne dépend que du premier pas : sa variance croît avec num_steps.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        payoff_function: Fonction de payoff (ou de barrière)
+        payoff_sousjacent: Payoff appliqué à la valeur finale (optionnel)
+        barrier: Niveau de barrière (requis avec une fonction de barrière)
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de temps
+        seed: Graine aléatoire (optionnel)
+        max_memory_bytes: Budget mémoire d'un bloc de trajectoires (optionnel)
+        antithetic: Variates antithétiques (num_simulations doit être pair)
+
+    Returns:
+        Dictionnaire {"price", "delta", "vega", "rho"} de résultats avec erreur standard
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    _validate_antithetic(num_simulations, antithetic)
+    block_size = _resolve_block_size(num_steps + _PER_PATH_TEMPORARIES, max_memory_bytes, None, antithetic)
+
+    sqrt_dt = np.sqrt(T / num_steps)
+    discount = np.exp(-r * T)
+    key = stream_key(seed)
+    stats = {name: RunningStats() for name in GREEKS}
+
+    for start in range(0, num_simulations, block_size):
+        stop = min(start + block_size, num_simulations)
+        Z = standard_normals(key, start, stop, num_steps, antithetic=antithetic)
+        # Scores calculés avant la transformation en place des normales en trajectoires
+        first = Z[:, 0].copy()
+        total = Z.sum(axis=1)
+        total_squares = np.einsum("ij,ij->i", Z, Z)
+
+        ST = _gbm_paths_inplace(Z, S, T, r, sigma)
+        payoff = discount * _path_payoff(PathSet(ST), K, payoff_function, payoff_sousjacent, barrier)
+        samples = {
+            "price": payoff,
+            "delta": payoff * first / (S * sigma * sqrt_dt),
+            "vega": payoff * ((total_squares - num_steps) / sigma - sqrt_dt * total),
+            "rho": payoff * (sqrt_dt * total / sigma - T),
+        }
+        for name in GREEKS:
+            stats[name].update(_estimator_samples(samples[name], antithetic))
+
+    return _results(stats, num_simulations)
@@ -1,7 +1,103 @@
+import time
 import numpy as np
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable, Iterator, Union
 import numpy.typing as npt
 
+from .statistics import RunningStats, MonteCarloResult, AdaptiveMonteCarloResult
+from .paths import PathSet
+from .rng import PATHS_PER_STREAM, StepNormals, standard_normals, stream_key, stream_slice_steps
+from .qmc import SAMPLERS, replication_seeds, sobol_normals
+from .schedule import TERMINAL, _declared_schedule, observation_dates, payoff_schedule
+from .workspace import SimulationWorkspace
+
+
+# Budget mémoire par défaut du moteur par blocs (256 Mo)
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 ** 2
+
+# Nombre de trajectoires avancées ensemble par le moteur pas à pas : les
+# accumulateurs d'un bloc restent en cache processeur d'un pas à l'autre
+_STEPPING_BLOCK_SIZE = 2 ** 14
+
+# Nombre de matrices (taille d'un bloc) réservées par bloc : la matrice de
+# travail plus les temporaires créés par les payoffs (log, comparaisons...)
+_BLOCK_MEMORY_FACTOR = 2
+
+# Taille des lots du pricing adaptatif (multiple de la taille des sous-flux)
+_ADAPTIVE_BATCH_SIZE = 16 * PATHS_PER_STREAM
+
+
+def _validate_simulation_params(S: float, T: float, sigma: float, num_simulations: int, num_steps: int) -> None:
+    """Valide les paramètres communs aux moteurs de simulation."""
+    if S <= 0:
+        raise ValueError("Le prix initial S doit être positif")
+    if T <= 0:
+        raise ValueError("La durée T doit être positive")
+    if sigma <= 0:
+        raise ValueError("La volatilité sigma doit être positive")
+    if num_simulations <= 0:
+        raise ValueError("Le nombre de simulations doit être positif")
+    if num_steps <= 0:
+        raise ValueError("Le nombre de pas doit être positif")
+
+
+def _validate_antithetic(num_simulations: int, antithetic: bool) -> None:
+    """Les paires antithétiques (Z, -Z) imposent un nombre pair de trajectoires."""
+    if antithetic and num_simulations % 2 != 0:
+        raise ValueError("Le nombre de simulations doit être pair avec les variates antithétiques")
+
+
+def _estimator_samples(payoffs: npt.NDArray[np.float64], antithetic: bool) -> npt.NDArray[np.float64]:
+    """
+    Échantillons indépendants de l'estimateur : les payoffs eux-mêmes, ou la
+    moyenne de chaque paire antithétique (trajectoires 2k et 2k + 1).
+    """
+    if antithetic:
+        return 0.5 * (payoffs[0::2] + payoffs[1::2])
+    return payoffs
+
+
+def _validate_dtype(dtype: npt.DTypeLike) -> np.dtype:
+    """Type flottant de la simulation (float64 ou float32)."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError("dtype doit être np.float64 ou np.float32")
+    return dtype
+
+
+def _validate_dates(dates: Optional[npt.ArrayLike], T: float) -> Optional[npt.NDArray[np.float64]]:
+    """Valide des dates d'observation (croissantes dans ]0, T])."""
+    if dates is None:
+        return None
+    dates = np.asarray(dates, dtype=np.float64)
+    if dates.ndim != 1 or dates.size == 0 or dates[0] <= 0 or dates[-1] > T or np.any(np.diff(dates) <= 0):
+        raise ValueError("Les dates d'observation doivent être croissantes dans ]0, T]")
+    return dates
+
+
+def _gbm_paths_inplace(
+    Z: npt.NDArray[np.float64],
+    S: float,
+    T: float,
+    r: float,
+    sigma: float,
+    dates: Optional[npt.NDArray[np.float64]] = None
+) -> npt.NDArray[np.float64]:
+    """
+    Transforme en place une matrice de normales en trajectoires GBM.
+
+    Aucune matrice temporaire n'est allouée : incréments, somme cumulée
+    et exponentielle sont calculés dans le buffer de Z. Avec `dates`, les
+    colonnes sont des sauts exacts vers ces dates ; sinon la grille est
+    uniforme sur [0, T].
+    """
+    dt = T / Z.shape[1] if dates is None else np.diff(dates, prepend=0.0)
+    Z *= sigma * np.sqrt(dt)
+    Z += (r - 0.5 * sigma ** 2) * dt
+    np.cumsum(Z, axis=1, out=Z)
+    np.exp(Z, out=Z)
+    Z *= S
+    return Z
+
 
 def monte_carlo_simulation(
     S: float, 
@@ -10,7 +106,12 @@ def monte_carlo_simulation(
     sigma: float, 
     num_simulations: int,
     num_steps: int,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    antithetic: bool = False,
+    sampler: str = "pseudo",
+    dates: Optional[npt.ArrayLike] = None,
+    dtype: npt.DTypeLike = np.float64,
+    workspace: Optional[SimulationWorkspace] = None
 ) -> npt.NDArray[np.float64]:
     """
     Génère les trajectoires du sous-jacent avec un processus de Brownien géométrique.
@@ -23,39 +124,274 @@ def monte_carlo_simulation(
         num_simulations: Nombre de simulations Monte Carlo (doit être > 0)
         num_steps: Nombre de pas de temps (doit être > 0)
         seed: Graine pour la reproductibilité (optionnel)
+        antithetic: Variates antithétiques : les trajectoires 2k et 2k + 1 utilisent
+            les normales Z et -Z (num_simulations doit être pair)
+        sampler: "pseudo" (flux Philox) ou "sobol" (Sobol brouillé par la graine,
+            construit par pont brownien, voir `pricing.qmc`)
+        dates: Dates d'observation croissantes dans ]0, T] (optionnel) : seules
+            ces dates sont simulées, par sauts exacts, et num_steps est ignoré
+        dtype: np.float64 ou np.float32 (moitié moins de mémoire et de trafic ;
+            les moyennes des payoffs restent accumulées en float64)
+        workspace: Buffers réutilisés (optionnel) : à forme identique, aucune
+            allocation avec l'échantillonneur "pseudo" (avec "sobol", les
+            normales et le pont brownien allouent encore leurs tableaux) ; le
+            résultat est une vue du workspace, écrasée par l'appel suivant
 
     Returns:
-        Matrice des trajectoires (num_simulations, num_steps)
+        Matrice des trajectoires (num_simulations, num_steps ou len(dates))
         
     Raises:
         ValueError: Si les paramètres sont invalides
     """
     # Validation des paramètres
-    if S <= 0:
-        raise ValueError("Le prix initial S doit être positif")
-    if T <= 0:
-        raise ValueError("La durée T doit être positive")
-    if sigma <= 0:
-        raise ValueError("La volatilité sigma doit être positive")
-    if num_simulations <= 0:
-        raise ValueError("Le nombre de simulations doit être positif")
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    _validate_antithetic(num_simulations, antithetic)
+    if sampler not in SAMPLERS:
+        raise ValueError("sampler doit être 'pseudo' ou 'sobol'")
+    if sampler == "sobol" and antithetic:
+        raise ValueError("Les variates antithétiques ne s'appliquent pas à l'échantillonneur Sobol")
+    dates = _validate_dates(dates, T)
+    dtype = _validate_dtype(dtype)
+    num_columns = num_steps if dates is None else dates.size
+
+    # Flux Philox dédiés (voir pricing.rng) : l'état aléatoire global n'est pas modifié.
+    # Les incréments, la somme cumulée et l'exponentielle réutilisent le buffer de Z
+    out = scratch = None
+    if workspace is not None:
+        out = workspace.paths(num_simulations, num_columns, dtype)
+        scratch = workspace.stream_block(num_columns, dtype)
+    if sampler == "sobol":
+        Z = sobol_normals(num_simulations, num_columns, seed).astype(dtype, copy=False)
+        if out is not None:
+            np.copyto(out, Z)
+            Z = out
+    else:
+        Z = standard_normals(seed, 0, num_simulations, num_columns, dtype=dtype, out=out,
+                             antithetic=antithetic, scratch=scratch)
+    ST = _gbm_paths_inplace(Z, S, T, r, sigma, dates)
+
+    return ST
+
+
+def monte_carlo_path_range(
+    S: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_steps: int,
+    start: int,
+    stop: int,
+    seed: int,
+    antithetic: bool = False
+) -> npt.NDArray[np.float64]:
+    """
+    Régénère les trajectoires [start, stop) d'une simulation de graine `seed`,
+    sans simuler les autres trajectoires.
+
+    Le résultat est identique aux lignes start:stop de `monte_carlo_simulation`
+    avec la même graine (quel que soit son nombre de simulations).
+
+    Args:
+        S: Prix initial du sous-jacent (doit être > 0)
+        T: Durée jusqu'à échéance en années (doit être > 0)
+        r: Taux sans risque
+        sigma: Volatilité du sous-jacent (doit être > 0)
+        num_steps: Nombre de pas de temps (doit être > 0)
+        start: Indice de la première trajectoire
+        stop: Indice suivant la dernière trajectoire
+        seed: Graine de la simulation
+        antithetic: Simulation avec variates antithétiques
+
+    Returns:
+        Matrice des trajectoires (stop - start, num_steps)
+
+    Raises:
+        ValueError: Si les paramètres ou la plage sont invalides
+    """
+    _validate_simulation_params(S, T, sigma, max(stop - start, 1), num_steps)
+    Z = standard_normals(seed, start, stop, num_steps, antithetic=antithetic)
+    return _gbm_paths_inplace(Z, S, T, r, sigma)
+
+
+def block_size_from_memory(num_steps: int, max_memory_bytes: int, itemsize: int = 8) -> int:
+    """
+    Calcule le nombre de trajectoires par bloc compatible avec un budget mémoire.
+
+    Args:
+        num_steps: Nombre de pas de temps
+        max_memory_bytes: Budget mémoire en octets
+        itemsize: Taille d'un élément en octets (8 pour float64)
+
+    Returns:
+        Nombre de trajectoires par bloc (au moins 1)
+
+    Raises:
+        ValueError: Si le budget est insuffisant pour une seule trajectoire
+    """
     if num_steps <= 0:
         raise ValueError("Le nombre de pas doit être positif")
-    
-    # Configuration du générateur aléatoire
-    if seed is not None:
-        np.random.seed(seed)
-    
-    dt = T / num_steps
-    Z = np.random.standard_normal((num_simulations, num_steps))
-    increments = (r - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * Z
-    ST = S * np.exp(np.cumsum(increments, axis=1))
+    bytes_per_path = _BLOCK_MEMORY_FACTOR * num_steps * itemsize
+    if max_memory_bytes < bytes_per_path:
+        raise ValueError(
+            f"max_memory_bytes doit être au moins {bytes_per_path} octets pour {num_steps} pas"
+        )
+    return int(max_memory_bytes // bytes_per_path)
 
-    return ST
+
+def _resolve_block_size(
+    num_steps: int,
+    max_memory_bytes: Optional[int],
+    block_size: Optional[int],
+    antithetic: bool,
+    itemsize: int = 8
+) -> int:
+    """
+    Taille de bloc explicite, ou déduite du budget mémoire et alignée sur les sous-flux.
+
+    Le budget couvre aussi la tranche de sous-flux tirée par `standard_normals`.
+    Un budget inférieur à un sous-flux de trajectoires reste respecté, mais
+    chaque bloc tire son sous-flux entier : le temps de tirage est multiplié
+    par environ PATHS_PER_STREAM / taille de bloc.
+    """
+    if block_size is None:
+        if max_memory_bytes is None:
+            max_memory_bytes = DEFAULT_MAX_MEMORY_BYTES
+        scratch_bytes = stream_slice_steps(num_steps, itemsize) * PATHS_PER_STREAM * itemsize
+        minimum = scratch_bytes + _BLOCK_MEMORY_FACTOR * num_steps * itemsize
+        if max_memory_bytes < minimum:
+            raise ValueError(f"max_memory_bytes doit être au moins {minimum} octets pour {num_steps} pas")
+        block_size = block_size_from_memory(num_steps, max_memory_bytes - scratch_bytes, itemsize)
+        if block_size >= PATHS_PER_STREAM:
+            # Blocs alignés sur les sous-flux : aucun sous-flux n'est tiré deux fois
+            block_size -= block_size % PATHS_PER_STREAM
+        elif antithetic and block_size > 1:
+            block_size -= block_size % 2
+    if block_size <= 0:
+        raise ValueError("La taille de bloc doit être positive")
+    if antithetic and block_size % 2 != 0:
+        raise ValueError("La taille de bloc doit être paire avec les variates antithétiques")
+    return block_size
+
+
+def monte_carlo_path_blocks(
+    S: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_simulations: int,
+    num_steps: int,
+    seed: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    block_size: Optional[int] = None,
+    antithetic: bool = False,
+    dates: Optional[npt.ArrayLike] = None,
+    dtype: npt.DTypeLike = np.float64
+) -> Iterator[npt.NDArray[np.float64]]:
+    """
+    Génère les trajectoires GBM par blocs de taille bornée.
+
+    Chaque bloc est tiré directement sur ses flux à compteur : pour une même
+    graine, la concaténation des blocs est identique à la matrice complète de
+    `monte_carlo_simulation`, quelle que soit la taille des blocs.
+
+    Args:
+        S: Prix initial du sous-jacent (doit être > 0)
+        T: Durée jusqu'à échéance en années (doit être > 0)
+        r: Taux sans risque
+        sigma: Volatilité du sous-jacent (doit être > 0)
+        num_simulations: Nombre total de trajectoires (doit être > 0)
+        num_steps: Nombre de pas de temps (doit être > 0)
+        seed: Graine pour la reproductibilité (optionnel)
+        max_memory_bytes: Budget mémoire utilisé pour choisir la taille des blocs
+        block_size: Nombre de trajectoires par bloc (prioritaire sur max_memory_bytes)
+        antithetic: Variates antithétiques (chaque bloc contient des paires complètes)
+        dates: Dates d'observation (optionnel, voir `monte_carlo_simulation`)
+        dtype: np.float64 ou np.float32 (un bloc float32 contient deux fois plus
+            de trajectoires pour le même budget mémoire)
+
+    Yields:
+        Blocs de trajectoires (taille_bloc, num_steps ou len(dates))
+    """
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    _validate_antithetic(num_simulations, antithetic)
+    dates = _validate_dates(dates, T)
+    dtype = _validate_dtype(dtype)
+    num_columns = num_steps if dates is None else dates.size
+    block_size = _resolve_block_size(num_columns, max_memory_bytes, block_size, antithetic, dtype.itemsize)
+
+    key = stream_key(seed)
+    for start in range(0, num_simulations, block_size):
+        stop = min(start + block_size, num_simulations)
+        # Aucune référence locale au bloc produit : il est libéré par l'appelant
+        # avant le tirage du suivant
+        yield _gbm_paths_inplace(
+            standard_normals(key, start, stop, num_columns, dtype=dtype, antithetic=antithetic), S, T, r, sigma, dates
+        )
+
+
+def _path_payoff(
+    ST: Union[npt.NDArray[np.float64], PathSet],
+    K: float,
+    payoff_function: Optional[Callable],
+    payoff_sousjacent: Optional[Callable],
+    barrier: Optional[float]
+) -> npt.NDArray[np.float64]:
+    """Calcule les payoffs d'une matrice de trajectoires pour `monte_carlo_pricing`."""
+    # 🔍 Cas sans barrière → Payoff sous-jacent seul
+    # (un PathSet est transmis tel quel : le payoff choisit la statistique utile)
+    if payoff_sousjacent is not None and payoff_function is None:
+        payoff = payoff_sousjacent(ST if isinstance(ST, PathSet) else ST[:, -1], K)
+
+    # 🚀 Cas avec barrière → Applique la fonction de barrière
+    elif payoff_function is not None and payoff_sousjacent is not None:
+        if barrier is None:
+            raise ValueError("Une barrière doit être spécifiée pour les options à barrière")
+        payoff = payoff_function(ST, K, barrier, payoff_sousjacent)
+
+    # 🔍 Payoff seul → valeur finale ou trajectoire complète selon sa signature
+    elif payoff_function is not None:
+        payoff = _evaluate_payoff(payoff_function, ST, K)
+
+    else:
+        raise ValueError("Il faut fournir au moins un payoff sous-jacent")
+
+    # Validation du payoff
+    if not isinstance(payoff, np.ndarray):
+        raise ValueError("Le payoff doit être un array numpy")
+
+    return payoff
+
+
+def _evaluate_payoff(
+    payoff_function: Callable,
+    ST: npt.NDArray[np.float64],
+    K: float,
+    S: Optional[float] = None,
+    sigma: Optional[float] = None,
+    T: Optional[float] = None,
+    dates: Optional[npt.NDArray[np.float64]] = None,
+    key: Optional[npt.NDArray[np.uint64]] = None,
+    start: int = 0
+) -> npt.NDArray[np.float64]:
+    """
+    Applique un payoff selon son calendrier déclaré (voir `pricing.schedule`) :
+    valeur finale pour un payoff terminal, trajectoires sinon.
+
+    Si le modèle (S, sigma, T) est fourni, un payoff déclarant son calendrier
+    reçoit un PathSet qui le connaît (pont brownien entre les dates simulées,
+    voir `PathSet.survival_probability`), ainsi que la clé de la simulation et
+    l'indice de la première trajectoire du bloc (uniformes des extrema
+    continus) ; un payoff sans déclaration reçoit la matrice.
+    """
+    if payoff_schedule(payoff_function).kind == TERMINAL.kind:
+        return payoff_function(ST[:, -1], K)
+    if S is not None and _declared_schedule(payoff_function) is not None:
+        ST = PathSet(ST, spot=S, sigma=sigma, T=T, dates=dates, seed=key, start=start)
+    return payoff_function(ST, K)
 
 
 def monte_carlo_pricing(
-    ST: npt.NDArray[np.float64], 
+    ST: Union[npt.NDArray[np.float64], PathSet, Iterable[npt.NDArray[np.float64]]], 
     K: float, 
     r: float, 
     T: float, 
@@ -67,7 +403,8 @@ def monte_carlo_pricing(
     Calcule le prix d'une option par Monte Carlo.
     
     Args:
-        ST: Trajectoires du sous-jacent
+        ST: Trajectoires du sous-jacent, PathSet (statistiques partagées entre
+            les payoffs) ou itérable de blocs de trajectoires (voir `monte_carlo_path_blocks`)
         K: Prix d'exercice
         r: Taux sans risque
         T: Durée jusqu'à échéance
@@ -87,29 +424,18 @@ def monte_carlo_pricing(
     if K <= 0:
         raise ValueError("Le prix d'exercice K doit être positif")
     
-    # 🔍 Cas sans barrière → Payoff sous-jacent seul
-    if payoff_sousjacent is not None and payoff_function is None:
-        payoff = payoff_sousjacent(ST[:, -1], K)
+    if isinstance(ST, (np.ndarray, PathSet)):
+        payoff = _path_payoff(ST, K, payoff_function, payoff_sousjacent, barrier)
+        return np.exp(-r * T) * np.mean(payoff, dtype=np.float64)
 
-    # 🚀 Cas avec barrière → Applique la fonction de barrière
-    elif payoff_function is not None and payoff_sousjacent is not None:
-        if barrier is None:
-            raise ValueError("Une barrière doit être spécifiée pour les options à barrière")
-        payoff = payoff_function(ST, K, barrier, payoff_sousjacent)
-
-    # 🔍 Cas option asiatique → Payoff sur toute la trajectoire
-    elif payoff_sousjacent is not None and payoff_function is None:
-        payoff = payoff_sousjacent(ST, K)
-
-    else:
-        raise ValueError("Il faut fournir au moins un payoff sous-jacent")
+    # Itérable de blocs → moyenne courante, un seul bloc en mémoire
+    stats = RunningStats()
+    for block in ST:
+        stats.update(_path_payoff(block, K, payoff_function, payoff_sousjacent, barrier))
+    if stats.count == 0:
+        raise ValueError("Aucune trajectoire fournie")
 
-    # Validation du payoff
-    if not isinstance(payoff, np.ndarray):
-        raise ValueError("Le payoff doit être un array numpy")
-    
-    price = np.exp(-r * T) * np.mean(payoff)
-    return price
+    return np.exp(-r * T) * stats.mean
 
 
 def simple_monte_carlo_pricing(
@@ -121,10 +447,18 @@ def simple_monte_carlo_pricing(
     payoff_function: Callable,
     num_simulations: int = 10000,
     num_steps: int = 252,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    antithetic: bool = False,
+    sampler: str = "pseudo",
+    dtype: npt.DTypeLike = np.float64,
+    workspace: Optional[SimulationWorkspace] = None
 ) -> float:
     """
     Fonction simplifiée de pricing Monte Carlo qui génère les trajectoires en interne.
+
+    Seules les dates déclarées par le payoff sont simulées (voir
+    `pricing.schedule`) : un payoff terminal est simulé en un seul pas.
     
     Args:
         S: Prix initial du sous-jacent
@@ -134,23 +468,349 @@ def simple_monte_carlo_pricing(
         sigma: Volatilité
         payoff_function: Fonction de payoff à appliquer
         num_simulations: Nombre de simulations
-        num_steps: Nombre de pas de temps
+        num_steps: Nombre de pas de la grille (payoffs observant chaque pas)
         seed: Graine aléatoire (optionnel)
+        max_memory_bytes: Si fourni, simulation par blocs sous ce budget mémoire
+            (voir `chunked_monte_carlo_pricing`)
+        antithetic: Variates antithétiques (num_simulations doit être pair)
+        sampler: "pseudo" ou "sobol" (voir `monte_carlo_simulation`)
+        dtype: np.float64 ou np.float32 (moyenne des payoffs en float64)
+        workspace: Buffers de trajectoires réutilisés d'un appel à l'autre (optionnel)
         
     Returns:
         Prix de l'option
     """
-    # Génération des trajectoires
-    ST = monte_carlo_simulation(S, T, r, sigma, num_simulations, num_steps, seed)
+    if max_memory_bytes is not None:
+        if sampler != "pseudo":
+            raise ValueError("La simulation par blocs n'utilise que l'échantillonneur 'pseudo'")
+        return chunked_monte_carlo_pricing(
+            S, K, T, r, sigma, payoff_function, num_simulations, num_steps, seed, max_memory_bytes,
+            antithetic=antithetic, dtype=dtype
+        ).price
+
+    # Génération des trajectoires (clé dérivée une fois : normales et pont brownien)
+    dates = observation_dates(payoff_function, T, num_steps)
+    key = stream_key(seed)
+    ST = monte_carlo_simulation(
+        S, T, r, sigma, num_simulations, num_steps, key if sampler == "pseudo" else seed, antithetic=antithetic,
+        sampler=sampler, dates=dates, dtype=dtype, workspace=workspace
+    )
     
     # Calcul du payoff
-    if hasattr(payoff_function, '__code__') and payoff_function.__code__.co_argcount == 2:
-        # Fonction payoff simple (vanilla)
-        payoffs = payoff_function(ST[:, -1], K)
-    else:
-        # Fonction payoff complexe (asian, etc.)
-        payoffs = payoff_function(ST, K)
+    payoffs = _evaluate_payoff(payoff_function, ST, K, S, sigma, T, dates, key)
     
     # Prix actualisé
-    return np.exp(-r * T) * np.mean(payoffs)
+    return np.exp(-r * T) * np.mean(payoffs, dtype=np.float64)
+
+
+def qmc_monte_carlo_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_function: Callable,
+    num_simulations: int = 2 ** 14,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    num_replications: int = 16
+) -> MonteCarloResult:
+    """
+    Pricing quasi-Monte Carlo (Sobol brouillé, pont brownien) par réplications randomisées.
+
+    Les trajectoires sont réparties en `num_replications` réplications, chacune
+    avec un brouillage indépendant. Chaque réplication donne une estimation
+    sans biais du prix ; l'erreur standard est celle de leur moyenne.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        payoff_function: Fonction de payoff à appliquer
+        num_simulations: Nombre total de trajectoires (de préférence
+            num_replications fois une puissance de 2)
+        num_steps: Nombre de pas de temps
+        seed: Graine des brouillages (optionnel)
+        num_replications: Nombre de réplications randomisées (>= 2)
+
+    Returns:
+        Résultat avec prix actualisé et erreur standard entre réplications
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    if num_replications < 2:
+        raise ValueError("Il faut au moins deux réplications pour estimer l'erreur")
+    if num_simulations % num_replications != 0:
+        raise ValueError("Le nombre de simulations doit être un multiple du nombre de réplications")
+
+    paths_per_replication = num_simulations // num_replications
+    dates = observation_dates(payoff_function, T, num_steps)
+    replication_prices = RunningStats()
+    for replication_seed in replication_seeds(seed, num_replications):
+        ST = monte_carlo_simulation(
+            S, T, r, sigma, paths_per_replication, num_steps, replication_seed, sampler="sobol", dates=dates
+        )
+        payoffs = _evaluate_payoff(payoff_function, ST, K, S, sigma, T, dates, stream_key(replication_seed))
+        replication_prices.update(np.mean(payoffs))
+
+    discount = np.exp(-r * T)
+    return MonteCarloResult(
+        price=discount * replication_prices.mean,
+        std_error=discount * replication_prices.std_error,
+        num_paths=num_simulations
+    )
+
+
+def chunked_monte_carlo_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_function: Callable,
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+    antithetic: bool = False,
+    dtype: npt.DTypeLike = np.float64
+) -> MonteCarloResult:
+    """
+    Pricing Monte Carlo à mémoire bornée : les trajectoires sont générées et
+    évaluées bloc par bloc, seules des sommes courantes sont conservées.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        payoff_function: Fonction de payoff à appliquer
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de temps
+        seed: Graine aléatoire (optionnel)
+        max_memory_bytes: Budget mémoire pour un bloc de trajectoires
+        antithetic: Variates antithétiques ; l'erreur standard est calculée sur
+            les moyennes des paires (num_simulations doit être pair)
+        dtype: np.float64 ou np.float32 (trajectoires et payoffs ; statistiques
+            accumulées en float64)
+
+    Returns:
+        Résultat avec prix actualisé et erreur standard
+    """
+    stats = RunningStats()
+    dates = observation_dates(payoff_function, T, num_steps)
+    key = stream_key(seed)
+    start = 0
+    for block in monte_carlo_path_blocks(
+        S, T, r, sigma, num_simulations, num_steps, key, max_memory_bytes=max_memory_bytes,
+        antithetic=antithetic, dates=dates, dtype=dtype
+    ):
+        payoffs = _evaluate_payoff(payoff_function, block, K, S, sigma, T, dates, key, start)
+        start += block.shape[0]
+        del block  # Un seul bloc en mémoire pendant le tirage du suivant
+        stats.update(_estimator_samples(payoffs, antithetic))
+
+    discount = np.exp(-r * T)
+    return MonteCarloResult(
+        price=discount * stats.mean,
+        std_error=discount * stats.std_error,
+        num_paths=num_simulations
+    )
+
+
+def adaptive_monte_carlo_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_function: Callable,
+    abs_tolerance: Optional[float] = None,
+    rel_tolerance: Optional[float] = None,
+    time_budget: Optional[float] = None,
+    max_simulations: int = 10 ** 7,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    batch_size: int = _ADAPTIVE_BATCH_SIZE,
+    antithetic: bool = False,
+    dtype: npt.DTypeLike = np.float64
+) -> AdaptiveMonteCarloResult:
+    """
+    Pricing Monte Carlo adaptatif : des lots de trajectoires sont simulés
+    jusqu'à ce que l'erreur standard passe sous la tolérance, que le budget de
+    temps soit épuisé ou que `max_simulations` soit atteint.
+
+    Les lots sont tirés sur les flux à compteur (voir `pricing.rng`) : pour une
+    graine donnée, le résultat est celui de `chunked_monte_carlo_pricing` sur
+    le même nombre de trajectoires.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        payoff_function: Fonction de payoff à appliquer
+        abs_tolerance: Erreur standard absolue visée (optionnel)
+        rel_tolerance: Erreur standard visée relativement au prix (optionnel)
+        time_budget: Budget de temps en secondes (optionnel)
+        max_simulations: Nombre maximal de trajectoires
+        num_steps: Nombre de pas de temps
+        seed: Graine aléatoire (optionnel)
+        batch_size: Nombre de trajectoires par lot
+        antithetic: Variates antithétiques (batch_size et max_simulations pairs)
+        dtype: np.float64 ou np.float32 (statistiques accumulées en float64)
+
+    Returns:
+        Résultat avec prix, erreur standard, trajectoires utilisées, temps écoulé
+        et indicateur de convergence
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    _validate_simulation_params(S, T, sigma, max_simulations, num_steps)
+    _validate_antithetic(max_simulations, antithetic)
+    for tolerance in (abs_tolerance, rel_tolerance, time_budget):
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("Les tolérances et le budget de temps doivent être positifs")
+    if batch_size <= 0:
+        raise ValueError("La taille de lot doit être positive")
+    if antithetic and batch_size % 2 != 0:
+        raise ValueError("La taille de lot doit être paire avec les variates antithétiques")
+
+    dtype = _validate_dtype(dtype)
+
+    start_time = time.perf_counter()
+    discount = np.exp(-r * T)
+    dates = observation_dates(payoff_function, T, num_steps)
+    num_columns = num_steps if dates is None else dates.size
+    key = stream_key(seed)
+    stats = RunningStats()
+    num_paths = 0
+    converged = False
+    while num_paths < max_simulations:
+        stop = min(num_paths + batch_size, max_simulations)
+        Z = standard_normals(key, num_paths, stop, num_columns, dtype=dtype, antithetic=antithetic)
+        ST = _gbm_paths_inplace(Z, S, T, r, sigma, dates)
+        payoffs = _evaluate_payoff(payoff_function, ST, K, S, sigma, T, dates, key, num_paths)
+        stats.update(_estimator_samples(payoffs, antithetic))
+        num_paths = stop
+
+        error = discount * stats.std_error
+        converged = bool(
+            (abs_tolerance is not None and error <= abs_tolerance)
+            or (rel_tolerance is not None and error <= rel_tolerance * abs(discount * stats.mean))
+        )
+        if converged:
+            break
+        if time_budget is not None and time.perf_counter() - start_time >= time_budget:
+            break
+
+    return AdaptiveMonteCarloResult(
+        price=discount * stats.mean,
+        std_error=discount * stats.std_error,
+        num_paths=num_paths,
+        elapsed_time=time.perf_counter() - start_time,
+        converged=converged
+    )
+
+
+def monte_carlo_running_statistics(
+    S: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_simulations: int,
+    num_steps: int,
+    seed: Optional[int] = None,
+    block_size: int = _STEPPING_BLOCK_SIZE,
+    antithetic: bool = False
+) -> PathSet:
+    """
+    Simule les trajectoires pas à pas en ne conservant que des accumulateurs
+    par trajectoire : valeur finale, maximum, minimum, somme et somme des log.
+
+    La matrice (num_simulations, num_steps) n'est jamais construite : la mémoire
+    est en O(num_simulations). Le PathSet retourné suffit aux payoffs vanilles,
+    asiatiques et barrières de `pricing.payoffs`.
+
+    Les normales sont tirées pas par pas sur les mêmes flux à compteur que
+    `monte_carlo_simulation` : pour une même graine, les statistiques sont
+    celles des trajectoires de la matrice complète.
+
+    Args:
+        S: Prix initial du sous-jacent (doit être > 0)
+        T: Durée jusqu'à échéance en années (doit être > 0)
+        r: Taux sans risque
+        sigma: Volatilité du sous-jacent (doit être > 0)
+        num_simulations: Nombre de simulations Monte Carlo (doit être > 0)
+        num_steps: Nombre de pas de temps (doit être > 0)
+        seed: Graine pour la reproductibilité (optionnel)
+        block_size: Nombre de trajectoires avancées ensemble (arrondi à un
+            multiple de la taille des sous-flux aléatoires)
+        antithetic: Variates antithétiques (num_simulations doit être pair)
+
+    Returns:
+        PathSet construit à partir des statistiques (sans matrice)
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    _validate_antithetic(num_simulations, antithetic)
+    if block_size <= 0:
+        raise ValueError("La taille de bloc doit être positive")
+    block_size = -(-block_size // PATHS_PER_STREAM) * PATHS_PER_STREAM
+
+    key = stream_key(seed)
+    dt = T / num_steps
+    drift = (r - 0.5 * sigma ** 2) * dt
+    vol = sigma * np.sqrt(dt)
+    log_floor = np.log(1e-10)  # Même plancher que la moyenne géométrique du PathSet
+
+    terminal = np.empty(num_simulations)
+    running_max = np.empty(num_simulations)
+    running_min = np.empty(num_simulations)
+    total = np.empty(num_simulations)
+    total_log = np.empty(num_simulations)
+
+    for start in range(0, num_simulations, block_size):
+        stop = min(start + block_size, num_simulations)
+        normals = StepNormals(key, start, stop, antithetic=antithetic)
+        Z = np.empty(stop - start)
+        log_S = np.full(stop - start, np.log(S))
+        price = terminal[start:stop]
+        block_max = running_max[start:stop]
+        block_min = running_min[start:stop]
+        block_total = total[start:stop]
+        block_total_log = total_log[start:stop]
+        block_max.fill(-np.inf)
+        block_min.fill(np.inf)
+        block_total.fill(0.0)
+        block_total_log.fill(0.0)
+
+        for _ in range(num_steps):
+            normals.next(Z)
+            Z *= vol
+            Z += drift
+            log_S += Z
+            np.exp(log_S, out=price)
+            np.maximum(block_max, price, out=block_max)
+            np.minimum(block_min, price, out=block_min)
+            block_total += price
+            np.maximum(log_S, log_floor, out=Z)
+            block_total_log += Z
 
+    return PathSet.from_statistics(
+        num_steps,
+        terminal=terminal,
+        running_max=running_max,
+        running_min=running_min,
+        arithmetic_mean=total / num_steps,
+        geometric_mean=np.exp(total_log / num_steps)
+    )
@@ -0,0 +1,214 @@
+"""
+Simulation GBM multi-sous-jacents corrélés, par blocs de mémoire bornée.
+
+Les normales indépendantes de chaque date sont corrélées par un facteur L
+de la matrice de corrélation (L L^T = corrélation), calculé une seule fois :
+Cholesky si la matrice est définie positive, décomposition spectrale sinon
+(matrice semi-définie, par exemple deux sous-jacents parfaitement corrélés).
+
+Les blocs ont la forme (trajectoires, sous-jacents, dates). Pour un panier
+de 20 noms sur 252 pas, une trajectoire occupe 40 Ko : la matrice complète
+de 100 000 trajectoires dépasserait 4 Go, alors qu'un bloc reste sous le
+budget mémoire et que le payoff est réduit bloc par bloc.
+"""
+
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .monte_carlo import DEFAULT_MAX_MEMORY_BYTES, _resolve_block_size, _validate_dates
+from .rng import standard_normals, stream_key
+from .schedule import observation_dates
+from .statistics import MonteCarloResult, RunningStats
+
+
+# Tolérance sur les valeurs propres négatives d'une corrélation semi-définie positive
+_EIGENVALUE_TOLERANCE = 1e-10
+
+
+def correlation_factor(correlation: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """
+    Facteur L tel que L L^T = corrélation.
+
+    Args:
+        correlation: Matrice de corrélation (num_assets, num_assets)
+
+    Returns:
+        Facteur de Cholesky (triangulaire inférieur), ou V sqrt(Lambda) si la
+        matrice n'est que semi-définie positive
+
+    Raises:
+        ValueError: Si la matrice n'est pas une corrélation valide
+    """
+    correlation = np.asarray(correlation, dtype=np.float64)
+    if correlation.ndim != 2 or correlation.shape[0] != correlation.shape[1]:
+        raise ValueError("La matrice de corrélation doit être carrée")
+    if not np.allclose(correlation, correlation.T):
+        raise ValueError("La matrice de corrélation doit être symétrique")
+    if not np.allclose(np.diag(correlation), 1.0) or np.any(np.abs(correlation) > 1 + 1e-12):
+        raise ValueError("La matrice de corrélation doit avoir une diagonale unité et des termes dans [-1, 1]")
+
+    try:
+        return np.linalg.cholesky(correlation)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+        if eigenvalues[0] < -_EIGENVALUE_TOLERANCE:
+            raise ValueError("La matrice de corrélation doit être semi-définie positive")
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+def _validate_assets(S: npt.ArrayLike, sigma: npt.ArrayLike, correlation: npt.ArrayLike):
+    """Valide les vecteurs de spots et de volatilités et retourne (S, sigma, facteur)."""
+    S = np.atleast_1d(np.asarray(S, dtype=np.float64))
+    sigma = np.atleast_1d(np.asarray(sigma, dtype=np.float64))
+    if S.ndim != 1 or S.shape != sigma.shape:
+        raise ValueError("S et sigma doivent être des vecteurs de même taille")
+    if np.any(S <= 0) or np.any(sigma <= 0):
+        raise ValueError("Les prix initiaux et les volatilités doivent être positifs")
+    factor = correlation_factor(correlation)
+    if factor.shape[0] != S.size:
+        raise ValueError("La matrice de corrélation doit avoir une ligne par sous-jacent")
+    return S, sigma, factor
+
+
+def multi_asset_path_blocks(
+    S: npt.ArrayLike,
+    sigma: npt.ArrayLike,
+    correlation: npt.ArrayLike,
+    T: float,
+    r: float,
+    num_simulations: int,
+    num_steps: int,
+    seed: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    block_size: Optional[int] = None,
+    dates: Optional[npt.ArrayLike] = None
+) -> Iterator[npt.NDArray[np.float64]]:
+    """
+    Génère les trajectoires GBM corrélées par blocs (trajectoires, sous-jacents, dates).
+
+    Les normales des trajectoires [start, stop) sont tirées sur les flux à
+    compteur de `pricing.rng` (num_assets normales par date) : le résultat
+    ne dépend pas du découpage en blocs.
+
+    Args:
+        S: Prix initiaux (num_assets,)
+        sigma: Volatilités (num_assets,)
+        correlation: Matrice de corrélation (num_assets, num_assets)
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        num_simulations: Nombre total de simulations
+        num_steps: Nombre de pas de temps
+        seed: Graine aléatoire (optionnel)
+        max_memory_bytes: Budget mémoire de la simulation : bloc, normales et
+            coefficients (défaut : DEFAULT_MAX_MEMORY_BYTES)
+        block_size: Nombre de trajectoires par bloc (prioritaire sur max_memory_bytes)
+        dates: Dates d'observation croissantes dans ]0, T] (optionnel, voir
+            `monte_carlo_simulation`)
+
+    Yields:
+        Blocs de trajectoires (taille du bloc, num_assets, num_steps ou len(dates))
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    S, sigma, factor = _validate_assets(S, sigma, correlation)
+    if T <= 0:
+        raise ValueError("La durée T doit être positive")
+    if num_simulations <= 0 or num_steps <= 0:
+        raise ValueError("Le nombre de simulations et de pas doit être positif")
+    dates = _validate_dates(dates, T)
+    num_assets = S.size
+    num_columns = num_steps if dates is None else dates.size
+    if max_memory_bytes is None:
+        max_memory_bytes = DEFAULT_MAX_MEMORY_BYTES
+    # Le budget couvre aussi les coefficients par date (dérive et volatilité),
+    # conservés pendant toute la simulation ; la tranche de sous-flux tirée
+    # par standard_normals est comptée par _resolve_block_size
+    coefficient_bytes = 2 * num_assets * num_columns * np.dtype(np.float64).itemsize
+    block_size = _resolve_block_size(num_assets * num_columns, max_memory_bytes - coefficient_bytes, block_size,
+                                     False)
+
+    dt = np.full(num_columns, T / num_steps) if dates is None else np.diff(dates, prepend=0.0)
+    drift = np.multiply.outer(r - 0.5 * sigma ** 2, dt)  # (num_assets, num_columns)
+    volatility = np.multiply.outer(sigma, np.sqrt(dt))
+    key = stream_key(seed)
+
+    for start in range(0, num_simulations, block_size):
+        stop = min(start + block_size, num_simulations)
+        # Aucune référence locale au bloc produit : il est libéré par l'appelant
+        # avant le tirage du suivant
+        yield _correlated_block(key, start, stop, S, factor, drift, volatility)
+
+
+def _correlated_block(
+    key: npt.NDArray[np.uint64],
+    start: int,
+    stop: int,
+    S: npt.NDArray[np.float64],
+    factor: npt.NDArray[np.float64],
+    drift: npt.NDArray[np.float64],
+    volatility: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Trajectoires corrélées [start, stop) : deux matrices du bloc au plus (normales et produit par L)."""
+    num_assets, num_columns = drift.shape
+    Z = standard_normals(key, start, stop, num_columns * num_assets).reshape(stop - start, num_columns, num_assets)
+    # Corrélation des normales de chaque date : (L Z_t) pour t = 1..num_columns
+    paths = np.matmul(factor, Z.transpose(0, 2, 1))
+    del Z
+    paths *= volatility
+    paths += drift
+    np.cumsum(paths, axis=2, out=paths)
+    np.exp(paths, out=paths)
+    paths *= S[:, np.newaxis]
+    return paths
+
+
+def multi_asset_monte_carlo_pricing(
+    S: npt.ArrayLike,
+    sigma: npt.ArrayLike,
+    correlation: npt.ArrayLike,
+    K: float,
+    T: float,
+    r: float,
+    payoff_function: Callable,
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    block_size: Optional[int] = None
+) -> MonteCarloResult:
+    """
+    Pricing Monte Carlo d'un payoff multi-sous-jacents, réduit bloc par bloc.
+
+    Seules les dates déclarées par le payoff sont simulées (voir
+    `pricing.schedule`) : un panier européen est simulé en un seul pas.
+
+    Args:
+        S: Prix initiaux (num_assets,)
+        sigma: Volatilités (num_assets,)
+        correlation: Matrice de corrélation (num_assets, num_assets)
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        payoff_function: Payoff f(paths, K) sur un bloc (trajectoires, sous-jacents, dates)
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de la grille (payoffs observant chaque pas)
+        seed: Graine aléatoire (optionnel)
+        max_memory_bytes: Budget mémoire d'un bloc (optionnel)
+        block_size: Nombre de trajectoires par bloc (optionnel)
+
+    Returns:
+        Résultat avec prix actualisé et erreur standard
+    """
+    stats = RunningStats()
+    discount = np.exp(-r * T)
+    for block in multi_asset_path_blocks(
+        S, sigma, correlation, T, r, num_simulations, num_steps, seed, max_memory_bytes, block_size,
+        dates=observation_dates(payoff_function, T, num_steps)
+    ):
+        payoffs = payoff_function(block, K)
+        del block  # Un seul bloc en mémoire pendant le tirage du suivant
+        stats.update(discount * payoffs)
+    return MonteCarloResult(price=stats.mean, std_error=stats.std_error, num_paths=stats.count)
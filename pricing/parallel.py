@@ -0,0 +1,122 @@
+"""
+Pricing Monte Carlo parallèle sur un pool de processus.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .monte_carlo import (
+    _estimator_samples, _evaluate_payoff, _gbm_paths_inplace, _validate_antithetic, _validate_dtype,
+    _validate_simulation_params
+)
+from .rng import PATHS_PER_STREAM, standard_normals, stream_key
+from .schedule import observation_dates
+from .statistics import MonteCarloResult, RunningStats
+
+
+# Nombre de trajectoires par bloc de travail (multiple de la taille des
+# sous-flux aléatoires). Le découpage ne dépend pas du nombre de processus :
+# le prix est identique au bit près quel que soit `num_workers`.
+DEFAULT_PARALLEL_BLOCK_SIZE = 16 * PATHS_PER_STREAM
+
+
+def _price_block(task: Tuple) -> RunningStats:
+    """Simule les trajectoires [start, stop) sur leurs flux à compteur et retourne leurs statistiques."""
+    S, K, T, r, sigma, payoff_function, num_steps, dates, key, start, stop, antithetic, dtype = task
+    num_columns = num_steps if dates is None else dates.size
+    Z = standard_normals(key, start, stop, num_columns, dtype=dtype, antithetic=antithetic)
+    ST = _gbm_paths_inplace(Z, S, T, r, sigma, dates)
+    payoffs = _evaluate_payoff(payoff_function, ST, K, S, sigma, T, dates, key, start)
+    return RunningStats().update(_estimator_samples(payoffs, antithetic))
+
+
+def parallel_monte_carlo_pricing(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    payoff_function: Callable,
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    num_workers: Optional[int] = None,
+    block_size: int = DEFAULT_PARALLEL_BLOCK_SIZE,
+    antithetic: bool = False,
+    dtype: npt.DTypeLike = np.float64
+) -> MonteCarloResult:
+    """
+    Pricing Monte Carlo réparti sur un pool de processus.
+
+    Les trajectoires sont découpées en blocs de taille fixe. Chaque bloc est
+    tiré directement sur ses flux Philox à compteur (voir `pricing.rng`), et
+    les statistiques des blocs sont combinées exactement (moyenne et variance),
+    dans l'ordre des blocs. Pour une graine donnée, le prix est donc identique
+    au bit près quel que soit le nombre de processus. L'état aléatoire global
+    de NumPy n'est pas modifié.
+
+    Args:
+        S: Prix initial du sous-jacent
+        K: Prix d'exercice
+        T: Durée jusqu'à échéance
+        r: Taux sans risque
+        sigma: Volatilité
+        payoff_function: Fonction de payoff (doit être sérialisable par pickle,
+            par exemple une fonction définie au niveau d'un module)
+        num_simulations: Nombre de simulations
+        num_steps: Nombre de pas de temps
+        seed: Graine aléatoire (optionnel)
+        num_workers: Nombre de processus (défaut : nombre de coeurs ; 1 = sans pool)
+        block_size: Nombre de trajectoires par bloc de travail
+        antithetic: Variates antithétiques (num_simulations et block_size pairs)
+        dtype: np.float64 ou np.float32 (statistiques accumulées en float64)
+
+    Returns:
+        Résultat avec prix actualisé et erreur standard
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+    """
+    _validate_simulation_params(S, T, sigma, num_simulations, num_steps)
+    _validate_antithetic(num_simulations, antithetic)
+    dtype = _validate_dtype(dtype)
+    if block_size <= 0:
+        raise ValueError("La taille de bloc doit être positive")
+    if antithetic and block_size % 2 != 0:
+        raise ValueError("La taille de bloc doit être paire avec les variates antithétiques")
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers <= 0:
+        raise ValueError("Le nombre de processus doit être positif")
+
+    num_blocks = -(-num_simulations // block_size)
+    key = stream_key(seed)
+    dates = observation_dates(payoff_function, T, num_steps)
+    tasks = [
+        (S, K, T, r, sigma, payoff_function, num_steps, dates,
+         key, i * block_size, min((i + 1) * block_size, num_simulations), antithetic, dtype)
+        for i in range(num_blocks)
+    ]
+
+    if num_workers == 1 or num_blocks == 1:
+        block_stats: List[RunningStats] = [_price_block(task) for task in tasks]
+    else:
+        chunksize = max(1, num_blocks // (4 * num_workers))
+        with ProcessPoolExecutor(max_workers=min(num_workers, num_blocks)) as executor:
+            block_stats = list(executor.map(_price_block, tasks, chunksize=chunksize))
+
+    # Combinaison exacte, toujours dans l'ordre des blocs
+    stats = RunningStats()
+    for block in block_stats:
+        stats.merge(block)
+
+    discount = np.exp(-r * T)
+    return MonteCarloResult(
+        price=discount * stats.mean,
+        std_error=discount * stats.std_error,
+        num_paths=num_simulations
+    )
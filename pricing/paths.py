@@ -0,0 +1,392 @@
+"""
+Ensemble de trajectoires simulées avec statistiques par trajectoire mises en cache.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from .rng import SeedLike, bridge_uniforms, stream_key
+
+
+# Taille (en octets) des tranches de lignes parcourues lors du calcul groupé
+# des statistiques : chaque tranche reste en cache processeur pendant que
+# maximum, minimum et somme sont calculés.
+_SCAN_CHUNK_BYTES = 1024 ** 2
+
+# Nombre d'images de part et d'autre dans la série de survie du pont brownien
+# entre deux barrières : les termes décroissent en exp(-2 k^2 largeur^2 / variance)
+_CORRIDOR_IMAGES = 4
+
+
+class PathSet:
+    """
+    Trajectoires du sous-jacent (num_simulations, num_steps) et leurs statistiques.
+
+    Chaque statistique (valeur finale, maximum, minimum, moyennes, premiers
+    temps d'atteinte) est calculée au premier accès puis conservée : plusieurs
+    payoffs évalués sur le même PathSet ne parcourent la matrice qu'une fois.
+
+    L'objet se comporte comme la matrice pour l'indexation (`paths[:, -1]`)
+    et la conversion `np.asarray(paths)`. Un PathSet construit par
+    `from_statistics` ne contient que les statistiques, sans la matrice.
+
+    Si le prix initial, la volatilité et la maturité sont fournis, les
+    trajectoires sont complétées entre les dates de la grille (uniforme, ou
+    dates d'observation explicites) par un pont brownien (en log) :
+    probabilités de survie à une barrière continue et tirage exact des
+    extrema continus. Les uniformes de ce tirage viennent des sous-flux du
+    pont brownien de la graine de la simulation (voir `pricing.rng`), aux
+    indices de trajectoire [start, start + num_simulations) : le résultat ne
+    dépend pas du découpage en blocs.
+    """
+
+    def __init__(
+        self,
+        paths: npt.ArrayLike,
+        spot: Optional[float] = None,
+        sigma: Optional[float] = None,
+        T: Optional[float] = None,
+        dates: Optional[npt.ArrayLike] = None,
+        seed: SeedLike = None,
+        start: int = 0
+    ):
+        """
+        Initialise l'ensemble de trajectoires.
+
+        Args:
+            paths: Matrice des trajectoires (num_simulations, num_steps)
+            spot: Prix initial du sous-jacent (optionnel, pour le pont brownien)
+            sigma: Volatilité de la simulation (optionnel, pour le pont brownien)
+            T: Maturité de la simulation (optionnel, pour le pont brownien)
+            dates: Dates des colonnes (optionnel ; par défaut grille uniforme de ]0, T])
+            seed: Graine ou clé Philox de la simulation (optionnel, pour les
+                extrema continus ; None = clé tirée une fois pour ce PathSet)
+            start: Indice de la première trajectoire dans la simulation
+
+        Raises:
+            ValueError: Si la matrice n'est pas de dimension 2 ou si les dates
+                ne correspondent pas aux colonnes
+        """
+        paths = np.asarray(paths)
+        if paths.ndim != 2:
+            raise ValueError("Les trajectoires doivent être une matrice (num_simulations, num_steps)")
+        self.paths: Optional[npt.NDArray] = paths
+        self._shape = paths.shape
+        self._cache: Dict[Any, npt.NDArray] = {}
+        self.spot, self.sigma, self.T = spot, sigma, T
+        self.seed, self.start = seed, start
+        self.dates = None if dates is None else np.asarray(dates, dtype=np.float64)
+        if self.dates is not None and self.dates.shape != (paths.shape[1],):
+            raise ValueError("Il faut une date par colonne de trajectoires")
+
+    @classmethod
+    def from_statistics(
+        cls,
+        num_steps: int,
+        terminal: npt.NDArray[np.float64],
+        running_max: npt.NDArray[np.float64],
+        running_min: npt.NDArray[np.float64],
+        arithmetic_mean: npt.NDArray[np.float64],
+        geometric_mean: Optional[npt.NDArray[np.float64]] = None
+    ) -> "PathSet":
+        """
+        Construit un PathSet à partir des seules statistiques par trajectoire.
+
+        Les payoffs qui n'utilisent que ces statistiques (vanilles, asiatiques,
+        barrières) fonctionnent sans la matrice des trajectoires.
+
+        Args:
+            num_steps: Nombre de pas de temps simulés
+            terminal: Valeurs finales
+            running_max: Maxima par trajectoire
+            running_min: Minima par trajectoire
+            arithmetic_mean: Moyennes arithmétiques
+            geometric_mean: Moyennes géométriques (optionnel)
+
+        Returns:
+            PathSet sans matrice de trajectoires
+        """
+        path_set = cls.__new__(cls)
+        path_set.paths = None
+        path_set.spot = path_set.sigma = path_set.T = path_set.dates = path_set.seed = None
+        path_set.start = 0
+        path_set._shape = (len(terminal), num_steps)
+        path_set._cache = {
+            "terminal": terminal,
+            "running_max": running_max,
+            "running_min": running_min,
+            "arithmetic_mean": arithmetic_mean,
+        }
+        if geometric_mean is not None:
+            path_set._cache["geometric_mean"] = geometric_mean
+        return path_set
+
+    def _require_paths(self) -> npt.NDArray:
+        """Retourne la matrice des trajectoires ou lève une erreur si elle n'est pas conservée."""
+        if self.paths is None:
+            raise ValueError("Statistique indisponible : la matrice des trajectoires n'est pas conservée")
+        return self.paths
+
+    @property
+    def shape(self):
+        """Forme de la matrice des trajectoires."""
+        return self._shape
+
+    @property
+    def num_simulations(self) -> int:
+        """Nombre de trajectoires."""
+        return self._shape[0]
+
+    @property
+    def num_steps(self) -> int:
+        """Nombre de pas de temps."""
+        return self._shape[1]
+
+    def __getitem__(self, item):
+        return self._require_paths()[item]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self._require_paths(), dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.num_simulations
+
+    def _cached(self, key: Any, compute: Callable[[], npt.NDArray]) -> npt.NDArray:
+        """Retourne la statistique en cache ou la calcule."""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _scan(self) -> None:
+        """Calcule maximum, minimum et somme par trajectoire en un seul parcours."""
+        paths = self._require_paths()
+        n, m = paths.shape
+        running_max = np.empty(n, dtype=paths.dtype)
+        running_min = np.empty(n, dtype=paths.dtype)
+        total = np.empty(n, dtype=paths.dtype)
+        rows = max(1, _SCAN_CHUNK_BYTES // max(1, m * paths.itemsize))
+        for start in range(0, n, rows):
+            chunk = paths[start:start + rows]
+            np.max(chunk, axis=1, out=running_max[start:start + rows])
+            np.min(chunk, axis=1, out=running_min[start:start + rows])
+            np.sum(chunk, axis=1, out=total[start:start + rows])
+        self._cache["running_max"] = running_max
+        self._cache["running_min"] = running_min
+        self._cache["arithmetic_mean"] = total / m
+
+    @property
+    def terminal(self) -> npt.NDArray[np.float64]:
+        """Valeur finale de chaque trajectoire."""
+        return self._cached("terminal", lambda: self._require_paths()[:, -1])
+
+    @property
+    def running_max(self) -> npt.NDArray[np.float64]:
+        """Maximum atteint par chaque trajectoire."""
+        if "running_max" not in self._cache:
+            self._scan()
+        return self._cache["running_max"]
+
+    @property
+    def running_min(self) -> npt.NDArray[np.float64]:
+        """Minimum atteint par chaque trajectoire."""
+        if "running_min" not in self._cache:
+            self._scan()
+        return self._cache["running_min"]
+
+    @property
+    def arithmetic_mean(self) -> npt.NDArray[np.float64]:
+        """Moyenne arithmétique de chaque trajectoire."""
+        if "arithmetic_mean" not in self._cache:
+            self._scan()
+        return self._cache["arithmetic_mean"]
+
+    @property
+    def geometric_mean(self) -> npt.NDArray[np.float64]:
+        """Moyenne géométrique de chaque trajectoire (exp de la moyenne des log)."""
+        def compute():
+            # Éviter log(0) en ajoutant une petite valeur
+            return np.exp(np.mean(np.log(np.maximum(self._require_paths(), 1e-10)), axis=1))
+        return self._cached("geometric_mean", compute)
+
+    def first_hit_index(self, barrier: float, direction: str = "up") -> npt.NDArray[np.int64]:
+        """
+        Indice du premier pas où chaque trajectoire atteint la barrière.
+
+        Args:
+            barrier: Niveau de barrière
+            direction: "up" (ST >= barrier) ou "down" (ST <= barrier)
+
+        Returns:
+            Array d'indices (-1 si la barrière n'est jamais atteinte)
+
+        Raises:
+            ValueError: Si direction n'est pas "up" ou "down"
+        """
+        if direction not in ["up", "down"]:
+            raise ValueError("direction doit être 'up' ou 'down'")
+
+        def compute():
+            paths = self._require_paths()
+            hit = paths >= barrier if direction == "up" else paths <= barrier
+            index = np.argmax(hit, axis=1)
+            index[~hit[np.arange(hit.shape[0]), index]] = -1
+            return index
+        return self._cached(("first_hit", float(barrier), direction), compute)
+
+    def _bridge_chunks(self) -> Iterator[Tuple[int, npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+        """
+        Parcourt les log-trajectoires par tranches, précédées de log(spot).
+
+        Yields:
+            (indice de la première ligne, log-trajectoires (lignes, num_steps + 1),
+            variance du log sur chaque pas (num_steps,))
+        """
+        if self.spot is None or self.sigma is None or (self.T is None and self.dates is None):
+            raise ValueError("Le pont brownien nécessite spot, sigma et T dans le PathSet")
+        paths = self._require_paths()
+        n, m = paths.shape
+        dates = self.T * np.arange(1, m + 1) / m if self.dates is None else self.dates
+        variance = self.sigma ** 2 * np.diff(dates, prepend=0.0)
+        rows = max(1, _SCAN_CHUNK_BYTES // ((m + 1) * 8))
+        for start in range(0, n, rows):
+            chunk = paths[start:start + rows]
+            log_paths = np.empty((chunk.shape[0], m + 1))
+            log_paths[:, 0] = np.log(self.spot)
+            np.log(chunk, out=log_paths[:, 1:])
+            yield start, log_paths, variance
+
+    def survival_probability(self, barrier: float, direction: str = "up") -> npt.NDArray[np.float64]:
+        """
+        Probabilité que chaque trajectoire continue n'atteigne pas la barrière.
+
+        Entre deux dates de la grille, le log du sous-jacent est un pont brownien :
+        la probabilité de franchir b depuis x0 vers x1 vaut
+        exp(-2 (b - x0)(b - x1) / (sigma^2 dt)). La survie est le produit des
+        probabilités complémentaires (0 si une date de la grille atteint la barrière).
+
+        Args:
+            barrier: Niveau de barrière
+            direction: "up" (barrière supérieure) ou "down" (barrière inférieure)
+
+        Returns:
+            Probabilités de survie par trajectoire
+
+        Raises:
+            ValueError: Si direction est invalide ou si le modèle n'est pas renseigné
+        """
+        if direction not in ["up", "down"]:
+            raise ValueError("direction doit être 'up' ou 'down'")
+
+        def compute():
+            survival = np.empty(self.num_simulations)
+            log_barrier = np.log(barrier)
+            for start, log_paths, variance in self._bridge_chunks():
+                # Distances (positives) à la barrière aux deux extrémités de chaque pas
+                distance = log_barrier - log_paths if direction == "up" else log_paths - log_barrier
+                np.maximum(distance, 0.0, out=distance)
+                crossing = distance[:, :-1] * distance[:, 1:]
+                crossing *= -2.0 / variance
+                np.exp(crossing, out=crossing)
+                with np.errstate(divide="ignore"):
+                    log_survival = np.log1p(-crossing, out=crossing).sum(axis=1)
+                survival[start:start + log_paths.shape[0]] = np.exp(log_survival)
+            return survival
+        return self._cached(("survival", float(barrier), direction), compute)
+
+    def corridor_survival_probability(self, lower_barrier: float, upper_barrier: float) -> npt.NDArray[np.float64]:
+        """
+        Probabilité que chaque trajectoire continue reste entre deux barrières.
+
+        Survie du pont brownien dans le corridor par la méthode des images
+        (série tronquée à `_CORRIDOR_IMAGES` termes de chaque côté).
+
+        Args:
+            lower_barrier: Barrière inférieure
+            upper_barrier: Barrière supérieure
+
+        Returns:
+            Probabilités de survie par trajectoire
+
+        Raises:
+            ValueError: Si les barrières sont mal ordonnées ou si le modèle n'est pas renseigné
+        """
+        if lower_barrier >= upper_barrier:
+            raise ValueError("lower_barrier doit être < upper_barrier")
+
+        def compute():
+            survival = np.empty(self.num_simulations)
+            log_lower = np.log(lower_barrier)
+            width = np.log(upper_barrier) - log_lower
+            for start, log_paths, variance in self._bridge_chunks():
+                x = log_paths[:, :-1] - log_lower
+                y = log_paths[:, 1:] - log_lower
+                step = np.zeros_like(x)
+                for k in range(-_CORRIDOR_IMAGES, _CORRIDOR_IMAGES + 1):
+                    shift = k * width
+                    step += np.exp(-2.0 * shift * (shift + y - x) / variance)
+                    step -= np.exp(-2.0 * (x + shift) * (y + shift) / variance)
+                inside = (x > 0) & (x < width) & (y > 0) & (y < width)
+                np.clip(step, 0.0, 1.0, out=step)
+                step *= inside
+                survival[start:start + log_paths.shape[0]] = np.prod(step, axis=1)
+            return survival
+        return self._cached(("corridor", float(lower_barrier), float(upper_barrier)), compute)
+
+    def continuous_extremum(self, kind: str = "max") -> npt.NDArray[np.float64]:
+        """
+        Maximum (ou minimum) de chaque trajectoire continue, tiré exactement.
+
+        Conditionnellement aux extrémités x0, x1 d'un pas, le maximum du pont
+        brownien vaut (x0 + x1 + sqrt((x1 - x0)^2 - 2 sigma^2 dt log U)) / 2,
+        U uniforme ; le minimum s'obtient par symétrie. Les uniformes sont
+        celles de la trajectoire dans la simulation (graine et indice de début
+        du PathSet).
+
+        Args:
+            kind: "max" ou "min"
+
+        Returns:
+            Extrema continus par trajectoire
+
+        Raises:
+            ValueError: Si kind est invalide ou si le modèle n'est pas renseigné
+        """
+        if kind not in ["max", "min"]:
+            raise ValueError("kind doit être 'max' ou 'min'")
+
+        def compute():
+            # Sans graine, une clé est tirée une fois : max et min restent cohérents
+            self.seed = stream_key(self.seed)
+            extremum = np.empty(self.num_simulations)
+            sign = 1.0 if kind == "max" else -1.0
+            for start, log_paths, variance in self._bridge_chunks():
+                rows = log_paths.shape[0]
+                x0, x1 = log_paths[:, :-1], log_paths[:, 1:]
+                spread = np.square(x1 - x0)
+                uniforms = bridge_uniforms(self.seed, self.start + start, self.start + start + rows, x0.shape[1])
+                spread -= 2.0 * variance * np.log(uniforms, out=uniforms)
+                np.sqrt(spread, out=spread)
+                spread *= sign
+                spread += x0
+                spread += x1
+                reduce = np.max if kind == "max" else np.min
+                extremum[start:start + rows] = np.exp(0.5 * reduce(spread, axis=1))
+            return extremum
+        return self._cached(("continuous", kind), compute)
+
+
+def as_path_set(ST: Union[npt.ArrayLike, PathSet]) -> PathSet:
+    """
+    Retourne ST s'il s'agit déjà d'un PathSet, sinon l'enveloppe (sans copie).
+
+    Args:
+        ST: Matrice des trajectoires ou PathSet
+
+    Returns:
+        PathSet correspondant
+    """
+    if isinstance(ST, PathSet):
+        return ST
+    return PathSet(ST)
@@ -2,6 +2,8 @@
 from .vanilla import vanilla_call, vanilla_put
 from .barrier import barrier_knock_in, barrier_knock_out, double_barrier_knock_out
 from .asian import asian_payoff, asian_geometric_payoff, asian_strike_payoff
+from .lookback import lookback_payoff
+from .multi_asset import basket_payoff, spread_payoff, best_of_payoff
 
 __all__ = [
     'vanilla_call', 
@@ -11,5 +13,9 @@ __all__ = [
     'double_barrier_knock_out',
     'asian_payoff',
     'asian_geometric_payoff',
-    'asian_strike_payoff'
+    'asian_strike_payoff',
+    'lookback_payoff',
+    'basket_payoff',
+    'spread_payoff',
+    'best_of_payoff'
 ]
@@ -1,14 +1,17 @@
 import numpy as np
 import numpy.typing as npt
-from typing import Literal
+from typing import Literal, Union
 
+from ..paths import PathSet, as_path_set
+from ..schedule import ObservationSchedule
 
-def asian_payoff(ST: npt.NDArray[np.float64], K: float, option_type: str = "call") -> npt.NDArray[np.float64]:
+
+def asian_payoff(ST: Union[npt.NDArray[np.float64], PathSet], K: float, option_type: str = "call") -> npt.NDArray[np.float64]:
     """
     Payoff d'une option asiatique (basée sur la moyenne du sous-jacent).
     
     Args:
-        ST: Trajectoires du sous-jacent (num_simulations, num_steps)
+        ST: Trajectoires du sous-jacent (num_simulations, num_steps) ou PathSet
         K: Prix d'exercice
         option_type: "call" ou "put"
         
@@ -21,7 +24,7 @@ def asian_payoff(ST: npt.NDArray[np.float64], K: float, option_type: str = "call
     if option_type not in ["call", "put"]:
         raise ValueError("option_type doit être 'call' ou 'put'")
         
-    avg_price = np.mean(ST, axis=1)  # Calcul de la moyenne par trajectoire
+    avg_price = as_path_set(ST).arithmetic_mean  # Calcul de la moyenne par trajectoire
     
     if option_type == "call":
         return np.maximum(avg_price - K, 0)
@@ -29,12 +32,12 @@ def asian_payoff(ST: npt.NDArray[np.float64], K: float, option_type: str = "call
         return np.maximum(K - avg_price, 0)
 
 
-def asian_geometric_payoff(ST: npt.NDArray[np.float64], K: float, option_type: str = "call") -> npt.NDArray[np.float64]:
+def asian_geometric_payoff(ST: Union[npt.NDArray[np.float64], PathSet], K: float, option_type: str = "call") -> npt.NDArray[np.float64]:
     """
     Payoff d'une option asiatique géométrique (basée sur la moyenne géométrique).
     
     Args:
-        ST: Trajectoires du sous-jacent (num_simulations, num_steps)
+        ST: Trajectoires du sous-jacent (num_simulations, num_steps) ou PathSet
         K: Prix d'exercice
         option_type: "call" ou "put"
         
@@ -45,9 +48,7 @@ def asian_geometric_payoff(ST: npt.NDArray[np.float64], K: float, option_type: s
         raise ValueError("option_type doit être 'call' ou 'put'")
     
     # Moyenne géométrique = exp(moyenne des log)
-    # Éviter log(0) en ajoutant une petite valeur
-    ST_safe = np.maximum(ST, 1e-10)
-    geometric_avg = np.exp(np.mean(np.log(ST_safe), axis=1))
+    geometric_avg = as_path_set(ST).geometric_mean
     
     if option_type == "call":
         return np.maximum(geometric_avg - K, 0)
@@ -56,7 +57,7 @@ def asian_geometric_payoff(ST: npt.NDArray[np.float64], K: float, option_type: s
 
 
 def asian_strike_payoff(
-    ST: npt.NDArray[np.float64], 
+    ST: Union[npt.NDArray[np.float64], PathSet], 
     option_type: str = "call",
     fixed_strike: bool = False,
     K: float = 0.0
@@ -65,7 +66,7 @@ def asian_strike_payoff(
     Payoff d'une option asiatique à strike flottant.
     
     Args:
-        ST: Trajectoires du sous-jacent (num_simulations, num_steps)
+        ST: Trajectoires du sous-jacent (num_simulations, num_steps) ou PathSet
         option_type: "call" ou "put"
         fixed_strike: Si True, utilise K comme strike fixe
         K: Strike fixe (utilisé seulement si fixed_strike=True)
@@ -76,15 +77,22 @@ def asian_strike_payoff(
     if option_type not in ["call", "put"]:
         raise ValueError("option_type doit être 'call' ou 'put'")
     
-    final_price = ST[:, -1]
+    paths = as_path_set(ST)
+    final_price = paths.terminal
     
     if fixed_strike:
         strike = K
     else:
         # Strike flottant = moyenne arithmétique
-        strike = np.mean(ST, axis=1)
+        strike = paths.arithmetic_mean
     
     if option_type == "call":
         return np.maximum(final_price - strike, 0)
     else:  # put
         return np.maximum(strike - final_price, 0)
+
+
+# Calendriers d'observation (voir pricing.schedule)
+asian_payoff.schedule = ObservationSchedule.fixings()
+asian_geometric_payoff.schedule = ObservationSchedule.fixings()
+asian_strike_payoff.schedule = ObservationSchedule.fixings()
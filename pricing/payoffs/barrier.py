@@ -2,41 +2,59 @@ import numpy as np
 import numpy.typing as npt
 from typing import Callable, Union
 
+from ..paths import PathSet, as_path_set
+from ..schedule import ObservationSchedule
+
+
+def _validate_monitoring(monitoring: str) -> None:
+    """Vérifie le mode d'observation de la barrière."""
+    if monitoring not in ["discrete", "continuous"]:
+        raise ValueError("monitoring doit être 'discrete' ou 'continuous'")
+
 
 def barrier_knock_out(
-    ST: npt.NDArray[np.float64], 
+    ST: Union[npt.NDArray[np.float64], PathSet], 
     K: float, 
     barrier: float, 
     payoff_sousjacent: Callable,
-    barrier_type: str = "up"
+    barrier_type: str = "up",
+    monitoring: str = "discrete"
 ) -> npt.NDArray[np.float64]:
     """
     Payoff d'une option knock-out (annulée si barrière atteinte).
     
     Args:
-        ST: Trajectoires du sous-jacent (num_simulations, num_steps)
+        ST: Trajectoires du sous-jacent (num_simulations, num_steps) ou PathSet
         K: Prix d'exercice
         barrier: Niveau de barrière
         payoff_sousjacent: Fonction de payoff sous-jacent
         barrier_type: "up" pour up-and-out, "down" pour down-and-out
+        monitoring: "discrete" (dates de la grille) ou "continuous" (pont brownien
+            entre les dates : le payoff est pondéré par la probabilité de survie ;
+            ST doit être un PathSet renseignant spot, sigma et T)
         
     Returns:
         Array des payoffs (0 si barrière atteinte)
         
     Raises:
-        ValueError: Si barrier_type n'est pas "up" ou "down"
+        ValueError: Si barrier_type ou monitoring est invalide
     """
     if barrier_type not in ["up", "down"]:
         raise ValueError("barrier_type doit être 'up' ou 'down'")
+    _validate_monitoring(monitoring)
     
-    # Calcul vectorisé pour déterminer les trajectoires valides
+    paths = as_path_set(ST)
+    if monitoring == "continuous":
+        return payoff_sousjacent(paths.terminal, K) * paths.survival_probability(barrier, barrier_type)
+
+    # Extrema par trajectoire (mis en cache) pour déterminer les trajectoires valides
     if barrier_type == "up":
-        valid_paths = np.all(ST < barrier, axis=1)  # Up-and-out (strict inequality)
+        valid_paths = paths.running_max < barrier  # Up-and-out (strict inequality)
     else:  # down
-        valid_paths = np.all(ST > barrier, axis=1)  # Down-and-out (strict inequality)
+        valid_paths = paths.running_min > barrier  # Down-and-out (strict inequality)
     
     # Calcul du payoff standard sur la valeur finale
-    final_prices = ST[:, -1]
+    final_prices = paths.terminal
     payoffs = payoff_sousjacent(final_prices, K)
     
     # Application de la condition de barrière
@@ -44,39 +62,46 @@ def barrier_knock_out(
 
 
 def barrier_knock_in(
-    ST: npt.NDArray[np.float64], 
+    ST: Union[npt.NDArray[np.float64], PathSet], 
     K: float, 
     barrier: float, 
     payoff_sousjacent: Callable,
-    barrier_type: str = "up"
+    barrier_type: str = "up",
+    monitoring: str = "discrete"
 ) -> npt.NDArray[np.float64]:
     """
     Payoff d'une option knock-in (activée si barrière atteinte).
     
     Args:
-        ST: Trajectoires du sous-jacent (num_simulations, num_steps)
+        ST: Trajectoires du sous-jacent (num_simulations, num_steps) ou PathSet
         K: Prix d'exercice
         barrier: Niveau de barrière
         payoff_sousjacent: Fonction de payoff sous-jacent
         barrier_type: "up" pour up-and-in, "down" pour down-and-in
+        monitoring: "discrete" ou "continuous" (voir `barrier_knock_out`)
         
     Returns:
         Array des payoffs (0 si barrière non atteinte)
         
     Raises:
-        ValueError: Si barrier_type n'est pas "up" ou "down"
+        ValueError: Si barrier_type ou monitoring est invalide
     """
     if barrier_type not in ["up", "down"]:
         raise ValueError("barrier_type doit être 'up' ou 'down'")
+    _validate_monitoring(monitoring)
     
-    # Calcul vectorisé pour déterminer les trajectoires activées
+    paths = as_path_set(ST)
+    if monitoring == "continuous":
+        return payoff_sousjacent(paths.terminal, K) * (1.0 - paths.survival_probability(barrier, barrier_type))
+
+    # Extrema par trajectoire (mis en cache) pour déterminer les trajectoires activées
     if barrier_type == "up":
-        activated_paths = np.any(ST >= barrier, axis=1)  # Up-and-in (>= barrier)
+        activated_paths = paths.running_max >= barrier  # Up-and-in (>= barrier)
     else:  # down
-        activated_paths = np.any(ST <= barrier, axis=1)  # Down-and-in (<= barrier)
+        activated_paths = paths.running_min <= barrier  # Down-and-in (<= barrier)
     
     # Calcul du payoff standard sur la valeur finale
-    final_prices = ST[:, -1]
+    final_prices = paths.terminal
     payoffs = payoff_sousjacent(final_prices, K)
     
     # Application de la condition de barrière
@@ -84,33 +109,47 @@ def barrier_knock_in(
 
 
 def double_barrier_knock_out(
-    ST: npt.NDArray[np.float64], 
+    ST: Union[npt.NDArray[np.float64], PathSet], 
     K: float, 
     lower_barrier: float,
     upper_barrier: float, 
-    payoff_sousjacent: Callable
+    payoff_sousjacent: Callable,
+    monitoring: str = "discrete"
 ) -> npt.NDArray[np.float64]:
     """
     Payoff d'une option double knock-out (annulée si une des barrières est atteinte).
     
     Args:
-        ST: Trajectoires du sous-jacent (num_simulations, num_steps)
+        ST: Trajectoires du sous-jacent (num_simulations, num_steps) ou PathSet
         K: Prix d'exercice
         lower_barrier: Barrière inférieure
         upper_barrier: Barrière supérieure
         payoff_sousjacent: Fonction de payoff sous-jacent
+        monitoring: "discrete" ou "continuous" (voir `barrier_knock_out`)
         
     Returns:
         Array des payoffs (0 si une barrière est atteinte)
     """
     if lower_barrier >= upper_barrier:
         raise ValueError("lower_barrier doit être < upper_barrier")
+    _validate_monitoring(monitoring)
     
+    paths = as_path_set(ST)
+    if monitoring == "continuous":
+        survival = paths.corridor_survival_probability(lower_barrier, upper_barrier)
+        return payoff_sousjacent(paths.terminal, K) * survival
+
     # Les trajectoires sont valides si elles restent dans le corridor
-    valid_paths = np.all((ST >= lower_barrier) & (ST <= upper_barrier), axis=1)
+    valid_paths = (paths.running_min >= lower_barrier) & (paths.running_max <= upper_barrier)
     
     # Calcul du payoff standard sur la valeur finale
-    final_prices = ST[:, -1]
+    final_prices = paths.terminal
     payoffs = payoff_sousjacent(final_prices, K)
     
     return payoffs * valid_paths
+
+
+# Calendriers d'observation (voir pricing.schedule)
+barrier_knock_out.schedule = ObservationSchedule.monitoring()
+barrier_knock_in.schedule = ObservationSchedule.monitoring()
+double_barrier_knock_out.schedule = ObservationSchedule.monitoring()
@@ -0,0 +1,61 @@
+import numpy as np
+import numpy.typing as npt
+from typing import Union
+
+from ..paths import PathSet, as_path_set
+from ..schedule import ObservationSchedule
+
+
+def lookback_payoff(
+    ST: Union[npt.NDArray[np.float64], PathSet],
+    option_type: str = "call",
+    fixed_strike: bool = False,
+    K: float = 0.0,
+    monitoring: str = "discrete"
+) -> npt.NDArray[np.float64]:
+    """
+    Payoff d'une option lookback (basée sur le maximum ou le minimum de la trajectoire).
+
+    Strike flottant : call = ST - min, put = max - ST.
+    Strike fixe : call = max(max - K, 0), put = max(K - min, 0).
+
+    Args:
+        ST: Trajectoires du sous-jacent (num_simulations, num_steps) ou PathSet
+        option_type: "call" ou "put"
+        fixed_strike: Si True, utilise K comme strike fixe
+        K: Strike fixe (utilisé seulement si fixed_strike=True)
+        monitoring: "discrete" (extrema sur la grille) ou "continuous" (extrema
+            du pont brownien tirés exactement ; ST doit être un PathSet
+            renseignant spot, sigma et T ; les uniformes du tirage viennent
+            de la graine du PathSet)
+
+    Returns:
+        Array des payoffs pour chaque simulation
+
+    Raises:
+        ValueError: Si option_type ou monitoring est invalide
+    """
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    if monitoring not in ["discrete", "continuous"]:
+        raise ValueError("monitoring doit être 'discrete' ou 'continuous'")
+
+    paths = as_path_set(ST)
+    # Un call utilise le minimum (strike flottant) ou le maximum (strike fixe), un put l'inverse
+    use_max = (option_type == "call") == fixed_strike
+    if monitoring == "continuous":
+        extremum = paths.continuous_extremum("max" if use_max else "min")
+    else:
+        extremum = paths.running_max if use_max else paths.running_min
+
+    if fixed_strike:
+        if option_type == "call":
+            return np.maximum(extremum - K, 0)
+        return np.maximum(K - extremum, 0)
+    if option_type == "call":
+        return paths.terminal - extremum
+    return extremum - paths.terminal
+
+
+# Calendrier d'observation (voir pricing.schedule)
+lookback_payoff.schedule = ObservationSchedule.monitoring()
@@ -0,0 +1,113 @@
+import numpy as np
+import numpy.typing as npt
+from typing import Optional
+
+from ..schedule import TERMINAL
+
+
+def _terminal_values(ST: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Valeurs finales (num_simulations, num_assets) de trajectoires multi-sous-jacents."""
+    ST = np.asarray(ST)
+    if ST.ndim != 3:
+        raise ValueError("Les trajectoires doivent avoir la forme (num_simulations, num_assets, num_steps)")
+    return ST[:, :, -1]
+
+
+def basket_payoff(
+    ST: npt.NDArray[np.float64],
+    K: float,
+    weights: Optional[npt.ArrayLike] = None,
+    option_type: str = "call"
+) -> npt.NDArray[np.float64]:
+    """
+    Payoff d'une option sur panier (moyenne pondérée des valeurs finales).
+
+    Args:
+        ST: Trajectoires (num_simulations, num_assets, num_steps)
+        K: Prix d'exercice
+        weights: Poids des sous-jacents (optionnel, équipondéré par défaut)
+        option_type: "call" ou "put"
+
+    Returns:
+        Array des payoffs pour chaque simulation
+
+    Raises:
+        ValueError: Si option_type ou les poids sont invalides
+    """
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    terminal = _terminal_values(ST)
+    if weights is None:
+        weights = np.full(terminal.shape[1], 1.0 / terminal.shape[1])
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (terminal.shape[1],):
+        raise ValueError("Il faut un poids par sous-jacent")
+
+    basket = terminal @ weights
+    if option_type == "call":
+        return np.maximum(basket - K, 0)
+    else:  # put
+        return np.maximum(K - basket, 0)
+
+
+def spread_payoff(ST: npt.NDArray[np.float64], K: float, option_type: str = "call") -> npt.NDArray[np.float64]:
+    """
+    Payoff d'une option sur spread entre les deux premiers sous-jacents.
+
+    Call = max(S1 - S2 - K, 0), put = max(K - (S1 - S2), 0).
+
+    Args:
+        ST: Trajectoires (num_simulations, num_assets, num_steps), num_assets >= 2
+        K: Prix d'exercice du spread
+        option_type: "call" ou "put"
+
+    Returns:
+        Array des payoffs pour chaque simulation
+
+    Raises:
+        ValueError: Si option_type est invalide ou s'il y a moins de deux sous-jacents
+    """
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    terminal = _terminal_values(ST)
+    if terminal.shape[1] < 2:
+        raise ValueError("Une option sur spread nécessite au moins deux sous-jacents")
+
+    spread = terminal[:, 0] - terminal[:, 1]
+    if option_type == "call":
+        return np.maximum(spread - K, 0)
+    else:  # put
+        return np.maximum(K - spread, 0)
+
+
+def best_of_payoff(ST: npt.NDArray[np.float64], K: float, option_type: str = "call") -> npt.NDArray[np.float64]:
+    """
+    Payoff d'une option best-of (meilleur sous-jacent pour le détenteur).
+
+    Call = max(max_i S_i - K, 0), put = max(K - min_i S_i, 0).
+
+    Args:
+        ST: Trajectoires (num_simulations, num_assets, num_steps)
+        K: Prix d'exercice
+        option_type: "call" ou "put"
+
+    Returns:
+        Array des payoffs pour chaque simulation
+
+    Raises:
+        ValueError: Si option_type est invalide
+    """
+    if option_type not in ["call", "put"]:
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    terminal = _terminal_values(ST)
+
+    if option_type == "call":
+        return np.maximum(terminal.max(axis=1) - K, 0)
+    else:  # put
+        return np.maximum(K - terminal.min(axis=1), 0)
+
+
+# Calendriers d'observation (voir pricing.schedule)
+basket_payoff.schedule = TERMINAL
+spread_payoff.schedule = TERMINAL
+best_of_payoff.schedule = TERMINAL
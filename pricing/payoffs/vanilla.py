@@ -1,30 +1,43 @@
 import numpy as np
 import numpy.typing as npt
+from typing import Union
 
+from ..paths import PathSet
+from ..schedule import TERMINAL
 
-def vanilla_call(ST: npt.NDArray[np.float64], K: float) -> npt.NDArray[np.float64]:
+
+def vanilla_call(ST: Union[npt.NDArray[np.float64], PathSet], K: float) -> npt.NDArray[np.float64]:
     """
     Payoff d'une option CALL européenne.
     
     Args:
-        ST: Prix du sous-jacent à l'échéance
+        ST: Prix du sous-jacent à l'échéance (ou PathSet, dont la valeur finale est utilisée)
         K: Prix d'exercice
         
     Returns:
         Payoff max(ST - K, 0)
     """
+    if isinstance(ST, PathSet):
+        ST = ST.terminal
     return np.maximum(ST - K, 0)
 
 
-def vanilla_put(ST: npt.NDArray[np.float64], K: float) -> npt.NDArray[np.float64]:
+def vanilla_put(ST: Union[npt.NDArray[np.float64], PathSet], K: float) -> npt.NDArray[np.float64]:
     """
     Payoff d'une option PUT européenne.
     
     Args:
-        ST: Prix du sous-jacent à l'échéance
+        ST: Prix du sous-jacent à l'échéance (ou PathSet, dont la valeur finale est utilisée)
         K: Prix d'exercice
         
     Returns:
         Payoff max(K - ST, 0)
     """
+    if isinstance(ST, PathSet):
+        ST = ST.terminal
     return np.maximum(K - ST, 0)
+
+
+# Calendriers d'observation (voir pricing.schedule)
+vanilla_call.schedule = TERMINAL
+vanilla_put.schedule = TERMINAL
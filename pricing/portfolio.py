@@ -0,0 +1,206 @@
+"""
+Pricing d'un portefeuille de trades par groupes de simulations partagées.
+
+Les trades sont regroupés par sous-jacent (spot, taux, volatilité) et par
+grille de temps (maturité, pas) : chaque groupe est simulé une seule fois,
+bloc par bloc, et tous ses payoffs sont évalués sur les mêmes trajectoires
+(un PathSet par bloc : extrema et moyennes sont calculés une fois pour tous
+les trades du groupe). Un groupe ne contenant que des vanilles est simulé
+en un seul pas.
+
+Tous les groupes utilisent la même graine (nombres aléatoires communs) :
+deux maturités d'un même sous-jacent sont simulées avec les mêmes normales.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from .monte_carlo import (
+    _estimator_samples, _validate_antithetic, monte_carlo_path_blocks, monte_carlo_simulation
+)
+from .paths import PathSet
+from .payoffs.asian import asian_payoff
+from .payoffs.barrier import barrier_knock_in, barrier_knock_out
+from .payoffs.vanilla import vanilla_call, vanilla_put
+from .qmc import SAMPLERS
+from .statistics import RunningStats
+from .store import PathStore
+
+
+# Description d'un trade : les champs absents d'une spécification prennent
+# les valeurs de TRADE_DEFAULTS
+TRADE_DTYPE = np.dtype([
+    ("trade_id", "U32"),
+    ("underlying", "U32"),
+    ("payoff_type", "U8"),   # "vanilla", "asian" ou "barrier"
+    ("option_type", "U4"),   # "call" ou "put"
+    ("K", "f8"),
+    ("T", "f8"),
+    ("barrier", "f8"),       # NaN sans barrière
+    ("barrier_type", "U4"),  # "up" ou "down"
+    ("knock", "U3"),         # "out" ou "in"
+])
+
+TRADE_DEFAULTS = {"option_type": "call", "barrier": np.nan, "barrier_type": "up", "knock": "out"}
+
+# Colonnes du résultat
+PORTFOLIO_RESULT_DTYPE = np.dtype([
+    ("trade_id", "U32"),
+    ("underlying", "U32"),
+    ("payoff_type", "U8"),
+    ("price", "f8"),
+    ("std_error", "f8"),
+    ("num_paths", "i8"),
+    ("group", "i8"),
+])
+
+PAYOFF_TYPES = ("vanilla", "asian", "barrier")
+
+
+def trades_array(trades: Union[npt.NDArray, Sequence[Mapping[str, Any]]]) -> npt.NDArray:
+    """
+    Convertit un portefeuille en array structuré TRADE_DTYPE et le valide.
+
+    Args:
+        trades: Array structuré ou liste de dictionnaires (champs de TRADE_DTYPE ;
+            trade_id vaut par défaut la position du trade)
+
+    Returns:
+        Array structuré (num_trades,)
+
+    Raises:
+        ValueError: Si un champ obligatoire manque ou si un trade est invalide
+    """
+    if isinstance(trades, np.ndarray) and trades.dtype.names is not None:
+        book = np.zeros(trades.shape[0], dtype=TRADE_DTYPE)
+        book["trade_id"] = np.arange(trades.shape[0]).astype(str)
+        for name, default in TRADE_DEFAULTS.items():
+            book[name] = default
+        for name in trades.dtype.names:
+            book[name] = trades[name]
+        missing = [name for name in ("underlying", "payoff_type", "K", "T") if name not in trades.dtype.names]
+    else:
+        book = np.zeros(len(trades), dtype=TRADE_DTYPE)
+        missing = []
+        for i, spec in enumerate(trades):
+            spec = {"trade_id": str(i), **TRADE_DEFAULTS, **spec}
+            missing += [name for name in ("underlying", "payoff_type", "K", "T") if name not in spec]
+            if not missing:
+                book[i] = tuple(spec[name] for name in TRADE_DTYPE.names)
+    if missing:
+        raise ValueError(f"Champs obligatoires manquants : {sorted(set(missing))}")
+
+    if not np.all(np.isin(book["payoff_type"], PAYOFF_TYPES)):
+        raise ValueError("payoff_type doit être 'vanilla', 'asian' ou 'barrier'")
+    if not np.all(np.isin(book["option_type"], ["call", "put"])):
+        raise ValueError("option_type doit être 'call' ou 'put'")
+    if np.any(book["T"] <= 0) or np.any(book["K"] < 0):
+        raise ValueError("Les maturités doivent être positives et les strikes positifs ou nuls")
+    barriers = book[book["payoff_type"] == "barrier"]
+    if np.any(~(barriers["barrier"] > 0)):
+        raise ValueError("Les trades barrière nécessitent une barrière positive")
+    if not np.all(np.isin(barriers["barrier_type"], ["up", "down"])):
+        raise ValueError("barrier_type doit être 'up' ou 'down'")
+    if not np.all(np.isin(barriers["knock"], ["in", "out"])):
+        raise ValueError("knock doit être 'in' ou 'out'")
+    return book
+
+
+def _trade_payoff(trade: np.void, paths: PathSet) -> npt.NDArray[np.float64]:
+    """Payoff non actualisé d'un trade sur un bloc de trajectoires."""
+    option_type = str(trade["option_type"])
+    payoff_sousjacent = vanilla_call if option_type == "call" else vanilla_put
+    if trade["payoff_type"] == "vanilla":
+        return payoff_sousjacent(paths, trade["K"])
+    if trade["payoff_type"] == "asian":
+        return asian_payoff(paths, trade["K"], option_type)
+    barrier_payoff = barrier_knock_out if trade["knock"] == "out" else barrier_knock_in
+    return barrier_payoff(paths, trade["K"], trade["barrier"], payoff_sousjacent, str(trade["barrier_type"]))
+
+
+def _group_trades(book: npt.NDArray, market: Mapping[str, Mapping[str, float]]) -> Dict[Tuple, List[int]]:
+    """Indices des trades par (spot, taux, volatilité, maturité), dans l'ordre d'apparition."""
+    groups: Dict[Tuple, List[int]] = {}
+    for i, trade in enumerate(book):
+        underlying = str(trade["underlying"])
+        if underlying not in market:
+            raise ValueError(f"Sous-jacent inconnu : {underlying}")
+        params = market[underlying]
+        key = (float(params["S"]), float(params["r"]), float(params["sigma"]), float(trade["T"]))
+        groups.setdefault(key, []).append(i)
+    return groups
+
+
+def price_portfolio(
+    trades: Union[npt.NDArray, Sequence[Mapping[str, Any]]],
+    market: Mapping[str, Mapping[str, float]],
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    seed: Optional[int] = None,
+    antithetic: bool = False,
+    sampler: str = "pseudo",
+    max_memory_bytes: Optional[int] = None,
+    path_store: Optional[PathStore] = None
+) -> npt.NDArray:
+    """
+    Prix de tous les trades d'un portefeuille, une simulation par groupe de trades.
+
+    Args:
+        trades: Array structuré TRADE_DTYPE ou liste de dictionnaires
+            (voir `trades_array`)
+        market: Paramètres par sous-jacent : {nom: {"S": ..., "r": ..., "sigma": ...}}
+        num_simulations: Nombre de simulations par groupe
+        num_steps: Nombre de pas de la grille (groupes avec payoffs dépendant du chemin)
+        seed: Graine aléatoire, commune à tous les groupes (optionnel)
+        antithetic: Variates antithétiques (num_simulations doit être pair)
+        sampler: "pseudo" (simulation par blocs) ou "sobol"
+        max_memory_bytes: Budget mémoire d'un bloc de trajectoires (optionnel)
+        path_store: Stockage des trajectoires sur disque (optionnel, voir
+            `pricing.store.PathStore` ; seed obligatoire)
+
+    Returns:
+        Array structuré PORTFOLIO_RESULT_DTYPE, une ligne par trade dans
+        l'ordre du portefeuille ; la colonne group indique la simulation utilisée
+
+    Raises:
+        ValueError: Si le portefeuille ou les paramètres sont invalides
+    """
+    book = trades_array(trades)
+    _validate_antithetic(num_simulations, antithetic)
+    if sampler not in SAMPLERS:
+        raise ValueError("sampler doit être 'pseudo' ou 'sobol'")
+
+    result = np.zeros(book.size, dtype=PORTFOLIO_RESULT_DTYPE)
+    for name in ("trade_id", "underlying", "payoff_type"):
+        result[name] = book[name]
+
+    for group, ((S, r, sigma, T), indices) in enumerate(_group_trades(book, market).items()):
+        # Vanilles seules : un saut exact jusqu'à maturité suffit
+        terminal_only = bool(np.all(book["payoff_type"][indices] == "vanilla"))
+        dates = np.array([T]) if terminal_only else None
+        simulation = dict(seed=seed, antithetic=antithetic, dates=dates)
+
+        if path_store is not None:
+            blocks = [path_store.load_or_simulate(S, T, r, sigma, num_simulations, num_steps, sampler=sampler,
+                                                  **simulation)]
+        elif sampler == "sobol":
+            blocks = [monte_carlo_simulation(S, T, r, sigma, num_simulations, num_steps, sampler="sobol",
+                                             **simulation)]
+        else:
+            blocks = monte_carlo_path_blocks(S, T, r, sigma, num_simulations, num_steps,
+                                             max_memory_bytes=max_memory_bytes, **simulation)
+
+        stats = {i: RunningStats() for i in indices}
+        discount = np.exp(-r * T)
+        for block in blocks:
+            paths = PathSet(block, spot=S, sigma=sigma, T=T, dates=dates)
+            for i in indices:
+                stats[i].update(_estimator_samples(discount * _trade_payoff(book[i], paths), antithetic))
+
+        result["price"][indices] = [stats[i].mean for i in indices]
+        result["std_error"][indices] = [stats[i].std_error for i in indices]
+        result["num_paths"][indices] = num_simulations
+        result["group"][indices] = group
+    return result
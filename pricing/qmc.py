@@ -0,0 +1,141 @@
+"""
+Points quasi-aléatoires (Sobol brouillé) et construction par pont brownien.
+
+La dimension k du point de Sobol alimente la k-ième normale du pont
+brownien : la première fixe W(T), les suivantes les points milieux
+successifs. Les premières dimensions, les mieux réparties, portent ainsi
+l'essentiel de la variance de la trajectoire.
+"""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+
+# Échantillonneurs disponibles pour la génération des normales
+SAMPLERS = ("pseudo", "sobol")
+
+
+def _bridge_plan(num_steps: int) -> Tuple[npt.NDArray[np.int64], ...]:
+    """
+    Ordre de construction du pont brownien sur les dates 1..num_steps (en pas).
+
+    Returns:
+        (indice construit, borne gauche, borne droite, poids gauche, poids droit,
+        écart-type conditionnel) pour chaque normale. Une borne gauche de -1
+        désigne W(0) = 0.
+    """
+    times = np.arange(1, num_steps + 1, dtype=np.float64)
+    filled = np.zeros(num_steps, dtype=bool)
+    index = np.empty(num_steps, dtype=np.int64)
+    left = np.full(num_steps, -1, dtype=np.int64)
+    right = np.full(num_steps, -1, dtype=np.int64)
+    left_weight = np.zeros(num_steps)
+    right_weight = np.zeros(num_steps)
+    std_dev = np.empty(num_steps)
+
+    # Première normale : point final W(T)
+    filled[-1] = True
+    index[0] = num_steps - 1
+    std_dev[0] = np.sqrt(times[-1])
+
+    j = 0
+    for i in range(1, num_steps):
+        # Premier intervalle [j, k) non construit, coupé en son milieu l
+        while filled[j]:
+            j += 1
+        k = j
+        while not filled[k]:
+            k += 1
+        l = j + (k - 1 - j) // 2
+        filled[l] = True
+        t_left = times[j - 1] if j > 0 else 0.0
+        index[i], left[i], right[i] = l, j - 1, k
+        left_weight[i] = (times[k] - times[l]) / (times[k] - t_left)
+        right_weight[i] = (times[l] - t_left) / (times[k] - t_left)
+        std_dev[i] = np.sqrt((times[l] - t_left) * (times[k] - times[l]) / (times[k] - t_left))
+        j = k + 1 if k + 1 < num_steps else 0
+    return index, left, right, left_weight, right_weight, std_dev
+
+
+def brownian_bridge_normals(Z: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Transforme des normales ordonnées par importance en incréments browniens normalisés.
+
+    La colonne 0 de Z fixe le point final, les colonnes suivantes les points
+    milieux du pont. Le résultat a la même loi que Z (normales indépendantes)
+    et s'utilise directement comme incréments W(t_i) - W(t_{i-1}) divisés par sqrt(dt).
+
+    Args:
+        Z: Normales (num_simulations, num_steps)
+
+    Returns:
+        Incréments normalisés (num_simulations, num_steps)
+    """
+    num_steps = Z.shape[1]
+    index, left, right, left_weight, right_weight, std_dev = _bridge_plan(num_steps)
+
+    # Mouvement brownien en unités de pas (dt = 1), construit colonne par colonne
+    W = np.empty_like(Z)
+    W[:, index[0]] = std_dev[0] * Z[:, 0]
+    for i in range(1, num_steps):
+        column = W[:, index[i]]
+        np.multiply(W[:, right[i]], right_weight[i], out=column)
+        if left[i] >= 0:
+            column += left_weight[i] * W[:, left[i]]
+        column += std_dev[i] * Z[:, i]
+
+    W[:, 1:] -= W[:, :-1].copy()
+    return W
+
+
+def sobol_normals(
+    num_simulations: int,
+    num_steps: int,
+    seed: Union[None, int, np.random.SeedSequence] = None,
+    brownian_bridge: bool = True
+) -> npt.NDArray[np.float64]:
+    """
+    Normales quasi-aléatoires issues d'une suite de Sobol brouillée.
+
+    Le brouillage (Owen) est tiré de la graine : deux graines différentes
+    donnent deux réplications indépendantes et sans biais. La suite est la
+    mieux équilibrée quand num_simulations est une puissance de 2.
+
+    Args:
+        num_simulations: Nombre de trajectoires (points de Sobol)
+        num_steps: Nombre de pas de temps (dimension des points)
+        seed: Graine du brouillage (optionnel)
+        brownian_bridge: Construction par pont brownien (sinon incréments dans l'ordre)
+
+    Returns:
+        Normales (num_simulations, num_steps)
+
+    Raises:
+        ValueError: Si la dimension dépasse celle de la suite de Sobol
+    """
+    if num_steps > qmc.Sobol.MAXDIM:
+        raise ValueError(f"La suite de Sobol est limitée à {qmc.Sobol.MAXDIM} pas de temps")
+    sampler = qmc.Sobol(d=num_steps, scramble=True, seed=np.random.default_rng(seed))
+    U = sampler.random(num_simulations)
+    # Les points brouillés ne valent jamais exactement 0 ; garde-fou contre ndtri(0) = -inf
+    np.clip(U, np.finfo(np.float64).tiny, None, out=U)
+    Z = ndtri(U, out=U)
+    return brownian_bridge_normals(Z) if brownian_bridge else Z
+
+
+def replication_seeds(seed: Optional[int], num_replications: int) -> List[np.random.SeedSequence]:
+    """
+    Graines indépendantes des réplications randomisées.
+
+    Args:
+        seed: Graine principale (optionnel)
+        num_replications: Nombre de réplications
+
+    Returns:
+        Liste de `SeedSequence` enfants
+    """
+    return np.random.SeedSequence(seed).spawn(num_replications)
@@ -0,0 +1,281 @@
+"""
+Flux aléatoires à compteur (Philox) avec accès direct à n'importe quelle plage de trajectoires.
+
+Les trajectoires sont regroupées par sous-flux de `PATHS_PER_STREAM` trajectoires.
+Le sous-flux i utilise le générateur Philox de clé dérivée de la graine et dont
+le mot de poids fort du compteur vaut i : les sous-flux sont disjoints et
+chacun se construit directement, sans tirer les précédents.
+
+Dans un sous-flux, les normales sont tirées pas de temps par pas de temps
+(un vecteur de `PATHS_PER_STREAM` normales par pas). Les moteurs matriciel,
+par blocs et pas à pas consomment donc exactement les mêmes normales pour une
+même graine. L'état aléatoire global de NumPy n'est jamais modifié.
+
+Un sous-flux est tiré par tranches de pas (`stream_slice_steps`) : seule une
+tranche de taille bornée est en mémoire, même pour un bloc de quelques
+trajectoires. La méthode ziggurat consomme un nombre variable de mots
+aléatoires par normale : on ne peut pas sauter aux trajectoires demandées,
+et un bloc plus petit qu'un sous-flux tire le sous-flux entier.
+
+Les uniformes du pont brownien (extrema continus, voir `PathSet`) sont tirées
+sur une seconde famille de sous-flux de la même clé, disjointe de celle des
+normales : elles dépendent de la trajectoire, pas du découpage en blocs.
+
+En mode antithétique, les trajectoires 2k et 2k + 1 utilisent les normales
+Z_k et -Z_k, où Z_k est la k-ième trajectoire du tirage standard : seule la
+moitié des normales est tirée et chaque paire reste dans un même bloc.
+"""
+
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+
+# Algorithme du générateur (utilisé dans les métadonnées des trajectoires)
+RNG_ALGORITHM = "Philox"
+
+# Nombre de trajectoires par sous-flux
+PATHS_PER_STREAM = 1024
+
+# Taille (en octets) d'une tranche de pas tirée d'un sous-flux
+_STREAM_SLICE_BYTES = 64 * 1024
+
+# Familles de sous-flux (troisième mot du compteur Philox)
+_NORMAL_FAMILY = 0
+_BRIDGE_FAMILY = 1
+
+SeedLike = Union[None, int, npt.NDArray[np.uint64]]
+
+
+def stream_key(seed: SeedLike = None) -> npt.NDArray[np.uint64]:
+    """
+    Dérive la clé Philox (2 mots de 64 bits) d'une graine.
+
+    Args:
+        seed: Graine entière, SeedSequence (réplications QMC), clé déjà dérivée,
+            ou None (entropie du système)
+
+    Returns:
+        Clé Philox
+    """
+    if isinstance(seed, np.ndarray):
+        return seed
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.generate_state(2, dtype=np.uint64)
+
+
+def stream_generator(
+    key: npt.NDArray[np.uint64],
+    stream_index: int,
+    family: int = _NORMAL_FAMILY
+) -> np.random.Generator:
+    """
+    Générateur du sous-flux `stream_index` (trajectoires
+    [stream_index * PATHS_PER_STREAM, (stream_index + 1) * PATHS_PER_STREAM)).
+
+    Args:
+        key: Clé Philox (voir `stream_key`)
+        stream_index: Indice du sous-flux
+        family: Famille de sous-flux (normales des trajectoires par défaut)
+
+    Returns:
+        Générateur NumPy positionné au début du sous-flux
+    """
+    counter = np.array([0, 0, family, stream_index], dtype=np.uint64)
+    return np.random.Generator(np.random.Philox(counter=counter, key=key))
+
+
+def stream_slice_steps(num_steps: int, itemsize: int = 8) -> int:
+    """
+    Nombre de pas tirés à la fois dans un sous-flux.
+
+    Args:
+        num_steps: Nombre de pas de temps
+        itemsize: Taille d'une normale en octets (8 pour float64)
+
+    Returns:
+        Nombre de pas par tranche (entre 1 et num_steps)
+    """
+    return max(1, min(num_steps, _STREAM_SLICE_BYTES // (PATHS_PER_STREAM * itemsize)))
+
+
+def _stream_slices(start: int, stop: int) -> Iterator[Tuple[int, int, int]]:
+    """Découpe [start, stop) en (sous-flux, début local, fin locale)."""
+    for stream in range(start // PATHS_PER_STREAM, (stop - 1) // PATHS_PER_STREAM + 1):
+        offset = stream * PATHS_PER_STREAM
+        yield stream, max(start, offset) - offset, min(stop, offset + PATHS_PER_STREAM) - offset
+
+
+def _interleave_antithetic(base: npt.NDArray, start: int, stop: int, out: npt.NDArray) -> npt.NDArray:
+    """Écrit dans `out` les lignes [start, stop) de (Z_0, -Z_0, Z_1, -Z_1, ...)."""
+    offset = start - 2 * (start // 2)
+    if offset == 0 and (stop - start) % 2 == 0:
+        out[0::2] = base
+        np.negative(base, out=out[1::2])
+        return out
+    pairs = np.empty((2 * base.shape[0],) + base.shape[1:], dtype=base.dtype)
+    pairs[0::2] = base
+    np.negative(base, out=pairs[1::2])
+    out[...] = pairs[offset:offset + stop - start]
+    return out
+
+
+def standard_normals(
+    seed: SeedLike,
+    start: int,
+    stop: int,
+    num_steps: int,
+    dtype: npt.DTypeLike = np.float64,
+    out: Optional[npt.NDArray] = None,
+    antithetic: bool = False,
+    scratch: Optional[npt.NDArray] = None
+) -> npt.NDArray:
+    """
+    Normales des trajectoires [start, stop), indépendamment des autres trajectoires.
+
+    Args:
+        seed: Graine (ou clé Philox déjà dérivée)
+        start: Indice de la première trajectoire
+        stop: Indice suivant la dernière trajectoire
+        num_steps: Nombre de pas de temps
+        dtype: Type des normales (float64 ou float32)
+        out: Buffer de sortie optionnel (stop - start, num_steps)
+        antithetic: Paires antithétiques (Z, -Z) sur les trajectoires (2k, 2k + 1)
+        scratch: Buffer optionnel (au moins `stream_slice_steps(num_steps, itemsize)`
+            lignes, PATHS_PER_STREAM) d'une tranche de sous-flux ; avec `out`,
+            aucun tableau de normales n'est alloué
+
+    Returns:
+        Matrice des normales (stop - start, num_steps)
+
+    Raises:
+        ValueError: Si la plage est invalide
+    """
+    if start < 0 or stop <= start:
+        raise ValueError("La plage de trajectoires [start, stop) est invalide")
+    if num_steps <= 0:
+        raise ValueError("Le nombre de pas doit être positif")
+
+    key = stream_key(seed)
+    if out is None:
+        out = np.empty((stop - start, num_steps), dtype=dtype)
+    if antithetic:
+        if start % 2 == 0 and (stop - start) % 2 == 0:
+            # Paires alignées : normales de base tirées directement dans les lignes paires
+            standard_normals(key, start // 2, stop // 2, num_steps, dtype, out[0::2], scratch=scratch)
+            np.negative(out[0::2], out=out[1::2])
+            return out
+        base = standard_normals(key, start // 2, (stop + 1) // 2, num_steps, dtype, scratch=scratch)
+        return _interleave_antithetic(base, start, stop, out)
+
+    return _draw_streams(key, _NORMAL_FAMILY, start, stop, num_steps, out, scratch)
+
+
+def bridge_uniforms(seed: SeedLike, start: int, stop: int, num_steps: int) -> npt.NDArray[np.float64]:
+    """
+    Uniformes dans ]0, 1] des trajectoires [start, stop), une par pas (pont brownien).
+
+    Tirées sur la famille de sous-flux du pont brownien : indépendantes des
+    normales de la même clé, et identiques quel que soit le découpage en blocs.
+
+    Args:
+        seed: Graine (ou clé Philox déjà dérivée) de la simulation
+        start: Indice de la première trajectoire
+        stop: Indice suivant la dernière trajectoire
+        num_steps: Nombre de pas de temps
+
+    Returns:
+        Matrice des uniformes (stop - start, num_steps)
+
+    Raises:
+        ValueError: Si la plage est invalide
+    """
+    if start < 0 or stop <= start:
+        raise ValueError("La plage de trajectoires [start, stop) est invalide")
+    if num_steps <= 0:
+        raise ValueError("Le nombre de pas doit être positif")
+    out = np.empty((stop - start, num_steps))
+    _draw_streams(stream_key(seed), _BRIDGE_FAMILY, start, stop, num_steps, out)
+    # random() est dans [0, 1[ : 1 - U évite log(0)
+    return np.subtract(1.0, out, out=out)
+
+
+def _draw_streams(
+    key: npt.NDArray[np.uint64],
+    family: int,
+    start: int,
+    stop: int,
+    num_steps: int,
+    out: npt.NDArray,
+    scratch: Optional[npt.NDArray] = None
+) -> npt.NDArray:
+    """Tire dans `out` les lignes [start, stop) d'une famille de sous-flux (normales ou uniformes)."""
+    dtype = out.dtype
+    slice_steps = stream_slice_steps(num_steps, dtype.itemsize)
+    if scratch is None:
+        scratch = np.empty((slice_steps, PATHS_PER_STREAM), dtype=dtype)
+    row = 0
+    for stream, lo, hi in _stream_slices(start, stop):
+        generator = stream_generator(key, stream, family)
+        draw = generator.standard_normal if family == _NORMAL_FAMILY else generator.random
+        # Tirage pas par pas, par tranches : ligne t = tirages du pas t pour tout le sous-flux
+        for step in range(0, num_steps, slice_steps):
+            steps = min(slice_steps, num_steps - step)
+            block = draw((steps, PATHS_PER_STREAM), dtype=dtype, out=scratch[:steps])
+            out[row:row + hi - lo, step:step + steps] = block[:, lo:hi].T
+        row += hi - lo
+    return out
+
+
+class StepNormals:
+    """
+    Tirage pas à pas des normales des trajectoires [start, stop).
+
+    Chaque appel à `next` retourne les normales du pas suivant, identiques à la
+    colonne correspondante de `standard_normals` pour la même graine.
+    """
+
+    def __init__(
+        self,
+        seed: SeedLike,
+        start: int,
+        stop: int,
+        dtype: npt.DTypeLike = np.float64,
+        antithetic: bool = False
+    ):
+        if start < 0 or stop <= start:
+            raise ValueError("La plage de trajectoires [start, stop) est invalide")
+        key = stream_key(seed)
+        self._start, self._stop = start, stop
+        self._antithetic = None
+        if antithetic:
+            # Tirage des normales de base des paires, entrelacées à chaque pas
+            self._antithetic = StepNormals(key, start // 2, (stop + 1) // 2, dtype)
+            self._base = np.empty((stop + 1) // 2 - start // 2, dtype=dtype)
+            return
+        self._slices = [(stream_generator(key, stream), lo, hi) for stream, lo, hi in _stream_slices(start, stop)]
+        self._scratch = np.empty(PATHS_PER_STREAM, dtype=dtype)
+        self._dtype = dtype
+
+    def next(self, out: npt.NDArray) -> npt.NDArray:
+        """
+        Remplit `out` avec les normales du pas suivant.
+
+        Args:
+            out: Buffer de sortie (stop - start,)
+
+        Returns:
+            Le buffer `out`
+        """
+        if self._antithetic is not None:
+            self._antithetic.next(self._base)
+            return _interleave_antithetic(self._base, self._start, self._stop, out)
+
+        row = 0
+        for generator, lo, hi in self._slices:
+            generator.standard_normal(dtype=self._dtype, out=self._scratch)
+            out[row:row + hi - lo] = self._scratch[lo:hi]
+            row += hi - lo
+        return out
@@ -0,0 +1,182 @@
+"""
+Calendriers d'observation déclarés par les payoffs.
+
+Un payoff déclare les dates dont il a besoin via son attribut `schedule` :
+la valeur finale seule (vanilles), des dates de fixing (asiatiques) ou des
+dates d'observation de barrière. Les moteurs ne simulent alors que ces
+dates, par sauts GBM exacts : une vanille se simule en un pas, une
+asiatique à moyenne mensuelle en 12.
+"""
+
+import functools
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+
+# Natures d'observation possibles
+OBSERVATION_KINDS = ("terminal", "fixings", "monitoring")
+
+
+@dataclass(frozen=True)
+class ObservationSchedule:
+    """
+    Dates observées par un payoff.
+
+    Attributes:
+        kind: "terminal", "fixings" ou "monitoring"
+        fractions: Dates en fractions de la maturité, dans ]0, 1] et croissantes
+            (None : chaque pas de la grille de simulation)
+    """
+
+    kind: str
+    fractions: Optional[Tuple[float, ...]] = None
+
+    def __post_init__(self):
+        if self.kind not in OBSERVATION_KINDS:
+            raise ValueError("kind doit être 'terminal', 'fixings' ou 'monitoring'")
+        if self.fractions is not None:
+            fractions = np.asarray(self.fractions, dtype=np.float64)
+            if fractions.size == 0 or fractions[0] <= 0 or fractions[-1] > 1 or np.any(np.diff(fractions) <= 0):
+                raise ValueError("Les dates doivent être croissantes dans ]0, 1]")
+
+    @classmethod
+    def terminal(cls) -> "ObservationSchedule":
+        """Valeur finale uniquement."""
+        return cls("terminal", (1.0,))
+
+    @classmethod
+    def fixings(cls, dates: Optional[Sequence[float]] = None, num_dates: Optional[int] = None) -> "ObservationSchedule":
+        """
+        Dates de fixing d'une moyenne.
+
+        Args:
+            dates: Fractions de la maturité (optionnel)
+            num_dates: Nombre de dates équiréparties, la dernière à maturité (optionnel)
+
+        Returns:
+            Calendrier de fixings (chaque pas de la grille si aucun argument)
+        """
+        return cls("fixings", _fractions(dates, num_dates))
+
+    @classmethod
+    def monitoring(cls, dates: Optional[Sequence[float]] = None, num_dates: Optional[int] = None) -> "ObservationSchedule":
+        """
+        Dates d'observation d'une barrière (mêmes arguments que `fixings`).
+
+        Returns:
+            Calendrier d'observation (chaque pas de la grille si aucun argument)
+        """
+        return cls("monitoring", _fractions(dates, num_dates))
+
+    def dates(self, T: float, num_steps: int) -> Optional[npt.NDArray[np.float64]]:
+        """
+        Dates à simuler.
+
+        Args:
+            T: Maturité
+            num_steps: Nombre de pas de la grille par défaut
+
+        Returns:
+            Dates croissantes, ou None pour chaque pas de la grille
+        """
+        if self.fractions is None:
+            return None
+        return T * np.asarray(self.fractions, dtype=np.float64)
+
+
+def _fractions(dates: Optional[Sequence[float]], num_dates: Optional[int]) -> Optional[Tuple[float, ...]]:
+    """Fractions de maturité à partir de dates explicites ou d'un nombre de dates."""
+    if dates is not None and num_dates is not None:
+        raise ValueError("Donner dates ou num_dates, pas les deux")
+    if num_dates is not None:
+        if num_dates <= 0:
+            raise ValueError("Le nombre de dates doit être positif")
+        return tuple(np.arange(1, num_dates + 1) / num_dates)
+    if dates is not None:
+        return tuple(float(date) for date in dates)
+    return None
+
+
+# Calendrier des payoffs dépendant du chemin qui ne déclarent rien : chaque pas de la grille
+FULL_PATH = ObservationSchedule("monitoring")
+
+TERMINAL = ObservationSchedule.terminal()
+
+
+def _declared_schedule(payoff_function: Callable) -> Optional[ObservationSchedule]:
+    """Calendrier déclaré par le payoff ou la fonction enveloppée par un partial, sinon None."""
+    while True:
+        schedule = getattr(payoff_function, "schedule", None)
+        if schedule is not None or not isinstance(payoff_function, functools.partial):
+            return schedule
+        payoff_function = payoff_function.func
+
+
+def payoff_schedule(payoff_function: Callable) -> ObservationSchedule:
+    """
+    Calendrier déclaré par un payoff (attribut `schedule`).
+
+    Les `functools.partial` héritent du calendrier de la fonction enveloppée.
+    Un payoff sans déclaration est terminal s'il s'agit d'une fonction à deux
+    arguments f(ST, K) (reçoit la valeur finale), et reçoit sinon la
+    trajectoire complète.
+
+    Args:
+        payoff_function: Fonction de payoff
+
+    Returns:
+        Calendrier d'observation
+    """
+    schedule = _declared_schedule(payoff_function)
+    if schedule is not None:
+        return schedule
+    if hasattr(payoff_function, "__code__") and payoff_function.__code__.co_argcount == 2:
+        return TERMINAL
+    return FULL_PATH
+
+
+class ScheduledPayoff:
+    """Payoff enveloppé avec un calendrier d'observation (sérialisable par pickle)."""
+
+    def __init__(self, payoff_function: Callable, schedule: ObservationSchedule):
+        self.payoff_function = payoff_function
+        self.schedule = schedule
+        functools.update_wrapper(self, payoff_function, updated=())
+
+    def __call__(self, *args, **kwargs):
+        return self.payoff_function(*args, **kwargs)
+
+
+def with_schedule(payoff_function: Callable, schedule: ObservationSchedule) -> Callable:
+    """
+    Associe un calendrier d'observation à un payoff.
+
+    Exemple : `with_schedule(asian_payoff, ObservationSchedule.fixings(num_dates=12))`
+    pour une moyenne mensuelle.
+
+    Args:
+        payoff_function: Fonction de payoff
+        schedule: Calendrier d'observation
+
+    Returns:
+        Payoff équivalent déclarant ce calendrier
+    """
+    return ScheduledPayoff(payoff_function, schedule)
+
+
+def observation_dates(payoff_function: Callable, T: float, num_steps: int) -> Optional[npt.NDArray[np.float64]]:
+    """
+    Dates à simuler pour un payoff.
+
+    Args:
+        payoff_function: Fonction de payoff
+        T: Maturité
+        num_steps: Nombre de pas de la grille par défaut
+
+    Returns:
+        Dates croissantes, ou None pour chaque pas de la grille
+    """
+    return payoff_schedule(payoff_function).dates(T, num_steps)
@@ -0,0 +1,133 @@
+"""
+Statistiques incrémentales pour les estimateurs Monte Carlo.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+from scipy.special import ndtri
+
+
+class RunningStats:
+    """
+    Accumulateur de moyenne et de variance par blocs (algorithme de Chan).
+
+    Les valeurs sont agrégées en float64 : la mémoire utilisée ne dépend pas
+    du nombre total d'échantillons.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Somme des carrés des écarts à la moyenne
+
+    def update(self, values: Union[float, npt.ArrayLike]) -> "RunningStats":
+        """
+        Ajoute un bloc d'échantillons.
+
+        Args:
+            values: Échantillons (scalaire ou array)
+
+        Returns:
+            L'accumulateur lui-même
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+
+        block = RunningStats()
+        block.count = values.size
+        block.mean = float(np.mean(values))
+        block.m2 = float(np.sum((values - block.mean) ** 2))
+        return self.merge(block)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Combine exactement un autre accumulateur avec celui-ci.
+
+        Args:
+            other: Accumulateur à fusionner
+
+        Returns:
+            L'accumulateur lui-même
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Variance empirique non biaisée (nan si moins de deux échantillons)."""
+        if self.count < 2:
+            return float("nan")
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std_error(self) -> float:
+        """Erreur standard de la moyenne."""
+        if self.count < 2:
+            return float("nan")
+        return math.sqrt(self.variance / self.count)
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    Résultat d'un pricing Monte Carlo.
+
+    Attributes:
+        price: Prix actualisé
+        std_error: Erreur standard du prix actualisé
+        num_paths: Nombre de trajectoires simulées
+    """
+
+    price: float
+    std_error: float
+    num_paths: int
+
+    def __float__(self) -> float:
+        return float(self.price)
+
+    def confidence_interval(self, level: float = 0.95) -> Tuple[float, float]:
+        """
+        Intervalle de confiance gaussien du prix.
+
+        Args:
+            level: Niveau de confiance (entre 0 et 1)
+
+        Returns:
+            Bornes (inférieure, supérieure)
+
+        Raises:
+            ValueError: Si le niveau n'est pas dans ]0, 1[
+        """
+        if not 0 < level < 1:
+            raise ValueError("Le niveau de confiance doit être dans ]0, 1[")
+        half_width = float(ndtri(0.5 + level / 2)) * self.std_error
+        return (self.price - half_width, self.price + half_width)
+
+
+@dataclass
+class AdaptiveMonteCarloResult(MonteCarloResult):
+    """
+    Résultat d'un pricing Monte Carlo adaptatif.
+
+    Attributes:
+        elapsed_time: Temps de calcul (secondes)
+        converged: Vrai si la tolérance demandée est atteinte
+    """
+
+    elapsed_time: float
+    converged: bool
@@ -0,0 +1,190 @@
+"""
+Stockage sur disque des trajectoires simulées, relues par projection mémoire.
+
+Les trajectoires d'un marché et d'une graine donnés sont écrites une fois
+dans un fichier `.npy`, accompagné d'un en-tête JSON décrivant la
+simulation (paramètres du modèle, graine, générateur, forme, type). Les
+exécutions suivantes, dans ce processus ou dans d'autres, ouvrent le
+fichier en lecture seule avec `np.load(mmap_mode="r")` : les pages sont
+partagées par le cache du système et aucune trajectoire n'est copiée ni
+régénérée.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from .monte_carlo import (
+    _validate_dates, _validate_dtype, monte_carlo_path_blocks, monte_carlo_simulation
+)
+from .qmc import SAMPLERS
+from .rng import PATHS_PER_STREAM
+
+
+# Version du format de l'en-tête : une version différente n'est jamais relue
+STORE_FORMAT_VERSION = 1
+
+
+class PathStore:
+    """
+    Répertoire de trajectoires simulées, indexées par leurs paramètres.
+
+    Le nom des fichiers est une empreinte de l'en-tête ; à la lecture,
+    l'en-tête complet est comparé aux paramètres demandés. L'écriture passe
+    par des fichiers temporaires renommés atomiquement : plusieurs processus
+    peuvent simuler et lire le même répertoire.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        """
+        Initialise le stockage (le répertoire est créé si besoin).
+
+        Args:
+            directory: Répertoire des fichiers de trajectoires
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def metadata(
+        S: float,
+        T: float,
+        r: float,
+        sigma: float,
+        num_simulations: int,
+        num_steps: int,
+        seed: int,
+        antithetic: bool = False,
+        sampler: str = "pseudo",
+        dates: Optional[npt.ArrayLike] = None,
+        dtype: npt.DTypeLike = np.float64
+    ) -> Dict[str, Any]:
+        """
+        En-tête décrivant une simulation (mêmes arguments que `monte_carlo_simulation`).
+
+        Returns:
+            Dictionnaire sérialisable en JSON
+
+        Raises:
+            ValueError: Si la graine est absente (trajectoires non reproductibles)
+                ou si les paramètres sont invalides
+        """
+        if seed is None:
+            raise ValueError("Une graine est nécessaire pour stocker et réutiliser des trajectoires")
+        if sampler not in SAMPLERS:
+            raise ValueError("sampler doit être 'pseudo' ou 'sobol'")
+        dates = _validate_dates(dates, T)
+        dtype = _validate_dtype(dtype)
+        num_columns = num_steps if dates is None else dates.size
+        return {
+            "format_version": STORE_FORMAT_VERSION,
+            "model": "gbm",
+            "S": float(S),
+            "T": float(T),
+            "r": float(r),
+            "sigma": float(sigma),
+            "num_steps": int(num_steps),
+            "dates": None if dates is None else dates.tolist(),
+            "seed": int(seed),
+            "antithetic": bool(antithetic),
+            "sampler": sampler,
+            "rng": "philox" if sampler == "pseudo" else "sobol-owen",
+            "paths_per_stream": PATHS_PER_STREAM,
+            "shape": [int(num_simulations), int(num_columns)],
+            "dtype": dtype.str,
+        }
+
+    def _paths_file(self, metadata: Dict[str, Any]) -> Path:
+        """Fichier .npy associé à un en-tête (empreinte SHA-256 de l'en-tête)."""
+        digest = hashlib.sha256(json.dumps(metadata, sort_keys=True).encode("utf-8")).hexdigest()
+        return self.directory / f"paths_{digest[:32]}.npy"
+
+    def load(self, *args, **kwargs) -> Optional[np.memmap]:
+        """
+        Ouvre des trajectoires déjà stockées (arguments de `PathStore.metadata`).
+
+        Returns:
+            Trajectoires en lecture seule, projetées en mémoire, ou None si
+            aucune simulation stockée ne correspond exactement aux paramètres
+        """
+        metadata = self.metadata(*args, **kwargs)
+        paths_file = self._paths_file(metadata)
+        header_file = paths_file.with_suffix(".json")
+        try:
+            with open(header_file, "r", encoding="utf-8") as f:
+                if json.load(f) != metadata:
+                    return None
+            ST = np.load(paths_file, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        if list(ST.shape) != metadata["shape"] or ST.dtype.str != metadata["dtype"]:
+            return None
+        return ST
+
+    def simulate(self, *args, max_memory_bytes: Optional[int] = None, **kwargs) -> np.memmap:
+        """
+        Simule et stocke les trajectoires (arguments de `PathStore.metadata`).
+
+        Les trajectoires pseudo-aléatoires sont écrites bloc par bloc dans le
+        fichier projeté : la matrice complète n'est jamais en mémoire vive.
+
+        Args:
+            max_memory_bytes: Budget mémoire d'un bloc (optionnel)
+
+        Returns:
+            Trajectoires stockées, en lecture seule et projetées en mémoire
+        """
+        metadata = self.metadata(*args, **kwargs)
+        paths_file = self._paths_file(metadata)
+        S, T, r, sigma = metadata["S"], metadata["T"], metadata["r"], metadata["sigma"]
+        num_simulations = metadata["shape"][0]
+        simulation = dict(
+            seed=metadata["seed"], antithetic=metadata["antithetic"], dates=metadata["dates"],
+            dtype=np.dtype(metadata["dtype"])
+        )
+
+        # Fichiers temporaires propres au processus, renommés une fois complets ;
+        # l'en-tête est publié en dernier
+        suffix = f".{os.getpid()}.tmp"
+        tmp_paths = paths_file.with_name(paths_file.name + suffix)
+        tmp_header = paths_file.with_suffix(".json" + suffix)
+        try:
+            out = np.lib.format.open_memmap(tmp_paths, mode="w+", dtype=simulation["dtype"],
+                                            shape=tuple(metadata["shape"]))
+            if metadata["sampler"] == "pseudo":
+                row = 0
+                for block in monte_carlo_path_blocks(S, T, r, sigma, num_simulations, metadata["num_steps"],
+                                                     max_memory_bytes=max_memory_bytes, **simulation):
+                    out[row:row + block.shape[0]] = block
+                    row += block.shape[0]
+            else:
+                out[:] = monte_carlo_simulation(S, T, r, sigma, num_simulations, metadata["num_steps"],
+                                                sampler="sobol", **simulation)
+            out.flush()
+            del out
+            with open(tmp_header, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=2, sort_keys=True)
+            os.replace(tmp_paths, paths_file)
+            os.replace(tmp_header, paths_file.with_suffix(".json"))
+        finally:
+            for tmp in (tmp_paths, tmp_header):
+                if tmp.exists():
+                    tmp.unlink()
+        return np.load(paths_file, mmap_mode="r")
+
+    def load_or_simulate(self, *args, max_memory_bytes: Optional[int] = None, **kwargs) -> np.memmap:
+        """
+        Trajectoires stockées si elles existent, sinon simulées puis stockées.
+
+        Returns:
+            Trajectoires en lecture seule, projetées en mémoire
+        """
+        ST = self.load(*args, **kwargs)
+        if ST is None:
+            ST = self.simulate(*args, max_memory_bytes=max_memory_bytes, **kwargs)
+        return ST
@@ -0,0 +1,78 @@
+"""
+Buffers préalloués réutilisés d'une simulation à l'autre.
+
+Une boucle de revalorisation intraday appelle le moteur des milliers de
+fois avec la même forme : allouer puis libérer la matrice des trajectoires
+à chaque appel coûte des défauts de page et du temps d'allocateur. Un
+`SimulationWorkspace` garde les buffers entre les appels ; le moteur y
+écrit les normales puis les transforme en place en trajectoires.
+"""
+
+from typing import Dict
+
+import numpy as np
+import numpy.typing as npt
+
+from .rng import PATHS_PER_STREAM, stream_slice_steps
+
+
+class SimulationWorkspace:
+    """
+    Buffers de simulation réutilisables.
+
+    Chaque buffer est un tableau plat dont on retourne une vue de la forme
+    demandée : une forme identique ou plus petite ne provoque aucune
+    allocation. Les trajectoires retournées par le moteur sont une vue du
+    workspace, écrasée par l'appel suivant.
+
+    Attributes:
+        num_allocations: Nombre de buffers alloués depuis la création
+    """
+
+    def __init__(self):
+        """Initialise un workspace vide (les buffers sont alloués au premier appel)."""
+        self._buffers: Dict[str, npt.NDArray] = {}
+        self.num_allocations = 0
+
+    def _buffer(self, name: str, shape: tuple, dtype: npt.DTypeLike) -> npt.NDArray:
+        """Vue de forme `shape` sur le buffer `name`, réalloué seulement s'il est trop petit."""
+        size = int(np.prod(shape))
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.size < size or buffer.dtype != dtype:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[name] = buffer
+            self.num_allocations += 1
+        return buffer[:size].reshape(shape)
+
+    def paths(self, num_simulations: int, num_steps: int, dtype: npt.DTypeLike = np.float64) -> npt.NDArray:
+        """
+        Buffer des normales, transformé en place en trajectoires.
+
+        Args:
+            num_simulations: Nombre de trajectoires
+            num_steps: Nombre de dates simulées
+            dtype: Type flottant
+
+        Returns:
+            Vue (num_simulations, num_steps) sur le buffer
+        """
+        return self._buffer("paths", (num_simulations, num_steps), dtype)
+
+    def stream_block(self, num_steps: int, dtype: npt.DTypeLike = np.float64) -> npt.NDArray:
+        """
+        Buffer d'une tranche de sous-flux Philox (voir `pricing.rng.standard_normals`).
+
+        Args:
+            num_steps: Nombre de dates simulées
+            dtype: Type flottant
+
+        Returns:
+            Vue (stream_slice_steps(num_steps, itemsize), PATHS_PER_STREAM) sur le buffer
+        """
+        return self._buffer("stream_block", (stream_slice_steps(num_steps, np.dtype(dtype).itemsize), PATHS_PER_STREAM),
+                            dtype)
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire totale des buffers (octets)."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
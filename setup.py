@@ -15,6 +15,9 @@ setup(
         "scipy",
         "matplotlib",
     ],
+    extras_require={
+        "numba": ["numba"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,5 +1,6 @@
 import unittest
 from pricing.binomial_tree import binomial_tree_price
+from pricing.black_scholes import black_scholes_price
 
 class TestBinomialTree(unittest.TestCase):
     """Tests unitaires pour le modèle binomial."""
@@ -26,5 +27,59 @@ class TestBinomialTree(unittest.TestCase):
         self.assertTrue(prix_call > 0)
         self.assertTrue(prix_put > 0)
 
+    def test_large_tree_converges_to_black_scholes(self):
+        """Avec 20 000 étapes, l'arbre converge vers Black-Scholes."""
+        for option_type in ["call", "put"]:
+            prix = binomial_tree_price(100, 95, 1, 0.05, 0.2, 20000, option_type)
+            self.assertAlmostEqual(prix, black_scholes_price(100, 95, 1, 0.05, 0.2, option_type), places=3)
+
+    def test_single_step(self):
+        """Un arbre à une étape est le modèle à un pas."""
+        prix = binomial_tree_price(100, 95, 1, 0.05, 0.2, 1, "call")
+        self.assertAlmostEqual(prix, 14.908927568738513, places=12)
+
+    def test_invalid_parameters(self):
+        """Paramètres de marché ou nombre d'étapes invalides."""
+        with self.assertRaises(ValueError):
+            binomial_tree_price(100, 100, 1, 0.05, 0.2, 0, "call")
+        with self.assertRaises(ValueError):
+            binomial_tree_price(100, 100, 1, 0.05, -0.2, 10, "call")
+
+    def test_american_put(self):
+        """Le put américain vaut plus que l'européen et converge vers la référence."""
+        europeen = binomial_tree_price(100, 100, 1, 0.05, 0.2, 1000, "put")
+        americain = binomial_tree_price(100, 100, 1, 0.05, 0.2, 1000, "put", exercise="american")
+        self.assertTrue(americain > europeen)
+        self.assertAlmostEqual(americain, 6.0904, places=2)
+
+    def test_american_call_without_dividends(self):
+        """Sans dividendes, le call américain égale le call européen."""
+        europeen = binomial_tree_price(100, 100, 1, 0.05, 0.2, 500, "call")
+        americain = binomial_tree_price(100, 100, 1, 0.05, 0.2, 500, "call", exercise="american")
+        self.assertAlmostEqual(americain, europeen, places=10)
+
+    def test_accelerated_convergence(self):
+        """BBSR avec 200 étapes bat l'arbre standard avec 1000 étapes."""
+        reference = 6.09037  # Put américain, arbre de 40 000 étapes
+        standard = binomial_tree_price(100, 100, 1, 0.05, 0.2, 1000, "put", exercise="american")
+        acceleree = binomial_tree_price(100, 100, 1, 0.05, 0.2, 200, "put", exercise="american", accelerate=True)
+        self.assertLess(abs(acceleree - reference), abs(standard - reference))
+
+        bs = black_scholes_price(100, 100, 1, 0.05, 0.2, "call")
+        self.assertAlmostEqual(binomial_tree_price(100, 100, 1, 0.05, 0.2, 100, "call", accelerate=True), bs, places=3)
+
+    def test_accelerated_odd_steps(self):
+        """N impair : extrapolation aussi précise que pour N pair."""
+        bs = black_scholes_price(100, 100, 1, 0.05, 0.2, "call")
+        erreur_paire = abs(binomial_tree_price(100, 100, 1, 0.05, 0.2, 100, "call", accelerate=True) - bs)
+        erreur_impaire = abs(binomial_tree_price(100, 100, 1, 0.05, 0.2, 101, "call", accelerate=True) - bs)
+        self.assertLess(erreur_impaire, 2e-4)
+        self.assertLess(erreur_impaire, 2 * erreur_paire)
+
+    def test_invalid_exercise(self):
+        """Type d'exercice invalide."""
+        with self.assertRaises(ValueError):
+            binomial_tree_price(100, 100, 1, 0.05, 0.2, 100, "put", exercise="bermudan")
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,8 @@
 import unittest
-from pricing.black_scholes import black_scholes_price
+import numpy as np
+from pricing.black_scholes import black_scholes_price, black_scholes_price_vectorized, black_scholes_greeks
+from pricing.black_scholes import implied_volatility
+from scipy.optimize import brentq
 
 class TestBlackScholes(unittest.TestCase):
     """Tests unitaires pour la fonction Black-Scholes."""
@@ -19,5 +22,148 @@ class TestBlackScholes(unittest.TestCase):
         with self.assertRaises(ValueError):
             black_scholes_price(100, 100, 1, 0.05, 0.2, "invalid")
 
+
+class TestBlackScholesVectorized(unittest.TestCase):
+    """Tests du pricer Black-Scholes vectorisé."""
+
+    def setUp(self):
+        self.K = np.array([80.0, 95.0, 100.0, 110.0, 130.0])
+        self.T = np.array([0.1, 0.5, 1.0, 2.0, 5.0])
+        self.sigma = np.array([0.1, 0.2, 0.3, 0.4, 0.6])
+
+    def test_matches_scalar_pricer(self):
+        """Les prix vectorisés égalent la version scalaire, calls et puts mélangés."""
+        option_types = np.array(["call", "put", "call", "put", "call"])
+        prices = black_scholes_price_vectorized(100, self.K, self.T, 0.03, self.sigma, option_types)
+        expected = [black_scholes_price(100, k, t, 0.03, s, o)
+                    for k, t, s, o in zip(self.K, self.T, self.sigma, option_types)]
+        np.testing.assert_allclose(prices, expected, rtol=1e-12)
+
+    def test_broadcasting_and_out(self):
+        """Diffusion strikes x maturités et écriture dans un buffer fourni."""
+        out = np.empty((5, 5))
+        result = black_scholes_price_vectorized(100, self.K[:, None], self.T[None, :], 0.03, 0.2, "put", out=out)
+        self.assertIs(result, out)
+        self.assertAlmostEqual(out[2, 2], black_scholes_price(100, 100, 1.0, 0.03, 0.2, "put"), places=12)
+
+    def test_boolean_flag(self):
+        """Un array booléen sélectionne call (True) ou put (False)."""
+        prices = black_scholes_price_vectorized(100, 100, 1, 0.05, 0.2, np.array([True, False]))
+        np.testing.assert_allclose(prices, [10.4506, 5.5735], atol=1e-4)
+
+    def test_invalid_inputs(self):
+        """La validation porte sur tous les éléments."""
+        with self.assertRaises(ValueError):
+            black_scholes_price_vectorized(100, self.K, self.T, 0.03, np.array([0.2, 0.2, -0.1, 0.2, 0.2]))
+        with self.assertRaises(ValueError):
+            black_scholes_price_vectorized(100, self.K, self.T, 0.03, self.sigma, ["call", "bad", "put", "put", "put"])
+
+
+class TestBlackScholesGreeks(unittest.TestCase):
+    """Tests des Greeks Black-Scholes analytiques."""
+
+    def setUp(self):
+        self.params = dict(S=105.0, K=100.0, T=0.7, r=0.03, sigma=0.25)
+        self.h = 1e-4
+
+    def _bumped_price(self, option_type, **bump):
+        params = dict(self.params)
+        for key, value in bump.items():
+            params[key] += value
+        return float(black_scholes_price_vectorized(**params, option_type=option_type))
+
+    def test_first_order_vs_finite_differences(self):
+        """Delta, vega, theta et rho égalent les différences finies centrées."""
+        h = self.h
+        for option_type in ["call", "put"]:
+            greeks = black_scholes_greeks(**self.params, option_type=option_type)
+            bump = lambda **kw: self._bumped_price(option_type, **kw)
+            self.assertAlmostEqual(float(greeks["delta"]), (bump(S=h) - bump(S=-h)) / (2 * h), places=6)
+            self.assertAlmostEqual(float(greeks["vega"]), (bump(sigma=h) - bump(sigma=-h)) / (2 * h), places=5)
+            self.assertAlmostEqual(float(greeks["theta"]), -(bump(T=h) - bump(T=-h)) / (2 * h), places=5)
+            self.assertAlmostEqual(float(greeks["rho"]), (bump(r=h) - bump(r=-h)) / (2 * h), places=5)
+            self.assertAlmostEqual(float(greeks["price"]), bump(), places=12)
+
+    def test_second_order(self):
+        """Gamma, vanna et volga cohérents avec les dérivées des Greeks d'ordre 1."""
+        h = self.h
+        up = black_scholes_greeks(**dict(self.params, sigma=0.25 + h))
+        down = black_scholes_greeks(**dict(self.params, sigma=0.25 - h))
+        base = black_scholes_greeks(**self.params)
+        self.assertAlmostEqual(float(base["vanna"]), float(up["delta"] - down["delta"]) / (2 * h), places=6)
+        self.assertAlmostEqual(float(base["volga"]), float(up["vega"] - down["vega"]) / (2 * h), places=4)
+        s_up = black_scholes_greeks(**dict(self.params, S=105.0 + h))
+        s_down = black_scholes_greeks(**dict(self.params, S=105.0 - h))
+        self.assertAlmostEqual(float(base["gamma"]), float(s_up["delta"] - s_down["delta"]) / (2 * h), places=8)
+
+    def test_array_inputs(self):
+        """Greeks sur un array de strikes, calls et puts mélangés."""
+        K = np.array([90.0, 100.0, 110.0])
+        greeks = black_scholes_greeks(100, K, 1.0, 0.05, 0.2, np.array(["call", "put", "call"]))
+        self.assertEqual(greeks["delta"].shape, (3,))
+        self.assertTrue(greeks["delta"][0] > 0 > greeks["delta"][1])
+        np.testing.assert_allclose(greeks["gamma"] * 100 * 0.2 * 100, greeks["vega"] / 1.0, rtol=1e-12)
+
+
+class TestImpliedVolatility(unittest.TestCase):
+    """Tests du calcul vectorisé de la volatilité implicite."""
+
+    def test_round_trip_on_chain(self):
+        """Chaîne aléatoire (strikes, maturités, vols, calls et puts) : vol retrouvée à 1e-8 près."""
+        rng = np.random.default_rng(0)
+        n = 20000
+        K = rng.uniform(50, 200, n)
+        T = rng.uniform(0.05, 5, n)
+        sigma = rng.uniform(0.05, 1.5, n)
+        is_call = rng.random(n) < 0.5
+        prices = black_scholes_price_vectorized(100, K, T, 0.03, sigma, is_call)
+        # Valeur temps assez grande pour que la vol soit déterminée par le prix
+        X = K * np.exp(-0.03 * T)
+        time_value = prices - np.maximum(np.where(is_call, 100 - X, X - 100), 0)
+        identifiable = time_value > 1e-4
+
+        vols = implied_volatility(prices, 100, K, T, 0.03, is_call)
+        self.assertEqual(vols.shape, (n,))
+        self.assertFalse(np.any(np.isnan(vols[identifiable])))
+        np.testing.assert_allclose(vols[identifiable], sigma[identifiable], atol=1e-8)
+
+    def test_matches_scalar_root_finding(self):
+        for K, option_type in [(80, "call"), (100, "put"), (130, "call"), (70, "put")]:
+            price = black_scholes_price(100, K, 0.5, 0.02, 0.35, option_type)
+            expected = brentq(lambda s: black_scholes_price(100, K, 0.5, 0.02, s, option_type) - price, 1e-4, 5)
+            self.assertAlmostEqual(float(implied_volatility(price, 100, K, 0.5, 0.02, option_type)), expected,
+                                   places=9)
+
+    def test_call_and_put_give_same_vol(self):
+        call = black_scholes_price(100, 90, 1, 0.05, 0.25, "call")
+        put = black_scholes_price(100, 90, 1, 0.05, 0.25, "put")
+        vols = implied_volatility([call, put], 100, 90, 1, 0.05, np.array(["call", "put"]))
+        np.testing.assert_allclose(vols, 0.25, atol=1e-10)
+
+    def test_arbitrage_violations_are_nan(self):
+        """Cotations hors bornes : NaN sans exception, les autres cotations restent valides."""
+        X = 100 * np.exp(-0.05)
+        prices = np.array([100 - X - 1.0, 100.5, -1.0, np.nan, black_scholes_price(100, 100, 1, 0.05, 0.2)])
+        vols = implied_volatility(prices, 100, 100, 1, 0.05, "call")
+        self.assertTrue(np.all(np.isnan(vols[:4])))
+        self.assertAlmostEqual(vols[4], 0.2, places=10)
+
+    def test_broadcasting(self):
+        K = np.array([[90.0], [100.0], [110.0]])
+        T = np.array([0.5, 1.0])
+        prices = black_scholes_price_vectorized(100, K, T, 0.01, 0.3)
+        vols = implied_volatility(prices, 100, K, T, 0.01)
+        self.assertEqual(vols.shape, (3, 2))
+        np.testing.assert_allclose(vols, 0.3, atol=1e-10)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            implied_volatility(10, -100, 100, 1, 0.05)
+        with self.assertRaises(ValueError):
+            implied_volatility(10, 100, 100, 0, 0.05)
+        with self.assertRaises(ValueError):
+            implied_volatility(10, 100, 100, 1, 0.05, "straddle")
+
+
 if __name__ == "__main__":
     unittest.main()
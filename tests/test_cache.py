@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+
+from pricing import PathCache, monte_carlo_simulation
+
+
+class TestPathCache(unittest.TestCase):
+    """Tests du cache LRU des trajectoires à spot unitaire."""
+
+    def test_spot_ladder_matches_simulation(self):
+        """Chaque spot redonne exactement les trajectoires d'une simulation directe."""
+        cache = PathCache()
+        for S in [80, 90.5, 100, 110, 120]:
+            np.testing.assert_array_equal(cache.simulate(S, 1, 0.05, 0.2, 2000, 12, seed=3),
+                                          monte_carlo_simulation(S, 1, 0.05, 0.2, 2000, 12, seed=3))
+        self.assertEqual((cache.misses, cache.hits), (1, 4))
+
+    def test_float32_and_dates(self):
+        cache = PathCache()
+        ST = cache.simulate(105, 1, 0.05, 0.2, 1000, 12, seed=2, dates=[0.25, 0.5, 1.0], dtype=np.float32)
+        np.testing.assert_array_equal(ST, monte_carlo_simulation(105, 1, 0.05, 0.2, 1000, 12, seed=2,
+                                                                 dates=[0.25, 0.5, 1.0], dtype=np.float32))
+
+    def test_key_covers_model_and_rng(self):
+        cache = PathCache()
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=1)
+        for kwargs in [dict(seed=2), dict(sigma=0.3), dict(num_steps=24), dict(antithetic=True)]:
+            params = {**dict(T=1, r=0.05, sigma=0.2, num_simulations=1000, num_steps=12, seed=1), **kwargs}
+            cache.simulate(100, **params)
+        self.assertEqual((cache.misses, cache.hits), (5, 0))
+
+    def test_lru_eviction_by_bytes(self):
+        entry_bytes = 1000 * 12 * 8
+        cache = PathCache(max_bytes=2 * entry_bytes)
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=1)
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=2)
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=1)  # seed=1 devient la plus récente
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=3)  # évince seed=2
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=1)
+        self.assertEqual(cache.hits, 2)
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=2)
+        self.assertEqual(cache.misses, 4)
+
+    def test_oversized_entry_not_cached(self):
+        cache = PathCache(max_bytes=1024)
+        cache.simulate(100, 1, 0.05, 0.2, 1000, 12, seed=1)
+        self.assertEqual((len(cache), cache.nbytes, cache.evictions), (0, 0, 0))
+
+    def test_cached_paths_are_protected(self):
+        cache = PathCache()
+        unit = cache.unit_paths(1, 0.05, 0.2, 100, 12, seed=1)
+        with self.assertRaises(ValueError):
+            unit[0, 0] = 0.0
+        ST = cache.simulate(100, 1, 0.05, 0.2, 100, 12, seed=1)
+        ST[0, 0] = 0.0
+        self.assertNotEqual(cache.unit_paths(1, 0.05, 0.2, 100, 12, seed=1)[0, 0], 0.0)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            PathCache(max_bytes=0)
+        with self.assertRaises(ValueError):
+            PathCache().simulate(100, 1, 0.05, 0.2, 100, 12, seed=None)
+        with self.assertRaises(ValueError):
+            PathCache().simulate(-1, 1, 0.05, 0.2, 100, 12, seed=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+
+from pricing import chunked_monte_carlo_pricing, monte_carlo_simulation
+from pricing.black_scholes import black_scholes_price
+from pricing.control_variates import (
+    geometric_asian_price, control_variate_estimate,
+    asian_control_variate_pricing, barrier_control_variate_pricing
+)
+from pricing.payoffs import asian_payoff, asian_geometric_payoff, barrier_knock_out, vanilla_call
+
+
+class TestGeometricAsianPrice(unittest.TestCase):
+    """Tests de la formule fermée de l'asiatique géométrique."""
+
+    def test_single_fixing_is_black_scholes(self):
+        """Avec une seule date de moyenne, le prix est celui de Black-Scholes."""
+        for option_type in ["call", "put"]:
+            self.assertAlmostEqual(geometric_asian_price(100, 95, 1, 0.05, 0.2, 1, option_type),
+                                   black_scholes_price(100, 95, 1, 0.05, 0.2, option_type), places=10)
+
+    def test_matches_simulation(self):
+        """La formule est compatible avec la moyenne géométrique simulée."""
+        ST = monte_carlo_simulation(100, 1, 0.05, 0.2, 200000, 12, seed=4)
+        payoffs = np.exp(-0.05) * asian_geometric_payoff(ST, 100)
+        std_error = payoffs.std(ddof=1) / np.sqrt(payoffs.size)
+        self.assertLess(abs(payoffs.mean() - geometric_asian_price(100, 100, 1, 0.05, 0.2, 12)), 4 * std_error)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            geometric_asian_price(100, 100, 1, 0.05, 0.2, 0)
+        with self.assertRaises(ValueError):
+            geometric_asian_price(100, 100, 1, 0.05, 0.2, 12, "straddle")
+
+
+class TestControlVariates(unittest.TestCase):
+    """Tests des estimateurs par variable de contrôle."""
+
+    def test_exact_control_removes_variance(self):
+        """Un contrôle parfaitement corrélé donne le prix exact et une erreur nulle."""
+        x = np.random.default_rng(0).lognormal(size=1000)
+        result = control_variate_estimate(2 * x + 1, x, control_price=3.0, r=0.0, T=1.0)
+        self.assertAlmostEqual(result.price, 7.0, places=10)
+        self.assertAlmostEqual(result.std_error, 0.0, places=10)
+
+    def test_asian_variance_reduction(self):
+        """L'asiatique arithmétique contrôlé réduit la variance d'au moins un facteur 20."""
+        plain = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, asian_payoff, 20000, 12, seed=2)
+        controlled = asian_control_variate_pricing(100, 100, 1, 0.05, 0.2, 20000, 12, seed=2)
+        self.assertGreater((plain.std_error / controlled.std_error) ** 2, 20)
+        self.assertLess(abs(plain.price - controlled.price), 4 * plain.std_error)
+
+    def test_asian_antithetic(self):
+        """Le contrôle se combine avec les variates antithétiques."""
+        result = asian_control_variate_pricing(100, 100, 1, 0.05, 0.2, 20000, 12, "put", seed=5, antithetic=True)
+        put_reference = asian_control_variate_pricing(100, 100, 1, 0.05, 0.2, 200000, 12, "put", seed=3)
+        self.assertLess(abs(result.price - put_reference.price),
+                        4 * np.hypot(result.std_error, put_reference.std_error))
+
+    def test_barrier_variance_reduction(self):
+        """Down-and-out lointain : la vanille est un contrôle très efficace."""
+        controlled = barrier_control_variate_pricing(100, 100, 1, 0.05, 0.2, 85, "down", "out",
+                                                     num_simulations=20000, num_steps=50, seed=2)
+        ST = monte_carlo_simulation(100, 1, 0.05, 0.2, 20000, 50, seed=2)
+        payoffs = np.exp(-0.05) * barrier_knock_out(ST, 100, 85, vanilla_call, "down")
+        plain_error = payoffs.std(ddof=1) / np.sqrt(payoffs.size)
+        self.assertGreater((plain_error / controlled.std_error) ** 2, 20)
+        self.assertLess(abs(payoffs.mean() - controlled.price), 4 * plain_error)
+
+    def test_invalid_knock(self):
+        with self.assertRaises(ValueError):
+            barrier_control_variate_pricing(100, 100, 1, 0.05, 0.2, 120, knock="sideways")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+
+from pricing import carr_madan_call_grid, fft_option_prices
+from pricing.black_scholes import black_scholes_price, black_scholes_price_vectorized
+from pricing.fft import gbm_characteristic_function
+
+
+class TestCarrMadan(unittest.TestCase):
+    """Tests du pricer FFT de Carr-Madan contre Black-Scholes."""
+
+    def test_grid_matches_black_scholes(self):
+        """Chaque point de la grille FFT entre 50 et 200 égale Black-Scholes à 1e-6 près."""
+        for T, sigma in [(0.1, 0.15), (1.0, 0.2), (5.0, 0.4)]:
+            with self.subTest(T=T, sigma=sigma):
+                strikes, calls = carr_madan_call_grid(gbm_characteristic_function(100, T, 0.05, sigma), 100, T, 0.05)
+                inside = (strikes > 50) & (strikes < 200)
+                expected = black_scholes_price_vectorized(100, strikes[inside], T, 0.05, sigma)
+                np.testing.assert_allclose(calls[inside], expected, atol=1e-6)
+
+    def test_requested_strikes(self):
+        K = np.linspace(60, 180, 121)
+        for option_type in ["call", "put"]:
+            with self.subTest(option_type=option_type):
+                prices = fft_option_prices(K, 100, 0.5, 0.03, 0.25, option_type)
+                expected = black_scholes_price_vectorized(100, K, 0.5, 0.03, 0.25, option_type)
+                np.testing.assert_allclose(prices, expected, atol=1e-5)
+
+    def test_mixed_types_and_scalar(self):
+        prices = fft_option_prices([90.0, 110.0], 100, 1, 0.05, 0.2, np.array(["call", "put"]))
+        self.assertAlmostEqual(prices[0], black_scholes_price(100, 90, 1, 0.05, 0.2, "call"), places=5)
+        self.assertAlmostEqual(prices[1], black_scholes_price(100, 110, 1, 0.05, 0.2, "put"), places=5)
+        self.assertEqual(fft_option_prices(100.0, 100, 1, 0.05, 0.2).shape, ())
+
+    def test_custom_characteristic_function(self):
+        """Un modèle passé par sa fonction caractéristique (ici GBM) donne les mêmes prix."""
+        phi = gbm_characteristic_function(100, 1, 0.05, 0.3)
+        K = np.array([80.0, 100.0, 120.0])
+        np.testing.assert_allclose(fft_option_prices(K, 100, 1, 0.05, characteristic_function=phi),
+                                   fft_option_prices(K, 100, 1, 0.05, 0.3), rtol=1e-14)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            fft_option_prices(100, 100, 1, 0.05)
+        with self.assertRaises(ValueError):
+            fft_option_prices(1e9, 100, 1, 0.05, 0.2)
+        with self.assertRaises(ValueError):
+            fft_option_prices(100, 100, 1, 0.05, 0.2, alpha=-1)
+        with self.assertRaises(ValueError):
+            fft_option_prices(100, 100, 1, 0.05, 0.2, "straddle")
+
+
+if __name__ == "__main__":
+    unittest.main()
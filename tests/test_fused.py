@@ -0,0 +1,93 @@
+import unittest
+from functools import partial
+
+import numpy as np
+
+from pricing import chunked_monte_carlo_pricing, fused_monte_carlo_pricing
+from pricing.black_scholes import black_scholes_price
+from pricing.fused import NUMBA_AVAILABLE, _fused_payoff_kernel, _stream_seeds
+from pricing.payoffs import barrier_knock_out, vanilla_call
+
+
+class TestFusedKernel(unittest.TestCase):
+    """Tests du noyau fusionné, exécuté en Python (sans compilation)."""
+
+    def setUp(self):
+        # Le noyau non compilé réinitialise le générateur global de NumPy
+        self._state = np.random.get_state()
+
+    def tearDown(self):
+        np.random.set_state(self._state)
+
+    def _kernel_price(self, num_paths, num_steps, payoff_code, sign, barrier=0.0, barrier_sign=1.0,
+                      knock_out=True):
+        out = np.empty(num_paths)
+        _fused_payoff_kernel(100.0, 100.0, 1.0, 0.05, 0.2, num_steps, payoff_code, sign, barrier, barrier_sign,
+                             knock_out, _stream_seeds(3, num_paths), out)
+        samples = np.exp(-0.05) * out
+        return samples.mean(), samples.std(ddof=1) / np.sqrt(num_paths)
+
+    def test_vanilla_matches_black_scholes(self):
+        for sign, option_type in [(1.0, "call"), (-1.0, "put")]:
+            price, std_error = self._kernel_price(20000, 1, 0, sign)
+            self.assertLess(abs(price - black_scholes_price(100, 100, 1, 0.05, 0.2, option_type)), 4 * std_error)
+
+    def test_barrier_in_out_parity(self):
+        """Knock-in + knock-out = vanille, trajectoire par trajectoire (mêmes normales)."""
+        knock_out, _ = self._kernel_price(3000, 12, 2, 1.0, barrier=120.0, knock_out=True)
+        knock_in, _ = self._kernel_price(3000, 12, 2, 1.0, barrier=120.0, knock_out=False)
+        vanilla, _ = self._kernel_price(3000, 12, 0, 1.0)
+        self.assertAlmostEqual(knock_out + knock_in, vanilla, places=10)
+
+    def test_barrier_matches_numpy_engine(self):
+        price, std_error = self._kernel_price(5000, 12, 2, 1.0, barrier=120.0)
+        ST_payoff = partial(barrier_knock_out, barrier=120, payoff_sousjacent=vanilla_call, barrier_type="up")
+        reference = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, ST_payoff, 20000, 12, seed=1)
+        self.assertLess(abs(price - reference.price), 4 * np.hypot(std_error, reference.std_error))
+
+    def test_reproducible(self):
+        self.assertEqual(self._kernel_price(2000, 5, 1, 1.0), self._kernel_price(2000, 5, 1, 1.0))
+
+
+class TestFusedPricing(unittest.TestCase):
+    """Tests de l'interface et du repli NumPy."""
+
+    def test_numpy_backend(self):
+        result = fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, "vanilla", num_simulations=50000, seed=2,
+                                           backend="numpy")
+        self.assertLess(abs(result.price - black_scholes_price(100, 100, 1, 0.05, 0.2)), 4 * result.std_error)
+
+    def test_numpy_barrier_matches_matrix_engine(self):
+        payoff = partial(barrier_knock_out, barrier=120, payoff_sousjacent=vanilla_call, barrier_type="up")
+        expected = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, payoff, 5000, 12, seed=4)
+        result = fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, "barrier", barrier=120, num_simulations=5000,
+                                           num_steps=12, seed=4, backend="numpy")
+        self.assertAlmostEqual(result.price, expected.price, places=10)
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba non installé")
+    def test_numba_matches_numpy(self):
+        for payoff_type in ["vanilla", "asian", "barrier"]:
+            with self.subTest(payoff_type=payoff_type):
+                kwargs = dict(barrier=120, num_simulations=100000, num_steps=50, seed=5)
+                compiled = fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, payoff_type, backend="numba", **kwargs)
+                numpy_result = fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, payoff_type, backend="numpy",
+                                                         **kwargs)
+                self.assertLess(abs(compiled.price - numpy_result.price),
+                                4 * np.hypot(compiled.std_error, numpy_result.std_error))
+
+    @unittest.skipIf(NUMBA_AVAILABLE, "numba installé")
+    def test_numba_backend_requires_numba(self):
+        with self.assertRaises(ImportError):
+            fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, backend="numba")
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, "lookback")
+        with self.assertRaises(ValueError):
+            fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, "barrier")
+        with self.assertRaises(ValueError):
+            fused_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, backend="cuda")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import tracemalloc
+import unittest
+from functools import partial
+
+from pricing import chunked_monte_carlo_pricing, monte_carlo_pricing, monte_carlo_simulation
+from pricing.black_scholes import black_scholes_greeks
+from pricing.greeks import pathwise_greeks, likelihood_ratio_greeks
+from pricing.payoffs import asian_payoff, barrier_knock_out, vanilla_call, vanilla_put
+
+
+class TestPathwiseGreeks(unittest.TestCase):
+    """Tests des Greeks par dérivées trajectorielles."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.S, cls.K, cls.T, cls.r, cls.sigma = 100, 100, 1, 0.05, 0.2
+
+    def test_vanilla_matches_black_scholes(self):
+        """Prix, delta, vega et rho compatibles avec Black-Scholes (call et put)."""
+        for option_type in ["call", "put"]:
+            greeks = pathwise_greeks(self.S, self.K, self.T, self.r, self.sigma, "vanilla", option_type,
+                                     200000, 4, seed=1)
+            reference = black_scholes_greeks(self.S, self.K, self.T, self.r, self.sigma, option_type)
+            for name in ["price", "delta", "vega", "rho"]:
+                self.assertLess(abs(greeks[name].price - float(reference[name])), 4 * greeks[name].std_error,
+                                f"{option_type} {name}")
+
+    def test_price_matches_engine(self):
+        """Le prix est celui du moteur par blocs sur les mêmes trajectoires."""
+        greeks = pathwise_greeks(self.S, self.K, self.T, self.r, self.sigma, "asian", "call", 20000, 12, seed=2)
+        reference = chunked_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, asian_payoff,
+                                                20000, 12, seed=2)
+        self.assertAlmostEqual(greeks["price"].price, reference.price, places=10)
+
+    def test_asian_matches_common_random_numbers(self):
+        """Greeks asiatiques égaux aux différences finies à nombres aléatoires communs."""
+        greeks = pathwise_greeks(self.S, self.K, self.T, self.r, self.sigma, "asian", "call", 50000, 12, seed=3)
+
+        def bumped(dS=0.0, dsigma=0.0, dr=0.0):
+            return chunked_monte_carlo_pricing(self.S + dS, self.K, self.T, self.r + dr, self.sigma + dsigma,
+                                               asian_payoff, 50000, 12, seed=3).price
+
+        h = 1e-3
+        self.assertAlmostEqual(greeks["delta"].price, (bumped(dS=h) - bumped(dS=-h)) / (2 * h), places=3)
+        self.assertAlmostEqual(greeks["vega"].price, (bumped(dsigma=h) - bumped(dsigma=-h)) / (2 * h), places=2)
+        self.assertAlmostEqual(greeks["rho"].price, (bumped(dr=h) - bumped(dr=-h)) / (2 * h), places=2)
+
+    def test_blocks_respect_memory_budget(self):
+        """Le pic mémoire de la boucle (temporaires par trajectoire compris) reste sous le budget."""
+        budget = 16 * 1024 ** 2
+        for payoff_type, num_simulations in [("vanilla", 2000000), ("asian", 100000)]:
+            tracemalloc.start()
+            pathwise_greeks(self.S, self.K, self.T, self.r, self.sigma, payoff_type, "call", num_simulations, 50,
+                            seed=1, max_memory_bytes=budget)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.assertLess(peak, budget, payoff_type)
+
+    def test_invalid_payoff_type(self):
+        with self.assertRaises(ValueError):
+            pathwise_greeks(self.S, self.K, self.T, self.r, self.sigma, "barrier")
+
+
+class TestLikelihoodRatioGreeks(unittest.TestCase):
+    """Tests des Greeks par rapport de vraisemblance."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.S, cls.K, cls.T, cls.r, cls.sigma = 100, 100, 1, 0.05, 0.2
+
+    def test_unreachable_barrier_is_vanilla(self):
+        """Barrière inatteignable : les Greeks sont ceux de Black-Scholes."""
+        greeks = likelihood_ratio_greeks(self.S, self.K, self.T, self.r, self.sigma, barrier_knock_out,
+                                         vanilla_put, 1e9, 200000, 4, seed=4)
+        reference = black_scholes_greeks(self.S, self.K, self.T, self.r, self.sigma, "put")
+        for name in ["price", "delta", "vega", "rho"]:
+            self.assertLess(abs(greeks[name].price - float(reference[name])), 4 * greeks[name].std_error, name)
+
+    def test_barrier_matches_finite_differences(self):
+        """Down-and-out : Greeks compatibles avec des différences finies à grand nombre de trajectoires."""
+        down_and_out = partial(barrier_knock_out, barrier_type="down")
+        greeks = likelihood_ratio_greeks(self.S, self.K, self.T, self.r, self.sigma, down_and_out,
+                                         vanilla_call, 90, 200000, 8, seed=5, antithetic=True)
+
+        def price(S=self.S, sigma=self.sigma):
+            ST = monte_carlo_simulation(S, self.T, self.r, sigma, 400000, 8, seed=6)
+            return monte_carlo_pricing(ST, self.K, self.r, self.T, down_and_out, vanilla_call, 90)
+
+        delta_fd = (price(S=self.S + 1) - price(S=self.S - 1)) / 2
+        vega_fd = (price(sigma=self.sigma + 0.01) - price(sigma=self.sigma - 0.01)) / 0.02
+        self.assertLess(abs(greeks["delta"].price - delta_fd), 4 * greeks["delta"].std_error + 0.01)
+        self.assertLess(abs(greeks["vega"].price - vega_fd), 4 * greeks["vega"].std_error + 0.5)
+        self.assertEqual(greeks["price"].num_paths, 200000)
+
+    def test_blocks_respect_memory_budget(self):
+        """Le pic mémoire de la boucle (normales, scores et échantillons) reste sous le budget."""
+        budget = 16 * 1024 ** 2
+        tracemalloc.start()
+        likelihood_ratio_greeks(self.S, self.K, self.T, self.r, self.sigma, barrier_knock_out, vanilla_call, 120,
+                                100000, 50, seed=1, max_memory_bytes=budget)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
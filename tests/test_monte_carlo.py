@@ -1,7 +1,21 @@
 import unittest
 import numpy as np
-from pricing import monte_carlo_simulation, monte_carlo_pricing
-from pricing.payoffs import vanilla_call
+from pricing import monte_carlo_simulation, monte_carlo_pricing, simple_monte_carlo_pricing
+from pricing import monte_carlo_path_blocks, chunked_monte_carlo_pricing, monte_carlo_running_statistics, PathSet
+from pricing import adaptive_monte_carlo_pricing
+from pricing.monte_carlo import block_size_from_memory
+from pricing.parallel import parallel_monte_carlo_pricing
+from config import PricingConfig
+from main import get_default_config
+from pricing.payoffs import vanilla_call, asian_payoff, barrier_knock_out
+from pricing.payoffs import (
+    vanilla_put, barrier_knock_in, double_barrier_knock_out, asian_geometric_payoff, asian_strike_payoff,
+    lookback_payoff
+)
+from pricing.monte_carlo import _gbm_paths_inplace
+from pricing.rng import standard_normals
+from pricing.schedule import with_schedule
+from functools import partial
 
 class TestMonteCarloConvergence(unittest.TestCase):
     """Test de convergence du modèle Monte Carlo."""
@@ -26,5 +40,300 @@ class TestMonteCarloConvergence(unittest.TestCase):
         for i in range(len(prices) - 1):
             self.assertAlmostEqual(prices[i], prices[-1], places=0, msg=f"Convergence faible entre {num_simulations_values[i]} et {num_simulations_values[-1]} simulations")
 
+
+class TestChunkedMonteCarlo(unittest.TestCase):
+    """Tests du moteur Monte Carlo par blocs à mémoire bornée."""
+
+    def setUp(self):
+        self.S, self.K, self.T, self.r, self.sigma = 100, 100, 1, 0.05, 0.2
+
+    def test_blocks_match_full_simulation(self):
+        """La concaténation des blocs redonne la matrice complète pour une même graine."""
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 1000, 50, seed=7)
+        blocks = list(monte_carlo_path_blocks(self.S, self.T, self.r, self.sigma, 1000, 50, seed=7, block_size=300))
+        self.assertEqual([b.shape[0] for b in blocks], [300, 300, 300, 100])
+        np.testing.assert_allclose(np.vstack(blocks), ST)
+
+    def test_price_independent_of_memory_budget(self):
+        """Prix et erreur standard ne dépendent pas de la taille des blocs."""
+        small = chunked_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, asian_payoff,
+                                            5000, 50, seed=3, max_memory_bytes=50 * 16 * 100)
+        large = chunked_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, asian_payoff,
+                                            5000, 50, seed=3, max_memory_bytes=10 ** 8)
+        full = simple_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, asian_payoff,
+                                          5000, 50, seed=3)
+        self.assertEqual(small.num_paths, 5000)
+        self.assertAlmostEqual(small.price, large.price, places=10)
+        self.assertAlmostEqual(small.std_error, large.std_error, places=10)
+        self.assertAlmostEqual(small.price, full, places=10)
+
+    def test_peak_memory_within_small_budget(self):
+        """Budget inférieur à un sous-flux : tranches de sous-flux comprises, le pic reste sous le budget."""
+        import tracemalloc
+        budget = 2 ** 20
+        tracemalloc.start()
+        chunked_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, asian_payoff, 5000, 252, seed=1,
+                                    max_memory_bytes=budget)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, budget)
+
+    def test_pricing_on_blocks(self):
+        """`monte_carlo_pricing` accepte un itérable de blocs."""
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 2000, 20, seed=11)
+        blocks = monte_carlo_path_blocks(self.S, self.T, self.r, self.sigma, 2000, 20, seed=11, block_size=128)
+        expected = monte_carlo_pricing(ST, self.K, self.r, self.T, payoff_sousjacent=vanilla_call)
+        price = monte_carlo_pricing(blocks, self.K, self.r, self.T, payoff_sousjacent=vanilla_call)
+        self.assertAlmostEqual(price, expected, places=10)
+
+    def test_block_size_from_memory(self):
+        """La taille de bloc respecte le budget mémoire."""
+        self.assertEqual(block_size_from_memory(252, 252 * 8 * 2 * 1000), 1000)
+        with self.assertRaises(ValueError):
+            block_size_from_memory(252, 100)
+
+
+class TestRunningStatisticsEngine(unittest.TestCase):
+    """Tests du moteur pas à pas sans matrice de trajectoires."""
+
+    def setUp(self):
+        self.S, self.T, self.r, self.sigma = 100, 1, 0.05, 0.25
+        self.n, self.m = 3000, 40
+
+    def _reference_paths(self, seed):
+        """Trajectoires complètes de même graine (mêmes flux aléatoires)."""
+        return PathSet(monte_carlo_simulation(self.S, self.T, self.r, self.sigma, self.n, self.m, seed=seed))
+
+    def test_statistics_match_full_paths(self):
+        """Les accumulateurs égalent les statistiques des trajectoires complètes."""
+        stats = monte_carlo_running_statistics(self.S, self.T, self.r, self.sigma, self.n, self.m, seed=9,
+                                               block_size=1024)
+        reference = self._reference_paths(9)
+        for name in ["terminal", "running_max", "running_min", "arithmetic_mean", "geometric_mean"]:
+            np.testing.assert_allclose(getattr(stats, name), getattr(reference, name), rtol=1e-10)
+        self.assertEqual(stats.shape, (self.n, self.m))
+
+    def test_payoffs_without_paths(self):
+        """Les payoffs asiatiques et barrières s'évaluent sans la matrice."""
+        stats = monte_carlo_running_statistics(self.S, self.T, self.r, self.sigma, self.n, self.m, seed=9,
+                                               block_size=self.n)
+        reference = self._reference_paths(9)
+        self.assertAlmostEqual(monte_carlo_pricing(stats, 100, self.r, self.T, payoff_sousjacent=asian_payoff),
+                               monte_carlo_pricing(reference, 100, self.r, self.T, payoff_sousjacent=asian_payoff),
+                               places=8)
+        np.testing.assert_allclose(barrier_knock_out(stats, 100, 130, vanilla_call),
+                                   barrier_knock_out(reference, 100, 130, vanilla_call), rtol=1e-10)
+        with self.assertRaises(ValueError):
+            stats.first_hit_index(130)
+
+    def test_memory_is_linear_in_paths(self):
+        """Le pic mémoire reste très inférieur à la taille de la matrice."""
+        import tracemalloc
+        n, m = 20000, 252
+        tracemalloc.start()
+        monte_carlo_running_statistics(self.S, self.T, self.r, self.sigma, n, m, seed=1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, n * m * 8 / 10)
+
+
+
+class TestAntitheticVariates(unittest.TestCase):
+    """Tests des variates antithétiques."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.S, cls.K, cls.T, cls.r, cls.sigma = 100, 100, 1, 0.05, 0.2
+        cls.num_steps = 12
+
+    def test_paired_paths_are_mirrored(self):
+        """Les log-rendements des trajectoires 2k et 2k + 1 sont symétriques autour de la dérive."""
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 2000, self.num_steps, seed=3, antithetic=True)
+        log_returns = np.diff(np.log(np.hstack([np.full((2000, 1), self.S), ST])), axis=1)
+        drift = (self.r - 0.5 * self.sigma ** 2) * self.T / self.num_steps
+        np.testing.assert_allclose(log_returns[0::2] - drift, drift - log_returns[1::2], atol=1e-12)
+
+    def test_engines_agree(self):
+        """Matrice, blocs, moteur pas à pas et pool donnent les mêmes trajectoires antithétiques."""
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 3000, self.num_steps, seed=5, antithetic=True)
+        blocks = list(monte_carlo_path_blocks(
+            self.S, self.T, self.r, self.sigma, 3000, self.num_steps, seed=5, block_size=1000, antithetic=True
+        ))
+        np.testing.assert_allclose(np.vstack(blocks), ST)
+        stats = monte_carlo_running_statistics(
+            self.S, self.T, self.r, self.sigma, 3000, self.num_steps, seed=5, antithetic=True
+        )
+        np.testing.assert_allclose(stats.terminal, ST[:, -1])
+        chunked = chunked_monte_carlo_pricing(
+            self.S, self.K, self.T, self.r, self.sigma, vanilla_call, 3000, self.num_steps, seed=5,
+            max_memory_bytes=64 * 1024, antithetic=True
+        )
+        parallel = parallel_monte_carlo_pricing(
+            self.S, self.K, self.T, self.r, self.sigma, vanilla_call, 3000, self.num_steps, seed=5,
+            num_workers=1, block_size=1024, antithetic=True
+        )
+        self.assertAlmostEqual(chunked.price, parallel.price, places=10)
+        self.assertAlmostEqual(chunked.std_error, parallel.std_error, places=10)
+
+    def test_standard_error_uses_pairs(self):
+        """L'erreur standard est celle des moyennes de paires, plus faible pour un call."""
+        plain = chunked_monte_carlo_pricing(
+            self.S, self.K, self.T, self.r, self.sigma, vanilla_call, 100000, self.num_steps, seed=7
+        )
+        anti = chunked_monte_carlo_pricing(
+            self.S, self.K, self.T, self.r, self.sigma, vanilla_call, 100000, self.num_steps, seed=7,
+            antithetic=True
+        )
+        # Payoff terminal : le moteur ne simule que la date finale
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 100000, 1, seed=7, antithetic=True)
+        payoffs = vanilla_call(ST[:, -1], self.K)
+        pairs = 0.5 * (payoffs[0::2] + payoffs[1::2])
+        expected = np.exp(-self.r * self.T) * pairs.std(ddof=1) / np.sqrt(pairs.size)
+        self.assertAlmostEqual(anti.std_error, expected, places=10)
+        self.assertEqual(anti.num_paths, 100000)
+        self.assertLess(anti.std_error, 0.75 * plain.std_error)
+        self.assertLess(abs(anti.price - 10.4506), 4 * anti.std_error)
+
+    def test_odd_number_of_simulations(self):
+        """Un nombre impair de trajectoires est refusé."""
+        with self.assertRaises(ValueError):
+            monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 1001, self.num_steps, antithetic=True)
+        with self.assertRaises(ValueError):
+            list(monte_carlo_path_blocks(
+                self.S, self.T, self.r, self.sigma, 1000, self.num_steps, block_size=333, antithetic=True
+            ))
+
+    def test_config_switch(self):
+        """Le paramètre `antithetic` de la configuration pilote la simulation."""
+        config = PricingConfig()
+        config.set_simulation_param("num_simulations", 1000)
+        config.set_simulation_param("antithetic", True)
+        params = config.get_simulation_params()
+        price = simple_monte_carlo_pricing(
+            self.S, self.K, self.T, self.r, self.sigma, vanilla_call,
+            params["num_simulations"], self.num_steps, seed=11, antithetic=params["antithetic"]
+        )
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 1000, 1, seed=11, antithetic=True)
+        self.assertAlmostEqual(price, monte_carlo_pricing(ST, self.K, self.r, self.T, vanilla_call), places=12)
+        self.assertIn("antithetic", get_default_config()["simulation_params"])
+
+        config.set_simulation_param("num_simulations", 1001)
+        self.assertFalse(config.validate())
+
+
+
+class TestAdaptiveMonteCarlo(unittest.TestCase):
+    """Tests du pricing Monte Carlo adaptatif."""
+
+    def test_stops_at_absolute_tolerance(self):
+        """Arrêt au premier lot où l'erreur standard passe sous la tolérance."""
+        result = adaptive_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, abs_tolerance=0.05,
+                                              num_steps=4, seed=1, batch_size=4096)
+        self.assertTrue(result.converged)
+        self.assertLessEqual(result.std_error, 0.05)
+        # Un lot de moins ne suffisait pas
+        previous = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call,
+                                               result.num_paths - 4096, 4, seed=1)
+        self.assertGreater(previous.std_error, 0.05)
+        low, high = result.confidence_interval()
+        self.assertLess(low, 10.4506)
+        self.assertGreater(high, 10.4506)
+        self.assertGreater(result.elapsed_time, 0)
+
+    def test_matches_chunked_engine(self):
+        """Même graine, mêmes trajectoires que le moteur par blocs."""
+        result = adaptive_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, asian_payoff, rel_tolerance=0.01,
+                                              num_steps=12, seed=2, batch_size=2048, antithetic=True)
+        reference = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, asian_payoff, result.num_paths, 12,
+                                                seed=2, antithetic=True)
+        self.assertTrue(result.converged)
+        self.assertLessEqual(result.std_error, 0.01 * result.price)
+        self.assertAlmostEqual(result.price, reference.price, places=10)
+        self.assertAlmostEqual(result.std_error, reference.std_error, places=10)
+
+    def test_budget_limits(self):
+        """Sans convergence, arrêt sur le nombre maximal de trajectoires ou le budget de temps."""
+        capped = adaptive_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, abs_tolerance=1e-6,
+                                              max_simulations=10000, num_steps=4, seed=3, batch_size=4096)
+        self.assertFalse(capped.converged)
+        self.assertEqual(capped.num_paths, 10000)
+        timed = adaptive_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, abs_tolerance=1e-6,
+                                             time_budget=1e-9, num_steps=4, seed=3, batch_size=4096)
+        self.assertFalse(timed.converged)
+        self.assertEqual(timed.num_paths, 4096)
+
+    def test_invalid_tolerance(self):
+        with self.assertRaises(ValueError):
+            adaptive_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, abs_tolerance=-1.0)
+
+
+class TestFloat32Mode(unittest.TestCase):
+    """Tests du mode float32 (trajectoires en float32, moyennes en float64)."""
+
+    PAYOFFS = {
+        "vanilla_call": vanilla_call,
+        "vanilla_put": vanilla_put,
+        "barrier_knock_out": partial(barrier_knock_out, barrier=130, payoff_sousjacent=vanilla_call,
+                                     barrier_type="up"),
+        "barrier_knock_in": partial(barrier_knock_in, barrier=85, payoff_sousjacent=vanilla_put,
+                                    barrier_type="down"),
+        "double_barrier_knock_out": partial(double_barrier_knock_out, lower_barrier=70, upper_barrier=140,
+                                            payoff_sousjacent=vanilla_call),
+        "asian_payoff": asian_payoff,
+        "asian_geometric_payoff": asian_geometric_payoff,
+        "asian_strike_payoff": with_schedule(lambda ST, K: asian_strike_payoff(ST, "call"),
+                                             asian_strike_payoff.schedule),
+        "lookback_payoff": with_schedule(lambda ST, K: lookback_payoff(ST, "call"), lookback_payoff.schedule),
+    }
+
+    def test_paths_are_float32(self):
+        ST = monte_carlo_simulation(100, 1, 0.05, 0.2, 1000, 12, seed=1, dtype=np.float32)
+        self.assertEqual(ST.dtype, np.float32)
+        block = next(monte_carlo_path_blocks(100, 1, 0.05, 0.2, 1000, 12, seed=1, dtype=np.float32))
+        self.assertEqual(block.dtype, np.float32)
+
+    def test_rounding_error_per_payoff(self):
+        """Mêmes normales arrondies en float32 : écart relatif de prix inférieur à 1e-5 pour chaque payoff."""
+        Z = standard_normals(3, 0, 50000, 252)
+        paths64 = _gbm_paths_inplace(Z.copy(), 100, 1, 0.05, 0.2)
+        paths32 = _gbm_paths_inplace(Z.astype(np.float32), 100, 1, 0.05, 0.2)
+        self.assertEqual(paths32.dtype, np.float32)
+        for name, payoff in self.PAYOFFS.items():
+            with self.subTest(payoff=name):
+                price64 = monte_carlo_pricing(paths64, 100, 0.05, 1, payoff)
+                price32 = monte_carlo_pricing(paths32, 100, 0.05, 1, payoff)
+                self.assertLess(abs(price32 - price64), 1e-5 * abs(price64))
+
+    def test_engine_matches_float64(self):
+        """Flux float32 distincts : prix compatibles avec float64 aux erreurs standard près."""
+        for name, payoff in self.PAYOFFS.items():
+            with self.subTest(payoff=name):
+                result64 = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, payoff, 20000, 50, seed=4)
+                result32 = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, payoff, 20000, 50, seed=4,
+                                                       dtype=np.float32)
+                self.assertLess(abs(result32.price - result64.price),
+                                4 * np.hypot(result32.std_error, result64.std_error))
+
+    def test_float32_doubles_block_size(self):
+        blocks64 = list(monte_carlo_path_blocks(100, 1, 0.05, 0.2, 8192, 252, seed=1, max_memory_bytes=2**22))
+        blocks32 = list(monte_carlo_path_blocks(100, 1, 0.05, 0.2, 8192, 252, seed=1, max_memory_bytes=2**22,
+                                                dtype=np.float32))
+        self.assertEqual(len(blocks64), 2 * len(blocks32))
+
+    def test_parallel_and_simple(self):
+        reference = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, asian_payoff, 20000, 12, seed=6,
+                                                dtype=np.float32)
+        parallel = parallel_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, asian_payoff, 20000, 12, seed=6,
+                                                num_workers=2, block_size=4096, dtype=np.float32)
+        self.assertAlmostEqual(parallel.price, reference.price, places=10)
+        price = simple_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, asian_payoff, 20000, 12, seed=6,
+                                           dtype=np.float32)
+        self.assertIsInstance(price, float)
+
+    def test_invalid_dtype(self):
+        with self.assertRaises(ValueError):
+            monte_carlo_simulation(100, 1, 0.05, 0.2, 100, 12, dtype=np.float16)
+
+
 if __name__ == "__main__":
     unittest.main()
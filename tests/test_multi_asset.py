@@ -0,0 +1,153 @@
+import math
+import tracemalloc
+import unittest
+import numpy as np
+from scipy.special import ndtr
+
+from pricing import (
+    correlation_factor, monte_carlo_simulation, multi_asset_monte_carlo_pricing, multi_asset_path_blocks
+)
+from pricing.black_scholes import black_scholes_price
+from pricing.payoffs import basket_payoff, best_of_payoff, spread_payoff
+from pricing.schedule import ObservationSchedule, with_schedule
+
+
+class TestCorrelationFactor(unittest.TestCase):
+    """Tests de la factorisation de la matrice de corrélation."""
+
+    def test_cholesky(self):
+        correlation = np.array([[1.0, 0.5, 0.2], [0.5, 1.0, -0.3], [0.2, -0.3, 1.0]])
+        factor = correlation_factor(correlation)
+        np.testing.assert_allclose(factor @ factor.T, correlation, atol=1e-14)
+        np.testing.assert_array_equal(factor, np.tril(factor))
+
+    def test_semi_definite_uses_eigen_decomposition(self):
+        correlation = np.ones((3, 3))
+        factor = correlation_factor(correlation)
+        np.testing.assert_allclose(factor @ factor.T, correlation, atol=1e-12)
+
+    def test_invalid_matrices(self):
+        for correlation in [np.array([[1.0, 0.9], [0.1, 1.0]]), np.array([[2.0, 0.0], [0.0, 1.0]]),
+                            np.array([[1.0, 0.9, 0.9], [0.9, 1.0, -0.9], [0.9, -0.9, 1.0]]), np.ones(3)]:
+            with self.assertRaises(ValueError):
+                correlation_factor(correlation)
+
+
+class TestMultiAssetPaths(unittest.TestCase):
+    """Tests du moteur GBM multi-sous-jacents."""
+
+    S = np.array([100.0, 90.0, 110.0])
+    sigma = np.array([0.2, 0.3, 0.25])
+    correlation = np.array([[1.0, 0.6, 0.3], [0.6, 1.0, 0.4], [0.3, 0.4, 1.0]])
+
+    def test_single_asset_matches_scalar_engine(self):
+        (block,) = multi_asset_path_blocks([100.0], [0.2], [[1.0]], 1, 0.05, 3000, 12, seed=9)
+        np.testing.assert_array_equal(block[:, 0, :], monte_carlo_simulation(100, 1, 0.05, 0.2, 3000, 12, seed=9))
+
+    def test_blocks_independent_of_block_size(self):
+        full = np.concatenate(list(multi_asset_path_blocks(self.S, self.sigma, self.correlation, 1, 0.05, 5000, 6,
+                                                           seed=1)))
+        blocks = list(multi_asset_path_blocks(self.S, self.sigma, self.correlation, 1, 0.05, 5000, 6, seed=1,
+                                              block_size=1024))
+        self.assertEqual(len(blocks), 5)
+        np.testing.assert_array_equal(np.concatenate(blocks), full)
+
+    def test_memory_cap(self):
+        """20 sous-jacents sur 252 pas : le pic mémoire de la simulation reste sous le budget."""
+        max_memory_bytes = 32 * 1024 ** 2
+        S, sigma = np.full(20, 100.0), np.full(20, 0.2)
+        correlation = np.full((20, 20), 0.5) + 0.5 * np.eye(20)
+        num_paths = 0
+        for block in multi_asset_path_blocks(S, sigma, correlation, 1, 0.05, 3000, 252, seed=2,
+                                             max_memory_bytes=max_memory_bytes):
+            self.assertEqual(block.shape[1:], (20, 252))
+            num_paths += block.shape[0]
+        self.assertEqual(num_paths, 3000)
+
+        average = with_schedule(lambda paths, K: np.maximum(paths.mean(axis=(1, 2)) - K, 0.0),
+                                ObservationSchedule.monitoring())
+        tracemalloc.start()
+        multi_asset_monte_carlo_pricing(S, sigma, correlation, 100, 1, 0.05, average, 3000, 252, seed=2,
+                                        max_memory_bytes=max_memory_bytes)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, max_memory_bytes)
+
+    def test_moments(self):
+        """Moyennes forward et corrélation des log-rendements."""
+        (block,) = multi_asset_path_blocks(self.S, self.sigma, self.correlation, 1, 0.05, 100000, 2, seed=3,
+                                           block_size=100000)
+        terminal = block[:, :, -1]
+        np.testing.assert_allclose(terminal.mean(axis=0), self.S * math.exp(0.05), rtol=5e-3)
+        log_returns = np.log(block[:, :, 0] / self.S)
+        np.testing.assert_allclose(np.corrcoef(log_returns.T), self.correlation, atol=1e-2)
+        np.testing.assert_allclose(log_returns.std(axis=0), self.sigma * math.sqrt(0.5), rtol=1e-2)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            next(multi_asset_path_blocks([100, 90], [0.2], np.eye(2), 1, 0.05, 100, 12))
+        with self.assertRaises(ValueError):
+            next(multi_asset_path_blocks([100, 90], [0.2, 0.3], np.eye(3), 1, 0.05, 100, 12))
+        with self.assertRaises(ValueError):
+            next(multi_asset_path_blocks([100, -90], [0.2, 0.3], np.eye(2), 1, 0.05, 100, 12))
+
+
+class TestMultiAssetPricing(unittest.TestCase):
+    """Tests des payoffs panier, spread et best-of."""
+
+    def test_spread_matches_margrabe(self):
+        """Spread de strike nul : option d'échange de Margrabe."""
+        S1, S2, sigma1, sigma2, rho, T = 100.0, 95.0, 0.2, 0.3, 0.5, 1.0
+        vol = math.sqrt(sigma1 ** 2 + sigma2 ** 2 - 2 * rho * sigma1 * sigma2)
+        d1 = (math.log(S1 / S2) + 0.5 * vol ** 2 * T) / (vol * math.sqrt(T))
+        margrabe = S1 * ndtr(d1) - S2 * ndtr(d1 - vol * math.sqrt(T))
+
+        result = multi_asset_monte_carlo_pricing([S1, S2], [sigma1, sigma2], [[1, rho], [rho, 1]], 0.0, T, 0.05,
+                                                 spread_payoff, 200000, seed=4)
+        self.assertLess(abs(result.price - margrabe), 4 * result.std_error)
+
+    def test_perfectly_correlated_basket_is_vanilla(self):
+        """Sous-jacents identiques parfaitement corrélés : le panier est une vanille."""
+        result = multi_asset_monte_carlo_pricing([100] * 4, [0.2] * 4, np.ones((4, 4)), 100, 1, 0.05, basket_payoff,
+                                                 100000, seed=5)
+        self.assertLess(abs(result.price - black_scholes_price(100, 100, 1, 0.05, 0.2)), 4 * result.std_error)
+
+    def test_terminal_payoffs_simulate_one_step(self):
+        """Les payoffs multi-sous-jacents déclarent la date finale : un bloc n'a qu'une date."""
+        seen = []
+
+        def recording_payoff(ST, K):
+            seen.append(ST.shape)
+            return basket_payoff(ST, K)
+        recording_payoff.schedule = basket_payoff.schedule
+
+        multi_asset_monte_carlo_pricing([100, 100], [0.2, 0.2], np.eye(2), 100, 1, 0.05, recording_payoff, 1000,
+                                        seed=1)
+        self.assertEqual(seen, [(1000, 2, 1)])
+
+    def test_best_of_bounds(self):
+        kwargs = dict(S=[100, 100, 100], sigma=[0.2, 0.25, 0.3], correlation=np.eye(3) * 0.7 + 0.3, K=100, T=1,
+                      r=0.05, num_simulations=50000, seed=6)
+        best_of = multi_asset_monte_carlo_pricing(payoff_function=best_of_payoff, **kwargs)
+        self.assertGreater(best_of.price, black_scholes_price(100, 100, 1, 0.05, 0.3))
+        put = multi_asset_monte_carlo_pricing(payoff_function=lambda ST, K: best_of_payoff(ST, K, "put"),
+                                              num_steps=1, **kwargs)
+        self.assertGreater(put.price, black_scholes_price(100, 100, 1, 0.05, 0.3, "put"))
+
+    def test_payoff_values(self):
+        ST = np.array([[[100.0, 120.0], [100.0, 80.0]], [[100.0, 90.0], [100.0, 110.0]]])
+        np.testing.assert_allclose(basket_payoff(ST, 95), [5.0, 5.0])
+        np.testing.assert_allclose(basket_payoff(ST, 95, weights=[0.75, 0.25], option_type="put"), [0.0, 0.0])
+        np.testing.assert_allclose(spread_payoff(ST, 10), [30.0, 0.0])
+        np.testing.assert_allclose(best_of_payoff(ST, 100), [20.0, 10.0])
+        np.testing.assert_allclose(best_of_payoff(ST, 100, "put"), [20.0, 10.0])
+        with self.assertRaises(ValueError):
+            basket_payoff(ST[:, :, -1], 100)
+        with self.assertRaises(ValueError):
+            basket_payoff(ST, 100, weights=[1.0])
+        with self.assertRaises(ValueError):
+            spread_payoff(ST[:, :1], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
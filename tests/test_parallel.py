@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+
+from pricing.parallel import parallel_monte_carlo_pricing
+from pricing.black_scholes import black_scholes_price
+from pricing.payoffs import vanilla_call, asian_payoff
+
+
+class TestParallelMonteCarlo(unittest.TestCase):
+    """Tests du pricing Monte Carlo sur pool de processus."""
+
+    def test_bit_identical_across_workers(self):
+        """Même graine → même prix au bit près, quel que soit le nombre de processus."""
+        results = [
+            parallel_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, asian_payoff, 20000, 20, seed=123,
+                                         num_workers=workers, block_size=3000)
+            for workers in [1, 2, 3]
+        ]
+        for result in results[1:]:
+            self.assertEqual(result.price, results[0].price)
+            self.assertEqual(result.std_error, results[0].std_error)
+        self.assertEqual(results[0].num_paths, 20000)
+
+    def test_converges_to_black_scholes(self):
+        """Le prix parallèle est compatible avec Black-Scholes."""
+        result = parallel_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, 100000, 1, seed=7,
+                                              num_workers=2)
+        bs = black_scholes_price(100, 100, 1, 0.05, 0.2)
+        self.assertLess(abs(result.price - bs), 4 * result.std_error)
+
+    def test_global_random_state_untouched(self):
+        """Le pricing parallèle ne modifie pas l'état aléatoire global."""
+        np.random.seed(0)
+        expected = np.random.standard_normal(3)
+        np.random.seed(0)
+        parallel_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, 1000, 5, seed=1, num_workers=1)
+        np.testing.assert_array_equal(np.random.standard_normal(3), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+
+from pricing import monte_carlo_simulation, monte_carlo_pricing, PathSet
+from pricing.payoffs import (
+    vanilla_call, vanilla_put, asian_payoff, asian_geometric_payoff, asian_strike_payoff,
+    barrier_knock_in, barrier_knock_out, double_barrier_knock_out
+)
+
+
+class TestPathSet(unittest.TestCase):
+    """Tests du PathSet et de ses statistiques en cache."""
+
+    def setUp(self):
+        self.ST = monte_carlo_simulation(100, 1, 0.05, 0.3, 2000, 50, seed=5)
+        self.paths = PathSet(self.ST)
+
+    def test_statistics(self):
+        """Les statistiques égalent les réductions NumPy directes."""
+        np.testing.assert_array_equal(self.paths.terminal, self.ST[:, -1])
+        np.testing.assert_array_equal(self.paths.running_max, np.max(self.ST, axis=1))
+        np.testing.assert_array_equal(self.paths.running_min, np.min(self.ST, axis=1))
+        np.testing.assert_allclose(self.paths.arithmetic_mean, np.mean(self.ST, axis=1), rtol=1e-14)
+        np.testing.assert_allclose(self.paths.geometric_mean, np.exp(np.mean(np.log(self.ST), axis=1)), rtol=1e-14)
+
+    def test_statistics_are_cached(self):
+        """Une statistique n'est calculée qu'une fois."""
+        self.assertIs(self.paths.running_max, self.paths.running_max)
+        self.assertIs(self.paths.first_hit_index(120), self.paths.first_hit_index(120))
+
+    def test_first_hit_index(self):
+        """Premier indice d'atteinte de la barrière, -1 si jamais atteinte."""
+        paths = PathSet(np.array([[90, 100, 110], [130, 120, 115], [100, 95, 99]]))
+        np.testing.assert_array_equal(paths.first_hit_index(110), [2, 0, -1])
+        np.testing.assert_array_equal(paths.first_hit_index(95, "down"), [0, -1, 1])
+
+    def test_payoffs_accept_path_set(self):
+        """Les payoffs donnent le même résultat sur un PathSet et sur la matrice."""
+        K, barrier = 100, 130
+        cases = [
+            (vanilla_call(self.paths, K), vanilla_call(self.ST[:, -1], K)),
+            (vanilla_put(self.paths, K), vanilla_put(self.ST[:, -1], K)),
+            (asian_payoff(self.paths, K), asian_payoff(self.ST, K)),
+            (asian_geometric_payoff(self.paths, K, "put"), asian_geometric_payoff(self.ST, K, "put")),
+            (asian_strike_payoff(self.paths, "call"), asian_strike_payoff(self.ST, "call")),
+            (barrier_knock_out(self.paths, K, barrier, vanilla_call), barrier_knock_out(self.ST, K, barrier, vanilla_call)),
+            (barrier_knock_in(self.paths, K, 80, vanilla_put, "down"), barrier_knock_in(self.ST, K, 80, vanilla_put, "down")),
+            (double_barrier_knock_out(self.paths, K, 80, barrier, vanilla_call),
+             double_barrier_knock_out(self.ST, K, 80, barrier, vanilla_call)),
+        ]
+        for result, expected in cases:
+            np.testing.assert_allclose(result, expected, rtol=1e-14)
+
+    def test_monte_carlo_pricing_with_path_set(self):
+        """Avec un PathSet, le payoff sous-jacent choisit sa statistique (ex. asiatique)."""
+        price = monte_carlo_pricing(self.paths, 100, 0.05, 1, payoff_sousjacent=asian_payoff)
+        expected = np.exp(-0.05) * np.mean(asian_payoff(self.ST, 100))
+        self.assertAlmostEqual(price, expected, places=12)
+        vanilla = monte_carlo_pricing(self.paths, 100, 0.05, 1, payoff_sousjacent=vanilla_call)
+        self.assertAlmostEqual(vanilla, monte_carlo_pricing(self.ST, 100, 0.05, 1, payoff_sousjacent=vanilla_call), places=12)
+
+
+if __name__ == "__main__":
+    unittest.main()
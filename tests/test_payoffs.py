@@ -1,8 +1,27 @@
 import unittest
+from functools import partial
+
 import numpy as np
 
-from pricing import monte_carlo_simulation, monte_carlo_pricing
+from math import exp, log, sqrt
+
+from scipy.stats import norm
+
+from pricing import monte_carlo_simulation, monte_carlo_pricing, PathSet
+from pricing import chunked_monte_carlo_pricing, simple_monte_carlo_pricing
+from pricing.parallel import parallel_monte_carlo_pricing
+from pricing.schedule import ObservationSchedule, with_schedule
+from pricing.black_scholes import black_scholes_price
 from pricing.payoffs import vanilla_call, vanilla_put, barrier_knock_in, barrier_knock_out, asian_payoff
+from pricing.payoffs import double_barrier_knock_out, lookback_payoff
+
+
+def continuous_lookback_call(ST, K):
+    """Lookback à strike fixe surveillé en continu (niveau module : sérialisable pour le pool)."""
+    return lookback_payoff(ST, "call", fixed_strike=True, K=K, monitoring="continuous")
+
+
+continuous_lookback_call.schedule = lookback_payoff.schedule
 
 
 class TestPayoffs(unittest.TestCase):
@@ -74,5 +93,126 @@ class TestPayoffs(unittest.TestCase):
         np.testing.assert_array_equal(result_down_in, expected_down_in)
 
 
+class TestContinuousMonitoring(unittest.TestCase):
+    """Tests des barrières continues et des extrema par pont brownien."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.S, cls.K, cls.T, cls.r, cls.sigma = 100, 100, 1, 0.05, 0.2
+        ST = monte_carlo_simulation(cls.S, cls.T, cls.r, cls.sigma, 200000, 10, seed=1)
+        cls.paths = PathSet(ST, spot=cls.S, sigma=cls.sigma, T=cls.T, seed=2)
+
+    def _down_and_out_exact(self, B):
+        """Prix exact (Merton) du call down-and-out continu, B <= K."""
+        S, K, T, r, sigma = self.S, self.K, self.T, self.r, self.sigma
+        lam = (r + 0.5 * sigma ** 2) / sigma ** 2
+        y = log(B ** 2 / (S * K)) / (sigma * sqrt(T)) + lam * sigma * sqrt(T)
+        down_and_in = (S * (B / S) ** (2 * lam) * norm.cdf(y)
+                       - K * exp(-r * T) * (B / S) ** (2 * lam - 2) * norm.cdf(y - sigma * sqrt(T)))
+        return black_scholes_price(S, K, T, r, sigma) - down_and_in
+
+    def test_down_and_out_matches_closed_form(self):
+        """Down-and-out continu sur 10 pas : prix exact (Merton), sans biais de discrétisation."""
+        K, T, r, B = self.K, self.T, self.r, 90
+        exact = self._down_and_out_exact(B)
+
+        continuous = exp(-r * T) * barrier_knock_out(self.paths, K, B, vanilla_call, "down", "continuous")
+        discrete = exp(-r * T) * barrier_knock_out(self.paths, K, B, vanilla_call, "down")
+        std_error = continuous.std(ddof=1) / np.sqrt(continuous.size)
+        self.assertLess(abs(continuous.mean() - exact), 4 * std_error)
+        self.assertGreater(discrete.mean() - exact, 10 * std_error)  # Biais de l'observation discrète
+
+    def test_engines_price_continuous_barrier(self):
+        """Les moteurs transmettent le modèle au PathSet : barrière continue de bout en bout."""
+        payoff = partial(barrier_knock_out, barrier=90, payoff_sousjacent=vanilla_call, barrier_type="down",
+                         monitoring="continuous")
+        exact = self._down_and_out_exact(90)
+        args = (self.S, self.K, self.T, self.r, self.sigma, payoff, 100000, 10)
+        results = {
+            "simple": simple_monte_carlo_pricing(*args, seed=2),
+            "chunked": chunked_monte_carlo_pricing(*args, seed=2, max_memory_bytes=2 ** 20),
+            "parallel": parallel_monte_carlo_pricing(*args, seed=2, num_workers=2, block_size=16384),
+        }
+        std_error = results["chunked"].std_error
+        for name, result in results.items():
+            with self.subTest(engine=name):
+                self.assertLess(abs(getattr(result, "price", result) - exact), 4 * std_error)
+
+    def test_irregular_dates_bridge_variance(self):
+        """Dates d'observation irrégulières : variance du pont propre à chaque intervalle."""
+        fractions = [0.05, 0.1, 0.15, 0.6, 1.0]
+        payoff = with_schedule(
+            partial(barrier_knock_out, barrier=90, payoff_sousjacent=vanilla_call, barrier_type="down",
+                    monitoring="continuous"),
+            ObservationSchedule.monitoring(dates=fractions)
+        )
+        result = chunked_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, payoff, 200000, 252,
+                                             seed=4)
+        self.assertLess(abs(result.price - self._down_and_out_exact(90)), 4 * result.std_error)
+
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 10, 252, seed=4, dates=fractions)
+        with self.assertRaises(ValueError):
+            PathSet(ST, spot=self.S, sigma=self.sigma, T=self.T, dates=fractions[1:])
+
+    def test_in_out_parity(self):
+        """Knock-in + knock-out continus = vanille, trajectoire par trajectoire."""
+        knock_in = barrier_knock_in(self.paths, self.K, 120, vanilla_call, "up", "continuous")
+        knock_out = barrier_knock_out(self.paths, self.K, 120, vanilla_call, "up", "continuous")
+        np.testing.assert_allclose(knock_in + knock_out, vanilla_call(self.paths, self.K), atol=1e-12)
+
+    def test_double_barrier_limits(self):
+        """Corridor dont une barrière est inatteignable : survie de la barrière simple."""
+        np.testing.assert_allclose(self.paths.corridor_survival_probability(1e-3, 120),
+                                   self.paths.survival_probability(120, "up"), atol=1e-12)
+        np.testing.assert_allclose(self.paths.corridor_survival_probability(80, 1e5),
+                                   self.paths.survival_probability(80, "down"), atol=1e-12)
+        corridor = double_barrier_knock_out(self.paths, self.K, 80, 130, vanilla_call, "continuous")
+        discrete = double_barrier_knock_out(self.paths, self.K, 80, 130, vanilla_call)
+        self.assertTrue(np.all(corridor <= discrete + 1e-12))
+
+    def test_continuous_maximum_distribution(self):
+        """Sans dérive en log, E[log(max / S)] = sigma * sqrt(2T / pi) (principe de réflexion)."""
+        r = 0.5 * self.sigma ** 2
+        ST = monte_carlo_simulation(self.S, self.T, r, self.sigma, 200000, 10, seed=3)
+        paths = PathSet(ST, spot=self.S, sigma=self.sigma, T=self.T, seed=1)
+        log_max = np.log(paths.continuous_extremum("max") / self.S)
+        expected = self.sigma * sqrt(2 * self.T / np.pi)
+        self.assertLess(abs(log_max.mean() - expected), 4 * log_max.std() / np.sqrt(log_max.size))
+        self.assertTrue(np.all(paths.continuous_extremum("max") >= paths.running_max))
+        self.assertTrue(np.all(paths.continuous_extremum("min") <= paths.running_min))
+
+    def test_lookback_payoff(self):
+        """Lookbacks à strike flottant et fixe, discrets et continus."""
+        ST = np.array([[90.0, 110.0, 100.0], [105.0, 95.0, 120.0]])
+        np.testing.assert_array_equal(lookback_payoff(ST, "call"), [10.0, 25.0])
+        np.testing.assert_array_equal(lookback_payoff(ST, "put"), [10.0, 0.0])
+        np.testing.assert_array_equal(lookback_payoff(ST, "call", fixed_strike=True, K=100), [10.0, 20.0])
+        np.testing.assert_array_equal(lookback_payoff(ST, "put", fixed_strike=True, K=100), [10.0, 5.0])
+        continuous = lookback_payoff(self.paths, "call", monitoring="continuous")
+        self.assertTrue(np.all(continuous >= lookback_payoff(self.paths, "call")))
+
+    def test_continuous_lookback_reproducible(self):
+        """Uniformes du pont tirées des flux Philox : prix identique d'un run et d'un découpage à l'autre."""
+        args = (self.S, self.K, self.T, self.r, self.sigma, continuous_lookback_call, 20000, 10)
+        reference = simple_monte_carlo_pricing(*args, seed=5)
+        self.assertEqual(simple_monte_carlo_pricing(*args, seed=5), reference)
+        self.assertNotEqual(simple_monte_carlo_pricing(*args, seed=6), reference)
+        for max_memory_bytes in (2 ** 18, 2 ** 20):
+            with self.subTest(max_memory_bytes=max_memory_bytes):
+                result = chunked_monte_carlo_pricing(*args, seed=5, max_memory_bytes=max_memory_bytes)
+                self.assertAlmostEqual(result.price, reference, places=12)
+        for block_size in (4096, 16384):
+            with self.subTest(block_size=block_size):
+                result = parallel_monte_carlo_pricing(*args, seed=5, num_workers=2, block_size=block_size)
+                self.assertAlmostEqual(result.price, reference, places=12)
+
+    def test_continuous_requires_model(self):
+        """Le pont brownien nécessite spot, sigma et T."""
+        with self.assertRaises(ValueError):
+            barrier_knock_out(PathSet(np.ones((2, 3)) * 100), 100, 120, vanilla_call, monitoring="continuous")
+        with self.assertRaises(ValueError):
+            barrier_knock_out(self.paths, 100, 120, vanilla_call, monitoring="weekly")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import math
 import time
 import numpy as np
 from typing import Dict, Callable
@@ -9,7 +10,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pricing import monte_carlo_simulation, monte_carlo_pricing, simple_monte_carlo_pricing
 from pricing.payoffs import vanilla_call, vanilla_put, asian_payoff, barrier_knock_out
-from pricing.black_scholes import black_scholes_price
+from pricing.black_scholes import black_scholes_price, black_scholes_price_vectorized
+from pricing.binomial_tree import binomial_tree_price
+from pricing.parallel import parallel_monte_carlo_pricing
+from pricing.fused import NUMBA_AVAILABLE, fused_monte_carlo_pricing
 
 
 def benchmark_function(func: Callable, *args, num_runs: int = 5, **kwargs) -> Dict[str, float]:
@@ -125,6 +129,123 @@ def benchmark_vs_black_scholes():
     print(f"  Ratio de temps: {mc_stats['mean_time'] / bs_stats['mean_time']:.0f}x plus lent")
 
 
+def benchmark_black_scholes_chain():
+    """Compare la boucle scalaire et le pricer vectorisé sur une chaîne d'options."""
+    print("\n=== Benchmark Black-Scholes sur une chaîne d'options ===")
+
+    rng = np.random.default_rng(0)
+    num_quotes = 50000
+    K = rng.uniform(50, 150, num_quotes)
+    T = rng.uniform(0.05, 2.0, num_quotes)
+    sigma = rng.uniform(0.1, 0.5, num_quotes)
+    is_call = rng.random(num_quotes) < 0.5
+    out = np.empty(num_quotes)
+
+    loop_stats = benchmark_function(
+        lambda: [black_scholes_price(100, k, t, 0.05, s, "call" if c else "put")
+                 for k, t, s, c in zip(K, T, sigma, is_call)],
+        num_runs=1
+    )
+    vec_stats = benchmark_function(
+        black_scholes_price_vectorized, 100, K, T, 0.05, sigma, is_call, out=out
+    )
+
+    print(f"Boucle scalaire ({num_quotes:,} cotations): {loop_stats['mean_time']:.4f}s")
+    print(f"Vectorisé:                         {vec_stats['mean_time']:.6f}s "
+          f"({num_quotes / vec_stats['min_time'] / 1e6:.1f} M prix/s)")
+    print(f"Accélération: {loop_stats['mean_time'] / vec_stats['mean_time']:.0f}x")
+
+
+def _binomial_tree_price_loops(S, K, T, r, sigma, N, option_type="call"):
+    """Remontée de l'arbre en double boucle Python (implémentation historique, sans le triangle des prix)."""
+    dt = T / N
+    u = math.exp(sigma * math.sqrt(dt))
+    d = 1 / u
+    p = (math.exp(r * dt) - d) / (u - d)
+    option_values = [max(0, (S * u ** j * d ** (N - j) - K) if option_type == "call" else (K - S * u ** j * d ** (N - j)))
+                     for j in range(N + 1)]
+    for i in range(N - 1, -1, -1):
+        for j in range(i + 1):
+            option_values[j] = math.exp(-r * dt) * (p * option_values[j + 1] + (1 - p) * option_values[j])
+    return option_values[0]
+
+
+def benchmark_binomial_tree(max_loop_steps: int = 10000):
+    """
+    Compare la remontée vectorisée de l'arbre binomial aux boucles Python.
+
+    Au-delà de `max_loop_steps`, le temps des boucles (en O(N²)) est extrapolé.
+    """
+    print("\n=== Benchmark Arbre Binomial ===")
+
+    S, K, T, r, sigma = 100, 100, 1, 0.05, 0.2
+    loop_time, loop_steps = None, None
+
+    for N in [1000, 10000, 50000]:
+        vec_stats = benchmark_function(binomial_tree_price, S, K, T, r, sigma, N, "call", num_runs=1)
+
+        if N <= max_loop_steps:
+            loop_stats = benchmark_function(_binomial_tree_price_loops, S, K, T, r, sigma, N, "call", num_runs=1)
+            loop_time, loop_steps = loop_stats['mean_time'], N
+            label = ""
+        else:
+            loop_time = loop_time * (N / loop_steps) ** 2
+            loop_steps = N
+            label = " (extrapolé)"
+
+        print(f"N={N:>6,}: vectorisé {vec_stats['mean_time']:.4f}s | boucles {loop_time:.2f}s{label} "
+              f"| accélération {loop_time / vec_stats['mean_time']:.0f}x")
+
+
+def benchmark_parallel_scaling():
+    """Mesure le débit du pricing parallèle en fonction du nombre de processus."""
+    print("\n=== Benchmark Monte Carlo parallèle ===")
+
+    S, K, T, r, sigma = 100, 100, 0.25, 0.05, 0.2
+    num_sims, num_steps = 1000000, 252
+    max_workers = os.cpu_count() or 1
+    workers_list = sorted({1, 2, 4, 8, 16, 32, max_workers})
+
+    reference_time = None
+    for workers in [w for w in workers_list if w <= max_workers]:
+        stats = benchmark_function(
+            parallel_monte_carlo_pricing,
+            S, K, T, r, sigma, vanilla_call, num_sims, num_steps,
+            seed=42, num_workers=workers, num_runs=1
+        )
+        reference_time = reference_time or stats['mean_time']
+        print(f"{workers:>3} processus: {stats['mean_time']:.3f}s "
+              f"({num_sims / stats['mean_time'] / 1e6:.2f} M trajectoires/s, "
+              f"accélération {reference_time / stats['mean_time']:.1f}x)")
+
+
+def benchmark_fused_backend():
+    """Compare le noyau Numba fusionné au moteur NumPy (sans matrice de trajectoires)."""
+    print("\n=== Benchmark noyau fusionné Numba vs NumPy ===")
+
+    if not NUMBA_AVAILABLE:
+        print("numba non disponible : seul le moteur NumPy est utilisé")
+        return
+
+    S, K, T, r, sigma = 100, 100, 0.25, 0.05, 0.2
+    num_sims, num_steps = 200000, 252
+
+    # Compilation (et mise en cache) hors mesure
+    fused_monte_carlo_pricing(S, K, T, r, sigma, "asian", num_simulations=1024, num_steps=2, backend="numba")
+
+    for payoff_type in ["vanilla", "asian", "barrier"]:
+        timings = {}
+        for backend in ["numpy", "numba"]:
+            stats = benchmark_function(
+                fused_monte_carlo_pricing,
+                S, K, T, r, sigma, payoff_type, barrier=120, num_simulations=num_sims, num_steps=num_steps,
+                seed=42, backend=backend, num_runs=3
+            )
+            timings[backend] = stats['mean_time']
+        print(f"{payoff_type:>8}: NumPy {timings['numpy']:.3f}s, Numba {timings['numba']:.3f}s "
+              f"(accélération {timings['numpy'] / timings['numba']:.1f}x)")
+
+
 def memory_usage_test():
     """Teste l'utilisation mémoire pour différentes tailles de simulation."""
     print("\n=== Test d'utilisation mémoire ===")
@@ -161,6 +282,10 @@ if __name__ == "__main__":
     benchmark_monte_carlo_scaling()
     benchmark_payoff_functions()
     benchmark_vs_black_scholes()
+    benchmark_black_scholes_chain()
+    benchmark_binomial_tree()
+    benchmark_parallel_scaling()
+    benchmark_fused_backend()
     memory_usage_test()
     
     print("\n✅ Benchmarks terminés!")
\ No newline at end of file
@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+from functools import partial
+import numpy as np
+
+from pricing import PathSet, PathStore, chunked_monte_carlo_pricing, monte_carlo_pricing, monte_carlo_simulation
+from pricing import price_portfolio
+from pricing.black_scholes import black_scholes_price
+from pricing.payoffs import asian_payoff, barrier_knock_in, barrier_knock_out, vanilla_call, vanilla_put
+from pricing.portfolio import TRADE_DTYPE, trades_array
+
+
+class TestPortfolioPricing(unittest.TestCase):
+    """Tests du pricing de portefeuille par groupes de simulations."""
+
+    market = {"A": {"S": 100, "r": 0.05, "sigma": 0.2}, "B": {"S": 50, "r": 0.05, "sigma": 0.3}}
+
+    def test_grouping(self):
+        """Une simulation par (sous-jacent, maturité), quel que soit le nombre de trades."""
+        book = [
+            {"underlying": "A", "payoff_type": "vanilla", "K": K, "T": 1.0, "option_type": option_type}
+            for K in [90, 100, 110] for option_type in ["call", "put"]
+        ] + [
+            {"underlying": "A", "payoff_type": "asian", "K": 100, "T": 0.5},
+            {"underlying": "A", "payoff_type": "barrier", "K": 100, "T": 0.5, "barrier": 120},
+            {"underlying": "B", "payoff_type": "asian", "K": 50, "T": 0.5, "option_type": "put"},
+        ]
+        result = price_portfolio(book, self.market, num_simulations=4000, num_steps=12, seed=1)
+        self.assertEqual(result.shape, (9,))
+        self.assertEqual(len(np.unique(result["group"])), 3)
+        np.testing.assert_array_equal(result["group"], [0] * 6 + [1, 1, 2])
+        np.testing.assert_array_equal(result["trade_id"], [str(i) for i in range(9)])
+
+    def test_matches_single_trade_engines(self):
+        """Un groupe partage exactement les trajectoires des moteurs unitaires de même graine."""
+        book = [
+            {"trade_id": "call", "underlying": "A", "payoff_type": "vanilla", "K": 100, "T": 1.0},
+            {"trade_id": "ko", "underlying": "A", "payoff_type": "barrier", "K": 100, "T": 1.0, "barrier": 120},
+            {"trade_id": "ki", "underlying": "A", "payoff_type": "barrier", "K": 100, "T": 1.0, "barrier": 120,
+             "knock": "in"},
+            {"trade_id": "asian", "underlying": "A", "payoff_type": "asian", "K": 95, "T": 1.0,
+             "option_type": "put"},
+        ]
+        result = price_portfolio(book, self.market, num_simulations=5000, num_steps=24, seed=3,
+                                 max_memory_bytes=2 ** 18)
+        paths = PathSet(monte_carlo_simulation(100, 1.0, 0.05, 0.2, 5000, 24, seed=3))
+        expected = [
+            monte_carlo_pricing(paths, 100, 0.05, 1.0, payoff_sousjacent=vanilla_call),
+            monte_carlo_pricing(paths, 100, 0.05, 1.0, barrier_knock_out, vanilla_call, 120),
+            monte_carlo_pricing(paths, 100, 0.05, 1.0, barrier_knock_in, vanilla_call, 120),
+            monte_carlo_pricing(paths, 95, 0.05, 1.0, payoff_sousjacent=partial(asian_payoff, option_type="put")),
+        ]
+        np.testing.assert_allclose(result["price"], expected, rtol=1e-12)
+        self.assertAlmostEqual(result["price"][1] + result["price"][2], result["price"][0], places=10)
+
+    def test_vanilla_group_simulates_one_step(self):
+        book = [{"underlying": "B", "payoff_type": "vanilla", "K": 55, "T": 2.0, "option_type": "put"}]
+        result = price_portfolio(book, self.market, num_simulations=20000, seed=2)
+        expected = chunked_monte_carlo_pricing(50, 55, 2.0, 0.05, 0.3, vanilla_put, 20000, 252, seed=2)
+        self.assertAlmostEqual(result["price"][0], expected.price, places=10)
+        self.assertLess(abs(result["price"][0] - black_scholes_price(50, 55, 2.0, 0.05, 0.3, "put")),
+                        4 * result["std_error"][0])
+
+    def test_structured_array_input(self):
+        book = np.zeros(2, dtype=[("underlying", "U8"), ("payoff_type", "U8"), ("K", "f8"), ("T", "f8")])
+        book["underlying"] = ["A", "B"]
+        book["payoff_type"] = "vanilla"
+        book["K"] = [100, 50]
+        book["T"] = 1.0
+        trades = trades_array(book)
+        self.assertEqual(trades.dtype, TRADE_DTYPE)
+        self.assertEqual(list(trades["option_type"]), ["call", "call"])
+        self.assertEqual(list(trades["trade_id"]), ["0", "1"])
+        result = price_portfolio(book, self.market, num_simulations=2000, seed=1, antithetic=True)
+        self.assertTrue(np.all(result["price"] > 0))
+
+    def test_path_store(self):
+        book = [{"underlying": "A", "payoff_type": "asian", "K": 100, "T": 1.0}]
+        with tempfile.TemporaryDirectory() as directory:
+            store = PathStore(directory)
+            stored = price_portfolio(book, self.market, num_simulations=2000, num_steps=12, seed=4, path_store=store)
+            reused = price_portfolio(book, self.market, num_simulations=2000, num_steps=12, seed=4, path_store=store)
+        computed = price_portfolio(book, self.market, num_simulations=2000, num_steps=12, seed=4)
+        np.testing.assert_array_equal(stored, reused)
+        np.testing.assert_allclose(stored["price"], computed["price"], rtol=1e-12)
+
+    def test_invalid_books(self):
+        with self.assertRaises(ValueError):
+            price_portfolio([{"underlying": "C", "payoff_type": "vanilla", "K": 100, "T": 1}], self.market)
+        with self.assertRaises(ValueError):
+            price_portfolio([{"underlying": "A", "payoff_type": "digital", "K": 100, "T": 1}], self.market)
+        with self.assertRaises(ValueError):
+            price_portfolio([{"underlying": "A", "payoff_type": "barrier", "K": 100, "T": 1}], self.market)
+        with self.assertRaises(ValueError):
+            price_portfolio([{"underlying": "A", "payoff_type": "vanilla", "T": 1}], self.market)
+
+
+if __name__ == "__main__":
+    unittest.main()
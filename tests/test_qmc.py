@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+
+from pricing import monte_carlo_simulation, chunked_monte_carlo_pricing, qmc_monte_carlo_pricing
+from pricing.black_scholes import black_scholes_price
+from pricing.qmc import brownian_bridge_normals, sobol_normals
+from pricing.payoffs import vanilla_call, asian_payoff
+
+
+class TestBrownianBridge(unittest.TestCase):
+    """Tests de la construction par pont brownien."""
+
+    def test_increments_are_independent_normals(self):
+        """Le pont conserve la loi : incréments normaux indépendants de variance 1."""
+        for num_steps in [1, 2, 7, 16]:
+            Z = np.random.default_rng(num_steps).standard_normal((200000, num_steps))
+            increments = brownian_bridge_normals(Z)
+            covariance = np.atleast_2d(np.cov(increments.T))
+            np.testing.assert_allclose(covariance, np.eye(num_steps), atol=0.02)
+
+    def test_first_normal_sets_terminal_value(self):
+        """La première normale fixe seule W(T)."""
+        Z = np.random.default_rng(0).standard_normal((100, 12))
+        W_T = brownian_bridge_normals(Z).sum(axis=1)
+        np.testing.assert_allclose(W_T, np.sqrt(12) * Z[:, 0], atol=1e-12)
+
+
+class TestSobolSampler(unittest.TestCase):
+    """Tests de l'échantillonneur de Sobol brouillé."""
+
+    def test_reproducible(self):
+        np.testing.assert_array_equal(sobol_normals(256, 5, seed=3), sobol_normals(256, 5, seed=3))
+        self.assertFalse(np.array_equal(sobol_normals(256, 5, seed=3), sobol_normals(256, 5, seed=4)))
+
+    def test_simulation_sampler(self):
+        """`sampler="sobol"` donne des trajectoires GBM cohérentes."""
+        ST = monte_carlo_simulation(100, 1, 0.05, 0.2, 4096, 8, seed=1, sampler="sobol")
+        self.assertEqual(ST.shape, (4096, 8))
+        self.assertAlmostEqual(ST[:, -1].mean(), 100 * np.exp(0.05), delta=0.05)
+
+    def test_invalid_sampler(self):
+        with self.assertRaises(ValueError):
+            monte_carlo_simulation(100, 1, 0.05, 0.2, 1024, 8, sampler="halton")
+        with self.assertRaises(ValueError):
+            monte_carlo_simulation(100, 1, 0.05, 0.2, 1024, 8, sampler="sobol", antithetic=True)
+
+
+class TestQMCPricing(unittest.TestCase):
+    """Tests du pricing quasi-Monte Carlo par réplications randomisées."""
+
+    def test_converges_to_black_scholes(self):
+        result = qmc_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, 2 ** 14, 32, seed=5)
+        bs = black_scholes_price(100, 100, 1, 0.05, 0.2)
+        self.assertLess(abs(result.price - bs), 4 * result.std_error)
+        self.assertEqual(result.num_paths, 2 ** 14)
+
+    def test_error_reduction(self):
+        """Pour un payoff régulier, l'erreur est au moins 10 fois plus faible qu'en pseudo-aléatoire."""
+        for payoff in [vanilla_call, asian_payoff]:
+            qmc = qmc_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, payoff, 2 ** 14, 32, seed=1)
+            pseudo = chunked_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, payoff, 2 ** 14, 32, seed=1)
+            self.assertLess(10 * qmc.std_error, pseudo.std_error)
+            self.assertLess(abs(qmc.price - pseudo.price), 4 * pseudo.std_error)
+
+    def test_invalid_replications(self):
+        with self.assertRaises(ValueError):
+            qmc_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, 1024, 8, num_replications=1)
+        with self.assertRaises(ValueError):
+            qmc_monte_carlo_pricing(100, 100, 1, 0.05, 0.2, vanilla_call, 1000, 8, num_replications=16)
+
+
+if __name__ == "__main__":
+    unittest.main()
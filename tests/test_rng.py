@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+
+from pricing import monte_carlo_simulation, monte_carlo_path_range
+from pricing.rng import PATHS_PER_STREAM, StepNormals, standard_normals
+
+
+class TestCounterBasedStreams(unittest.TestCase):
+    """Tests des flux Philox à compteur et de l'accès direct aux trajectoires."""
+
+    def test_any_range_matches_full_draw(self):
+        """Une plage tirée seule égale la même plage du tirage complet."""
+        full = standard_normals(42, 0, 5000, 12)
+        for start, stop in [(0, 1), (1000, 1030), (1023, 1025), (2500, 5000)]:
+            np.testing.assert_array_equal(standard_normals(42, start, stop, 12), full[start:stop])
+
+    def test_step_normals_match_columns(self):
+        """Le tirage pas à pas redonne les colonnes de la matrice de normales."""
+        full = standard_normals(3, 100, 2100, 5)
+        steps = StepNormals(3, 100, 2100)
+        column = np.empty(2000)
+        for t in range(5):
+            np.testing.assert_array_equal(steps.next(column), full[:, t])
+
+    def test_path_range(self):
+        """Régénérer les trajectoires [a, b) sans simuler les autres."""
+        ST = monte_carlo_simulation(100, 1, 0.05, 0.2, 3 * PATHS_PER_STREAM, 20, seed=8)
+        np.testing.assert_array_equal(monte_carlo_path_range(100, 1, 0.05, 0.2, 20, 1500, 1510, seed=8),
+                                      ST[1500:1510])
+
+    def test_global_random_state_untouched(self):
+        """La simulation ne modifie pas l'état aléatoire global de NumPy."""
+        np.random.seed(0)
+        expected = np.random.standard_normal(3)
+        np.random.seed(0)
+        monte_carlo_simulation(100, 1, 0.05, 0.2, 100, 10, seed=1)
+        np.testing.assert_array_equal(np.random.standard_normal(3), expected)
+
+    def test_seeds_and_moments(self):
+        """Graines différentes → tirages différents ; moments d'une loi normale."""
+        a = standard_normals(1, 0, 4096, 50)
+        b = standard_normals(2, 0, 4096, 50)
+        self.assertFalse(np.array_equal(a, b))
+        self.assertAlmostEqual(float(np.mean(a)), 0.0, places=2)
+        self.assertAlmostEqual(float(np.std(a)), 1.0, places=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
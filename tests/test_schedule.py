@@ -0,0 +1,99 @@
+import pickle
+import unittest
+from functools import partial
+
+import numpy as np
+
+from pricing import black_scholes_price, monte_carlo_simulation, chunked_monte_carlo_pricing, simple_monte_carlo_pricing
+from pricing.parallel import parallel_monte_carlo_pricing
+from pricing.schedule import ObservationSchedule, payoff_schedule, with_schedule, observation_dates
+from pricing.payoffs import vanilla_call, asian_payoff, barrier_knock_out, lookback_payoff
+
+
+class TestObservationSchedule(unittest.TestCase):
+    """Tests des calendriers d'observation déclarés par les payoffs."""
+
+    def test_builtin_declarations(self):
+        self.assertEqual(payoff_schedule(vanilla_call).kind, "terminal")
+        self.assertEqual(payoff_schedule(asian_payoff).kind, "fixings")
+        self.assertEqual(payoff_schedule(barrier_knock_out).kind, "monitoring")
+        self.assertEqual(payoff_schedule(partial(lookback_payoff, option_type="put")).kind, "monitoring")
+        # Sans déclaration : f(ST, K) est terminal, les autres reçoivent la trajectoire complète
+        self.assertEqual(payoff_schedule(lambda ST, K: np.maximum(ST - K, 0)).kind, "terminal")
+        self.assertIsNone(observation_dates(lambda ST, K, option_type: ST[:, -1] - K, 1.0, 252))
+
+    def test_dates(self):
+        np.testing.assert_allclose(observation_dates(vanilla_call, 2.0, 252), [2.0])
+        monthly = with_schedule(asian_payoff, ObservationSchedule.fixings(num_dates=12))
+        np.testing.assert_allclose(observation_dates(monthly, 1.0, 252), np.arange(1, 13) / 12)
+        self.assertIsNone(observation_dates(asian_payoff, 1.0, 252))
+
+    def test_invalid_schedule(self):
+        with self.assertRaises(ValueError):
+            ObservationSchedule.fixings(dates=[0.5, 0.25])
+        with self.assertRaises(ValueError):
+            ObservationSchedule.monitoring(dates=[0.5, 1.5])
+        with self.assertRaises(ValueError):
+            ObservationSchedule("weekly")
+
+    def test_scheduled_payoff_is_picklable(self):
+        monthly = with_schedule(asian_payoff, ObservationSchedule.fixings(num_dates=12))
+        restored = pickle.loads(pickle.dumps(monthly))
+        self.assertEqual(restored.schedule, monthly.schedule)
+        self.assertEqual(restored.__name__, "asian_payoff")
+
+
+class TestScheduledSimulation(unittest.TestCase):
+    """Tests de la simulation restreinte aux dates observées."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.S, cls.K, cls.T, cls.r, cls.sigma = 100, 100, 1, 0.05, 0.2
+
+    def test_vanilla_single_step(self):
+        """Une vanille est simulée en un seul saut exact, quel que soit num_steps."""
+        price = simple_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, vanilla_call, 10000, 252,
+                                           seed=1)
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 10000, 1, seed=1)
+        self.assertAlmostEqual(price, np.exp(-self.r * self.T) * vanilla_call(ST[:, -1], self.K).mean(), places=12)
+
+    def test_undeclared_terminal_payoff(self):
+        """Un payoff f(ST, K) sans déclaration reçoit la valeur finale dans tous les moteurs."""
+        call = lambda ST, K: np.maximum(ST - K, 0)
+        expected = black_scholes_price(self.S, self.K, self.T, self.r, self.sigma, "call")
+        for result in [
+            simple_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, call, 20000, 252, seed=1),
+            chunked_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, call, 20000, 252, seed=1,
+                                        max_memory_bytes=2 ** 20),
+        ]:
+            price = getattr(result, "price", result)
+            self.assertAlmostEqual(price, expected, delta=0.25)
+
+    def test_monthly_asian(self):
+        """Une asiatique mensuelle simule 12 colonnes, dans tous les moteurs."""
+        monthly = with_schedule(asian_payoff, ObservationSchedule.fixings(num_dates=12))
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 20000, 12, seed=2)
+        expected = np.exp(-self.r * self.T) * asian_payoff(ST, self.K).mean()
+        for result in [
+            simple_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, monthly, 20000, 252, seed=2),
+            chunked_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, monthly, 20000, 252, seed=2,
+                                        max_memory_bytes=2 ** 20).price,
+            parallel_monte_carlo_pricing(self.S, self.K, self.T, self.r, self.sigma, monthly, 20000, 252, seed=2,
+                                         num_workers=2, block_size=4096).price,
+        ]:
+            self.assertAlmostEqual(result, expected, places=10)
+
+    def test_exact_jumps_to_irregular_dates(self):
+        """Sauts exacts vers des dates irrégulières : E[S_t] = S e^(rt) à chaque date."""
+        dates = [0.1, 0.25, 0.9]
+        ST = monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 200000, 252, seed=3, dates=dates)
+        self.assertEqual(ST.shape, (200000, 3))
+        log_returns = np.diff(np.log(np.hstack([np.full((200000, 1), self.S), ST])), axis=1)
+        np.testing.assert_allclose(log_returns.var(axis=0), self.sigma ** 2 * np.diff(dates, prepend=0), rtol=0.02)
+        np.testing.assert_allclose(ST.mean(axis=0), self.S * np.exp(self.r * np.array(dates)), rtol=2e-3)
+        with self.assertRaises(ValueError):
+            monte_carlo_simulation(self.S, self.T, self.r, self.sigma, 10, 252, dates=[0.5, 1.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
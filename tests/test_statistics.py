@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+
+from pricing.statistics import RunningStats, MonteCarloResult
+
+
+class TestRunningStats(unittest.TestCase):
+    """Tests de l'accumulateur de moyenne et variance par blocs."""
+
+    def setUp(self):
+        self.values = np.random.default_rng(0).normal(5.0, 2.0, size=10001)
+
+    def test_blocks_match_numpy(self):
+        """Moyenne et variance par blocs égales au calcul direct."""
+        stats = RunningStats()
+        for block in np.array_split(self.values, 7):
+            stats.update(block)
+        self.assertEqual(stats.count, self.values.size)
+        self.assertAlmostEqual(stats.mean, np.mean(self.values), places=12)
+        self.assertAlmostEqual(stats.variance, np.var(self.values, ddof=1), places=10)
+        self.assertAlmostEqual(stats.std_error, np.std(self.values, ddof=1) / np.sqrt(self.values.size), places=12)
+
+    def test_merge(self):
+        """La fusion de deux accumulateurs équivaut à un seul accumulateur."""
+        left = RunningStats().update(self.values[:3000])
+        right = RunningStats().update(self.values[3000:])
+        merged = RunningStats().merge(left).merge(right)
+        self.assertAlmostEqual(merged.mean, np.mean(self.values), places=12)
+        self.assertAlmostEqual(merged.variance, np.var(self.values, ddof=1), places=10)
+
+    def test_empty(self):
+        """Un accumulateur vide n'a pas d'erreur standard."""
+        self.assertTrue(np.isnan(RunningStats().std_error))
+
+
+class TestMonteCarloResult(unittest.TestCase):
+    """Tests du résultat Monte Carlo."""
+
+    def test_confidence_interval(self):
+        result = MonteCarloResult(price=10.0, std_error=0.5, num_paths=1000)
+        low, high = result.confidence_interval()
+        self.assertAlmostEqual(low, 10.0 - 1.959964 * 0.5, places=5)
+        self.assertAlmostEqual(high, 10.0 + 1.959964 * 0.5, places=5)
+        low, high = result.confidence_interval(0.99)
+        self.assertAlmostEqual(high - low, 2 * 2.575829 * 0.5, places=5)
+        with self.assertRaises(ValueError):
+            result.confidence_interval(1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
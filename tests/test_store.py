@@ -0,0 +1,82 @@
+import json
+import tempfile
+import unittest
+import numpy as np
+
+from pricing import PathSet, PathStore, monte_carlo_pricing, monte_carlo_simulation
+from pricing.payoffs import asian_payoff
+
+
+class TestPathStore(unittest.TestCase):
+    """Tests du stockage des trajectoires sur disque."""
+
+    PARAMS = dict(S=100, T=1, r=0.05, sigma=0.2, num_simulations=3000, num_steps=12, seed=7)
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = PathStore(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_stored_paths_match_simulation(self):
+        ST = self.store.simulate(**self.PARAMS, max_memory_bytes=2 ** 17)
+        np.testing.assert_array_equal(ST, monte_carlo_simulation(100, 1, 0.05, 0.2, 3000, 12, seed=7))
+
+    def test_load_is_read_only_memmap(self):
+        self.assertIsNone(self.store.load(**self.PARAMS))
+        self.store.simulate(**self.PARAMS)
+        ST = self.store.load(**self.PARAMS)
+        self.assertIsInstance(ST, np.memmap)
+        self.assertFalse(ST.flags.writeable)
+        with self.assertRaises(ValueError):
+            ST[0, 0] = 0.0
+
+    def test_pathset_does_not_copy(self):
+        ST = self.store.load_or_simulate(**self.PARAMS)
+        paths = PathSet(ST)
+        self.assertTrue(np.shares_memory(np.asarray(paths), ST))
+        expected = monte_carlo_pricing(PathSet(monte_carlo_simulation(100, 1, 0.05, 0.2, 3000, 12, seed=7)),
+                                       100, 0.05, 1, payoff_sousjacent=asian_payoff)
+        self.assertEqual(monte_carlo_pricing(paths, 100, 0.05, 1, payoff_sousjacent=asian_payoff), expected)
+
+    def test_parameters_must_match(self):
+        self.store.simulate(**self.PARAMS)
+        for change in [dict(seed=8), dict(sigma=0.25), dict(num_simulations=2000), dict(antithetic=True),
+                       dict(dtype=np.float32), dict(dates=[0.5, 1.0])]:
+            with self.subTest(change=change):
+                self.assertIsNone(self.store.load(**{**self.PARAMS, **change}))
+
+    def test_header_describes_simulation(self):
+        self.store.simulate(**self.PARAMS, dtype=np.float32)
+        (header_file,) = list(self.store.directory.glob("*.json"))
+        with open(header_file, encoding="utf-8") as f:
+            header = json.load(f)
+        self.assertEqual(header["shape"], [3000, 12])
+        self.assertEqual(np.dtype(header["dtype"]), np.float32)
+        self.assertEqual(header["seed"], 7)
+        self.assertEqual(header["rng"], "philox")
+        self.assertEqual(list(self.store.directory.glob("*.tmp")), [])
+
+    def test_tampered_header_is_ignored(self):
+        self.store.simulate(**self.PARAMS)
+        (header_file,) = list(self.store.directory.glob("*.json"))
+        with open(header_file, encoding="utf-8") as f:
+            header = json.load(f)
+        header["sigma"] = 0.3
+        with open(header_file, "w", encoding="utf-8") as f:
+            json.dump(header, f)
+        self.assertIsNone(self.store.load(**self.PARAMS))
+
+    def test_sobol_paths(self):
+        ST = self.store.load_or_simulate(**{**self.PARAMS, "num_simulations": 1024}, sampler="sobol")
+        np.testing.assert_array_equal(ST, monte_carlo_simulation(100, 1, 0.05, 0.2, 1024, 12, seed=7,
+                                                                 sampler="sobol"))
+
+    def test_seed_required(self):
+        with self.assertRaises(ValueError):
+            self.store.load_or_simulate(**{**self.PARAMS, "seed": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import tracemalloc
+import unittest
+import numpy as np
+
+from pricing import SimulationWorkspace, monte_carlo_simulation, simple_monte_carlo_pricing
+from pricing.payoffs import asian_payoff
+
+
+class TestSimulationWorkspace(unittest.TestCase):
+    """Tests des buffers de simulation réutilisables."""
+
+    def test_same_paths_as_fresh_allocation(self):
+        workspace = SimulationWorkspace()
+        for antithetic in [False, True]:
+            expected = monte_carlo_simulation(100, 1, 0.05, 0.2, 3000, 12, seed=5, antithetic=antithetic)
+            ST = monte_carlo_simulation(100, 1, 0.05, 0.2, 3000, 12, seed=5, antithetic=antithetic,
+                                        workspace=workspace)
+            np.testing.assert_array_equal(ST, expected)
+
+    def test_result_is_view_of_workspace(self):
+        workspace = SimulationWorkspace()
+        first = monte_carlo_simulation(100, 1, 0.05, 0.2, 2000, 12, seed=1, workspace=workspace)
+        second = monte_carlo_simulation(100, 1, 0.05, 0.2, 2000, 12, seed=2, workspace=workspace)
+        self.assertTrue(np.shares_memory(first, second))
+
+    def test_no_allocation_on_repeat_calls(self):
+        """À forme identique, les appels suivants n'allouent ni buffer ni tableau de normales."""
+        workspace = SimulationWorkspace()
+        monte_carlo_simulation(100, 1, 0.05, 0.2, 20000, 50, seed=0, workspace=workspace)
+        num_allocations = workspace.num_allocations
+
+        tracemalloc.start()
+        for seed in range(1, 4):
+            monte_carlo_simulation(100, 1, 0.05, 0.2, 20000, 50, seed=seed, workspace=workspace)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(workspace.num_allocations, num_allocations)
+        self.assertLess(peak, workspace.nbytes // 100)
+
+    def test_smaller_shape_reuses_buffers(self):
+        workspace = SimulationWorkspace()
+        monte_carlo_simulation(100, 1, 0.05, 0.2, 4000, 20, seed=0, workspace=workspace)
+        num_allocations = workspace.num_allocations
+        ST = monte_carlo_simulation(100, 1, 0.05, 0.2, 1000, 12, seed=0, workspace=workspace)
+        self.assertEqual(workspace.num_allocations, num_allocations)
+        np.testing.assert_array_equal(ST, monte_carlo_simulation(100, 1, 0.05, 0.2, 1000, 12, seed=0))
+
+    def test_pricing_with_workspace(self):
+        workspace = SimulationWorkspace()
+        for spot in [95, 100, 105]:
+            price = simple_monte_carlo_pricing(spot, 100, 1, 0.05, 0.2, asian_payoff, 5000, 12, seed=3,
+                                               workspace=workspace)
+            self.assertEqual(price, simple_monte_carlo_pricing(spot, 100, 1, 0.05, 0.2, asian_payoff, 5000, 12,
+                                                               seed=3))
+
+
+if __name__ == "__main__":
+    unittest.main()